@@ -0,0 +1,79 @@
+# index_manager.py
+import logging
+from typing import Dict, Any, List
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+from app.Database.mongo_client import MongoClient
+
+logger = logging.getLogger(__name__)
+
+# Managed indexes on `rss_news`: name -> (keys, options).
+# Equality fields come first and the (published, _id) sort last, so the
+# newest-first queries in RSSRepository read the index in order with no
+# in-memory sort.
+NEWS_INDEXES: Dict[str, Any] = {
+    "source_quality_published": (
+        [("source", ASCENDING), ("quality_flag", ASCENDING), ("published", DESCENDING), ("_id", DESCENDING)],
+        {},
+    ),
+    "sentiment_published": (
+        [("sentiment", ASCENDING), ("published", DESCENDING), ("_id", DESCENDING)],
+        {},
+    ),
+    # Change-time lookups for the incremental Weaviate sync
+    "updated_at": (
+        [("updated_at", ASCENDING)],
+        {},
+    ),
+    "created_at": (
+        [("created_at", ASCENDING)],
+        {},
+    ),
+    "link_unique": (
+        [("link", ASCENDING)],
+        {"unique": True},
+    ),
+}
+
+
+class NewsIndexManager:
+    """
+    Creates and reports the managed MongoDB indexes for `rss_news`.
+
+    Called at startup; creating an index that already exists is a no-op.
+    """
+
+    def __init__(self, mongo_client: MongoClient = None, collection_name: str = "rss_news"):
+        self.mongo_client = mongo_client or MongoClient()
+        self.collection_name = collection_name
+
+    @property
+    def collection(self):
+        return self.mongo_client.get_db[self.collection_name]
+
+    async def ensure_indexes(self) -> List[str]:
+        """
+        Create any missing managed index.
+
+        Returns:
+            Names of the indexes that are in place
+        """
+        ready = []
+        for name, (keys, options) in NEWS_INDEXES.items():
+            try:
+                await self.collection.create_index(keys, name=name, **options)
+                ready.append(name)
+            except OperationFailure as e:
+                # Usually duplicate links from before upserts keyed on link
+                logger.warning(f"[INDEX] Could not create '{name}' on {self.collection_name}: {e}")
+        logger.info(f"[INDEX] {self.collection_name} indexes ready: {', '.join(ready)}")
+        return ready
+
+    async def report(self) -> Dict[str, Any]:
+        """Existing indexes on the collection and which managed ones are missing."""
+        existing = await self.collection.index_information()
+        return {
+            "collection": self.collection_name,
+            "indexes": {name: info["key"] for name, info in existing.items()},
+            "missing": [name for name in NEWS_INDEXES if name not in existing],
+        }
@@ -1,4 +1,5 @@
-from app.Database.mongo_client import MongoClient
+from app.Database.mongo_client import MongoClient, TRANSACTIONAL
+from typing import AsyncIterator, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,27 +16,75 @@ class BaseRepository:
         if self.mongo_client._client is None:
             await self.mongo_client.connect()
     
-    async def _get_collection(self):
-        """Get the collection for this repository."""
+    async def _get_collection(self, workload: str = TRANSACTIONAL):
+        """
+        Get the collection for this repository.
+
+        Methods pass ANALYTIC for aggregations and scans that may read from a
+        replica-set secondary; writes and read-your-writes lookups keep the default.
+        """
         await self._ensure_connected()
-        return self.mongo_client.get_db[self.collection_name]
+        return self.mongo_client.database(workload)[self.collection_name]
 
     async def find_all(self, limit: int = 1000) -> list:
         """Get all documents in the collection with optional limit."""
-        collection = await self._get_collection()
-        cursor = collection.find().limit(limit)
-        docs = await cursor.to_list(length=limit)
-        for doc in docs:
-            if "_id" in doc:
-                doc["_id"] = str(doc["_id"])
-        return docs
-
-
-
+        return [doc async for doc in self.iter_documents(limit=limit)]
 
+    async def iter_documents(
+        self,
+        filter_dict: dict = None,
+        projection: dict = None,
+        batch_size: int = 500,
+        sort: list = None,
+        limit: int = 0,
+        workload: str = TRANSACTIONAL,
+        string_ids: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream matching documents without loading the result set into memory.
 
+        Args:
+            filter_dict: MongoDB filter (all documents if omitted)
+            projection: Fields to return
+            batch_size: Documents fetched per round trip to the server
+            sort: Optional sort spec, e.g. [("published", -1)]
+            limit: Stop after this many documents (0 = no limit)
+            workload: TRANSACTIONAL, or ANALYTIC for bulk scans that may read from a secondary
+            string_ids: Convert `_id` to str like `find_all` (keep False to write back by _id)
+        """
+        collection = await self._get_collection(workload)
+        cursor = collection.find(filter_dict or {}, projection).batch_size(batch_size)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
 
-    
-
-
+        try:
+            async for doc in cursor:
+                if string_ids and "_id" in doc:
+                    doc["_id"] = str(doc["_id"])
+                yield doc
+        finally:
+            # Release the server-side cursor if the consumer stops early
+            await cursor.close()
 
+    async def iter_batches(
+        self,
+        filter_dict: dict = None,
+        projection: dict = None,
+        batch_size: int = 500,
+        sort: list = None,
+        workload: str = TRANSACTIONAL,
+        string_ids: bool = True,
+    ) -> AsyncIterator[List[dict]]:
+        """Stream matching documents as lists of up to `batch_size` (for bulk writes downstream)."""
+        batch = []
+        async for doc in self.iter_documents(
+            filter_dict, projection, batch_size, sort, workload=workload, string_ids=string_ids
+        ):
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
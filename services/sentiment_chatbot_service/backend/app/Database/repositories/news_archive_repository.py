@@ -0,0 +1,167 @@
+import os
+import zlib
+import logging
+from datetime import datetime
+from typing import Optional, List
+from bson import ObjectId
+from pymongo import TEXT, ReplaceOne, DESCENDING
+from pymongo.errors import CollectionInvalid, OperationFailure
+from app.Database.mongo_client import MongoClient
+from app.Database.repositories.base_repo import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_COLLECTION = "rss_news_archive"
+
+# Articles published more than this many days ago belong in the archive (0 disables tiering)
+HOT_TIER_DAYS = int(os.getenv("NEWS_HOT_TIER_DAYS", "180"))
+
+# Long text fields stored zlib-compressed; title and summary stay plain for search
+COMPRESSED_FIELDS = ("content", "clean_text")
+COMPRESSION_LEVEL = int(os.getenv("NEWS_ARCHIVE_COMPRESSION_LEVEL", "6"))
+
+# Text search on the archive covers the uncompressed fields only
+ARCHIVE_TEXT_INDEX_NAME = "news_archive_text"
+ARCHIVE_TEXT_INDEX_WEIGHTS = {"title": 10, "summary": 5}
+PLAIN_TEXT_FIELDS = ("title", "summary")
+
+
+def compress_article(article: dict) -> dict:
+    """Copy of `article` with its long text fields compressed."""
+    archived = dict(article)
+    for field in COMPRESSED_FIELDS:
+        value = archived.get(field)
+        if isinstance(value, str):
+            archived[field] = zlib.compress(value.encode("utf-8"), COMPRESSION_LEVEL)
+    return archived
+
+
+def archive_query(query: dict) -> dict:
+    """
+    Rewrite a hot-tier query for the archive.
+
+    Compressed fields hold zlib bytes that no $regex can match, so conditions
+    on them are applied to the plain title and summary instead.
+    """
+    if isinstance(query, list):
+        return [archive_query(clause) for clause in query]
+    if not isinstance(query, dict):
+        return query
+    plain, clauses = {}, []
+    for key, value in query.items():
+        if key in COMPRESSED_FIELDS:
+            clauses.append({"$or": [{field: value} for field in PLAIN_TEXT_FIELDS]})
+        elif key in ("$and", "$or", "$nor"):
+            plain[key] = archive_query(value)
+        else:
+            plain[key] = value
+    if not clauses:
+        return plain
+    if not plain and len(clauses) == 1:
+        return clauses[0]
+    return {"$and": ([plain] if plain else []) + clauses}
+
+
+def decompress_article(article: dict) -> dict:
+    """Restore compressed text fields in place so archived articles look like hot ones."""
+    for field in COMPRESSED_FIELDS:
+        value = article.get(field)
+        if isinstance(value, bytes):
+            article[field] = zlib.decompress(value).decode("utf-8")
+    return article
+
+
+class NewsArchiveRepository(BaseRepository):
+    """
+    Cold tier for `rss_news`: aged articles moved out of the hot collection.
+
+    Documents keep their `_id`, so Weaviate objects and rollup top articles
+    still resolve. The collection uses zstd block compression and the long
+    text fields are additionally compressed per document.
+    """
+
+    def __init__(self, mongo_client: MongoClient = None):
+        super().__init__(mongo_client, collection_name=ARCHIVE_COLLECTION)
+
+    # ------------------------------
+    # SETUP
+    # ------------------------------
+    async def ensure_collection(self):
+        """Create the archive with zstd block compression, plus its text index."""
+        await self._ensure_connected()
+        db = self.mongo_client.get_db
+        try:
+            await db.create_collection(
+                ARCHIVE_COLLECTION,
+                storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}}
+            )
+            logger.info(f"[ARCHIVE] Created {ARCHIVE_COLLECTION} with zstd block compression")
+        except CollectionInvalid:
+            pass  # already exists
+
+        collection = await self._get_collection()
+        try:
+            await collection.create_index(
+                [(field, TEXT) for field in ARCHIVE_TEXT_INDEX_WEIGHTS],
+                weights=ARCHIVE_TEXT_INDEX_WEIGHTS,
+                name=ARCHIVE_TEXT_INDEX_NAME,
+                default_language="english"
+            )
+        except OperationFailure as e:
+            logger.warning(f"[ARCHIVE] Could not create archive text index: {e}")
+
+    # ------------------------------
+    # WRITES
+    # ------------------------------
+    async def archive_batch(self, articles: List[dict]) -> int:
+        """Upsert articles (with ObjectId `_id`) into the archive, keyed on `_id`."""
+        if not articles:
+            return 0
+        now = datetime.utcnow()
+        ops = [
+            ReplaceOne({"_id": article["_id"]}, {**compress_article(article), "archived_at": now}, upsert=True)
+            for article in articles
+        ]
+        collection = await self._get_collection()
+        await collection.bulk_write(ops, ordered=False)
+        return len(ops)
+
+    # ------------------------------
+    # READS
+    # ------------------------------
+    async def newest_published(self) -> Optional[datetime]:
+        """Latest `published` in the archive (None when the archive is empty)."""
+        collection = await self._get_collection()
+        doc = await collection.find_one({}, {"published": 1}, sort=[("published", DESCENDING)])
+        return doc.get("published") if doc else None
+
+    async def find_newest(self, query: dict, projection: dict = None, limit: int = 20) -> List[dict]:
+        """Archived articles matching a hot-tier `query`, newest first (same order as the hot tier)."""
+        collection = await self._get_collection()
+        cursor = collection.find(archive_query(query), projection).sort([("published", -1), ("_id", -1)]).limit(limit)
+        return [self._to_article(doc) async for doc in cursor]
+
+    async def search_text(self, query: dict, projection: dict, limit: int) -> List[dict]:
+        """Archived articles matching a `$text` query, best matches first."""
+        collection = await self._get_collection()
+        cursor = collection.find(query, projection).sort(
+            [("text_score", {"$meta": "textScore"}), ("published", -1)]
+        ).limit(limit)
+        return [self._to_article(doc) async for doc in cursor]
+
+    async def get_by_ids(self, item_ids: list, projection: dict = None) -> List[dict]:
+        object_ids = [ObjectId(i) for i in item_ids if ObjectId.is_valid(str(i))]
+        if not object_ids:
+            return []
+        collection = await self._get_collection()
+        return [self._to_article(doc) async for doc in collection.find({"_id": {"$in": object_ids}}, projection)]
+
+    async def exists(self, link: str) -> bool:
+        collection = await self._get_collection()
+        return await collection.find_one({"link": link}, {"_id": 1}) is not None
+
+    @staticmethod
+    def _to_article(doc: dict) -> dict:
+        doc["_id"] = str(doc["_id"])
+        doc.pop("archived_at", None)
+        return decompress_article(doc)
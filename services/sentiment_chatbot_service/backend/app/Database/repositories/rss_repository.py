@@ -1,9 +1,51 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
+from bson import ObjectId
+from pymongo import TEXT, ReturnDocument
+from pymongo.errors import OperationFailure
 from app.Database.mongo_client import MongoClient
+from app.Database.repositories.base_repo import BaseRepository
+from app.Database.repositories.sentiment_rollup_repository import SentimentRollupRepository
+from app.Database.repositories.news_archive_repository import NewsArchiveRepository, HOT_TIER_DAYS
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Placeholder/test articles that must never be served
+FAKE_TITLES = [
+    'Bitcoin Surges Past Record High',
+    'Breaking News',
+    'Tech Innovation',
+    'Real-time Test',
+    'Innovation in AI'
+]
+
+# The only source served to users (normalized host, see `source_from_link`)
+NEWS_SOURCE = "economynext.com"
+
+
+def classify_quality(article: dict) -> str:
+    """Ingest-time quality flag: 'test' for known placeholder articles, 'ok' otherwise."""
+    return "test" if article.get("title") in FAKE_TITLES else "ok"
+
+
+# Weighted full-text index: title matches rank above summary, summary above body text
+TEXT_INDEX_NAME = "news_text"
+TEXT_INDEX_WEIGHTS = {"title": 10, "summary": 5, "clean_text": 1}
+
+class RSSRepository(BaseRepository):
+    # Set once the text index is known to exist; until then searches use $regex
+    text_index_ready = False
+    # Set once every article has `source`/`quality_flag`; until then queries use the link regex
+    source_fields_ready = False
+    # Newest `published` in the archive tier; None while the archive is empty
+    archived_through = None
 
-class RSSRepository:
     def __init__(self):
         mongo = MongoClient()  # Singleton instance
+        super().__init__(mongo, collection_name="rss_news")
+        self.rollups = SentimentRollupRepository(mongo)
+        self.archive = NewsArchiveRepository(mongo)
         try:
             self.db = mongo.get_db
             self.collection = self.db["rss_news"]
@@ -19,63 +61,223 @@ class RSSRepository:
             self.db = mongo.get_db
             self.collection = self.db["rss_news"]
 
+    # ------------------------------
+    # TEXT INDEX
+    # ------------------------------
+    async def ensure_text_index(self):
+        """Create the weighted text index used by `search_text`."""
+        self._ensure_collection()
+        try:
+            await self.collection.create_index(
+                [(field, TEXT) for field in TEXT_INDEX_WEIGHTS],
+                weights=TEXT_INDEX_WEIGHTS,
+                name=TEXT_INDEX_NAME,
+                default_language="english"
+            )
+        except OperationFailure as e:
+            # A collection can only hold one text index; reuse an existing one
+            indexes = await self.collection.index_information()
+            if not any(any(kind == TEXT for _, kind in info["key"]) for info in indexes.values()):
+                raise
+            logger.warning(f"[RSS_REPO] Using existing text index instead of '{TEXT_INDEX_NAME}': {e}")
+        RSSRepository.text_index_ready = True
+        logger.info("[RSS_REPO] Text index ready")
+
+    # ------------------------------
+    # SERVED ARTICLES
+    # ------------------------------
+    @staticmethod
+    def is_servable(article: dict) -> bool:
+        """In-memory counterpart of `serving_filter` for an article dict."""
+        if article.get("title") in FAKE_TITLES:
+            return False
+        if "source" in article and "quality_flag" in article:
+            return article["source"] == NEWS_SOURCE and article["quality_flag"] == "ok"
+        return "economynext.com" in (article.get("link") or "")
+
+    async def check_source_fields(self) -> bool:
+        """Enable the indexed source/quality filter if no article is missing the ingest-time fields."""
+        self._ensure_collection()
+        missing = await self.collection.count_documents(
+            {"$or": [{"source": {"$exists": False}}, {"quality_flag": {"$exists": False}}]}, limit=1
+        )
+        RSSRepository.source_fields_ready = missing == 0
+        if not missing:
+            logger.info("[RSS_REPO] Source fields present, using indexed source filter")
+        else:
+            logger.warning("[RSS_REPO] Articles without source/quality_flag; run migrate_news_source_fields.py")
+        return RSSRepository.source_fields_ready
+
+    def serving_filter(self) -> dict:
+        """Articles that may be shown to users (real economynext articles, no placeholders)."""
+        if self.source_fields_ready:
+            return {"source": NEWS_SOURCE, "quality_flag": "ok"}
+        return {
+            "title": {"$nin": FAKE_TITLES},
+            "link": {"$regex": "economynext.com"}  # Only economynext articles
+        }
+
+    @staticmethod
+    def changed_since_filter(since: datetime) -> dict:
+        """Articles saved at or after `since` (`created_at` for documents written before `updated_at` existed)."""
+        return {"$or": [
+            {"updated_at": {"$gte": since}},
+            {"updated_at": {"$exists": False}, "created_at": {"$gte": since}}
+        ]}
+
+    def text_filter(self, text: str) -> dict:
+        """Match articles containing `text`: $text when indexed, case-insensitive $regex otherwise."""
+        if self.text_index_ready:
+            return {"$text": {"$search": text}}
+        return {"$or": [
+            {"title": {"$regex": text, "$options": "i"}},
+            {"content": {"$regex": text, "$options": "i"}}
+        ]}
+
+    # ------------------------------
+    # HOT/COLD TIERS
+    # ------------------------------
+    async def check_archive(self) -> Optional[datetime]:
+        """Load how far the archive tier reaches; queries only fan out to it once it holds articles."""
+        RSSRepository.archived_through = await self.archive.newest_published()
+        if RSSRepository.archived_through:
+            logger.info(f"[RSS_REPO] Archive holds articles published up to {RSSRepository.archived_through}")
+        return RSSRepository.archived_through
+
+    def archive_boundary(self) -> Optional[datetime]:
+        """
+        Every archived article was published at or before this time.
+
+        The tiering cutoff only moves forward, so `now - HOT_TIER_DAYS` covers
+        archive runs made by other processes since `archived_through` was loaded.
+        """
+        if self.archived_through is None:
+            return None
+        if HOT_TIER_DAYS <= 0:
+            return self.archived_through
+        return max(self.archived_through, datetime.utcnow() - timedelta(days=HOT_TIER_DAYS))
+
+    def reaches_archive(self, query_from: Optional[datetime]) -> bool:
+        """Whether a query for articles published since `query_from` (None = all time) may match archived articles."""
+        boundary = self.archive_boundary()
+        return boundary is not None and (query_from is None or query_from <= boundary)
+
+    @staticmethod
+    def _published_lower_bound(filter_dict: dict) -> Optional[datetime]:
+        value = (filter_dict or {}).get("published")
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, dict):
+            return value.get("$gte") or value.get("$gt")
+        return None
+
+    async def _merge_archive(self, query: dict, projection: dict, limit: int,
+                             hot: list, query_from: Optional[datetime]) -> list:
+        """Merge archive matches into a newest-first hot result when the query's range reaches the archive."""
+        if not self.reaches_archive(query_from):
+            return hot
+        # A full page newer than anything archived cannot change
+        boundary = self.archive_boundary()
+        if len(hot) >= limit and hot[-1].get("published") and hot[-1]["published"] > boundary:
+            return hot
+        try:
+            cold = await self.archive.find_newest(query, projection, limit)
+        except Exception as e:
+            logger.warning(f"[RSS_REPO] Archive query failed, returning hot tier only: {e}")
+            return hot
+        merged = hot + cold
+        merged.sort(key=lambda doc: (doc.get("published") or datetime.min, doc["_id"]), reverse=True)
+        return merged[:limit]
+
     # ------------------------------
     # SAVE NEWS ASYNC
     # ------------------------------
     async def save_news(self, article: dict):
         self._ensure_collection()
-        article["created_at"] = datetime.utcnow()
-        await self.collection.update_one(
+        now = datetime.utcnow()
+        article.pop("created_at", None)
+        # updated_at drives the incremental Weaviate sync watermark
+        article["updated_at"] = now
+        article["source"] = SentimentRollupRepository.source_from_link(article["link"])
+        article["quality_flag"] = classify_quality(article)
+        new_id = ObjectId()
+        # One atomic write that returns the stored state it replaced, so concurrent
+        # saves of the same link each apply their own delta to the rollups
+        previous = await self.collection.find_one_and_update(
             {"link": article["link"]},  # prevent duplicates by link
-            {"$set": article},
-            upsert=True
+            {"$set": article, "$setOnInsert": {"_id": new_id, "created_at": now}},
+            projection={
+                "_id": 1, "title": 1, "link": 1, "source": 1, "quality_flag": 1,
+                "published": 1, "sentiment": 1, "score": 1
+            },
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
         )
+        article_id = previous["_id"] if previous else new_id
+
+        # Keep the daily sentiment rollups in step with the served articles
+        try:
+            await self.rollups.apply_change(
+                previous if previous and self.is_servable(previous) else None,
+                {**article, "_id": article_id} if self.is_servable(article) else None
+            )
+        except Exception as e:
+            logger.warning(f"[RSS_REPO] Failed to update sentiment rollup for {article['link']}: {e}")
+        return article_id
 
     # ------------------------------
     # CHECK IF NEWS EXISTS
     # ------------------------------
     async def exists(self, link: str) -> bool:
         self._ensure_collection()
-        doc = await self.collection.find_one({"link": link})
+        doc = await self.collection.find_one({"link": link}, {"_id": 1})
+        if doc is None and self.archived_through is not None:
+            # Archived articles must not be re-ingested into the hot tier
+            return await self.archive.exists(link)
         return doc is not None
 
     # ------------------------------
     # GET LATEST NEWS ASYNC
     # ------------------------------
-    async def get_latest_news(self, limit: int = 20, date_from: datetime = None):
+    @staticmethod
+    def _keyset_after(after: tuple) -> dict:
+        """Filter for documents that sort after (published, _id) in newest-first order."""
+        from bson import ObjectId
+        published, last_id = after
+        last_id = ObjectId(last_id) if isinstance(last_id, str) else last_id
+        return {"$or": [
+            {"published": {"$lt": published}},
+            {"published": published, "_id": {"$lt": last_id}}
+        ]}
+
+    async def get_latest_news(self, limit: int = 20, date_from: datetime = None,
+                              projection: dict = None, after: tuple = None):
         self._ensure_collection()
         
         import logging
         logger = logging.getLogger(__name__)
         logger.info(f"[RSS_REPO] get_latest_news called with limit={limit}, date_from={date_from}")
         
-        # Filter out fake/test articles
-        fake_titles = [
-            'Bitcoin Surges Past Record High',
-            'Breaking News',
-            'Tech Innovation',
-            'Real-time Test',
-            'Innovation in AI'
-        ]
-        
         # Query: exclude fake articles and sort by published date (most recent first)
-        query = {
-            "title": {"$nin": fake_titles},
-            "link": {"$regex": "economynext.com"}  # Only economynext articles
-        }
+        query = self.serving_filter()
         
         # Add date filter if provided
         if date_from:
             query["published"] = {"$gte": date_from}
             logger.info(f"[RSS_REPO] Filtering articles published after {date_from}")
         
+        # Keyset pagination: continue after the last (published, _id) seen
+        if after:
+            query = {"$and": [query, self._keyset_after(after)]}
+        
         logger.info(f"[RSS_REPO] Query: {query}")
         
-        cursor = self.collection.find(query).sort("published", -1).limit(limit)
+        cursor = self.collection.find(query, projection).sort([("published", -1), ("_id", -1)]).limit(limit)
         news_list = []
         async for news in cursor:
             news["_id"] = str(news["_id"])
             news_list.append(news)
+        news_list = await self._merge_archive(query, projection, limit, news_list, date_from)
         
         logger.info(f"[RSS_REPO] Retrieved {len(news_list)} articles")
         if news_list:
@@ -94,26 +296,96 @@ class RSSRepository:
             news = await self.collection.find_one({"_id": ObjectId(item_id)})
             if news:
                 news["_id"] = str(news["_id"])
+            elif self.archived_through is not None:
+                archived = await self.archive.get_by_ids([item_id])
+                news = archived[0] if archived else None
             return news
         except Exception as e:
             return {"error": f"Failed to fetch news: {str(e)}"}
 
+    # ------------------------------
+    # GET NEWS BY IDS
+    # ------------------------------
+    async def get_by_ids(self, item_ids: list, projection: dict = None):
+        """Fetch several articles by _id with one query, returned in the order of `item_ids`."""
+        self._ensure_collection()
+        from bson import ObjectId
+        object_ids = [ObjectId(i) for i in item_ids if ObjectId.is_valid(str(i))]
+        if not object_ids:
+            return []
+        docs = {}
+        async for news in self.collection.find({"_id": {"$in": object_ids}}, projection):
+            news["_id"] = str(news["_id"])
+            docs[news["_id"]] = news
+        missing = [i for i in object_ids if str(i) not in docs]
+        if missing and self.archived_through is not None:
+            for news in await self.archive.get_by_ids(missing, projection):
+                docs[news["_id"]] = news
+        return [docs[str(i)] for i in item_ids if str(i) in docs]
+
+    # ------------------------------
+    # FULL-TEXT SEARCH
+    # ------------------------------
+    async def search_text(self, text: str, limit: int = 20, filter_dict: dict = None, projection: dict = None):
+        """
+        Full-text search over title, summary and clean_text, best matches first.
+
+        Returns an empty list if the text index is missing so callers can fall back to $regex.
+        """
+        self._ensure_collection()
+        if not self.text_index_ready:
+            return []
+
+        query = {"$text": {"$search": text}, **self.serving_filter()}
+        for key, value in (filter_dict or {}).items():
+            query = {"$and": [query, {key: value}]} if key in query else {**query, key: value}
+
+        projection = dict(projection or {})
+        projection["text_score"] = {"$meta": "textScore"}
+
+        try:
+            cursor = self.collection.find(query, projection).sort(
+                [("text_score", {"$meta": "textScore"}), ("published", -1)]
+            ).limit(limit)
+            news_list = []
+            async for news in cursor:
+                news["_id"] = str(news["_id"])
+                news_list.append(news)
+        except OperationFailure as e:
+            logger.warning(f"[RSS_REPO] $text search failed, falling back to regex: {e}")
+            return []
+
+        # Recent matches first; fill the rest from the archive when the range reaches it
+        if len(news_list) < limit and self.reaches_archive(self._published_lower_bound(filter_dict)):
+            try:
+                news_list += await self.archive.search_text(query, projection, limit - len(news_list))
+            except OperationFailure as e:
+                logger.warning(f"[RSS_REPO] Archive $text search failed: {e}")
+        return news_list
+
     # ------------------------------
     # FIND NEWS BY FILTER
     # ------------------------------
-    async def find_by_filter(self, filter_dict: dict, limit: int = 100):
-        """Query MongoDB with a custom filter dictionary."""
+    async def find_by_filter(self, filter_dict: dict, limit: int = 100,
+                             projection: dict = None, after: tuple = None):
+        """
+        Query MongoDB with a custom filter dictionary.
+
+        String `title`/`content` values are matched with the text index first;
+        the unanchored $regex scan only runs when that finds nothing.
+        """
         self._ensure_collection()
+        filter_dict = dict(filter_dict)
+        query_from = self._published_lower_bound(filter_dict)
+
+        text_terms = [filter_dict[key] for key in ("title", "content") if isinstance(filter_dict.get(key), str)]
+        if text_terms and self.text_index_ready and after is None:
+            remaining = {k: v for k, v in filter_dict.items() if not (k in ("title", "content") and isinstance(v, str))}
+            news_list = await self.search_text(" ".join(text_terms), limit, remaining, projection)
+            if news_list:
+                return news_list
+
         try:
-            # Filter out fake/test articles
-            fake_titles = [
-                'Bitcoin Surges Past Record High',
-                'Breaking News',
-                'Tech Innovation',
-                'Real-time Test',
-                'Innovation in AI'
-            ]
-            
             # Build query with proper MongoDB syntax
             query = {"$and": []}
             
@@ -126,11 +398,8 @@ class RSSRepository:
                 elif isinstance(title_value, dict):
                     query["$and"].append({"title": title_value})
             
-            # Exclude fake articles
-            query["$and"].append({"title": {"$nin": fake_titles}})
-            
-            # Only economynext articles
-            query["$and"].append({"link": {"$regex": "economynext.com"}})
+            # Exclude fake articles, only economynext articles
+            query["$and"].append(self.serving_filter())
             
             # Handle content search
             if "content" in filter_dict:
@@ -142,14 +411,18 @@ class RSSRepository:
             for key, value in filter_dict.items():
                 query["$and"].append({key: value})
             
+            # Keyset pagination: continue after the last (published, _id) seen
+            if after:
+                query["$and"].append(self._keyset_after(after))
+            
             # If $and array is empty, use empty query
             final_query = query if query["$and"] else {}
             
-            cursor = self.collection.find(final_query).sort("published", -1).limit(limit)
+            cursor = self.collection.find(final_query, projection).sort([("published", -1), ("_id", -1)]).limit(limit)
             news_list = []
             async for news in cursor:
                 news["_id"] = str(news["_id"])
                 news_list.append(news)
-            return news_list
+            return await self._merge_archive(final_query, projection, limit, news_list, query_from)
         except Exception as e:
             return [{"error": f"Failed to search news: {str(e)}"}]
@@ -0,0 +1,272 @@
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Callable
+from urllib.parse import urlparse
+from pymongo import ASCENDING, UpdateOne
+from app.Database.mongo_client import ANALYTIC
+from app.Database.repositories.base_repo import BaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of article ids kept per (day, source, sentiment) bucket
+TOP_ARTICLES_PER_BUCKET = 10
+
+
+class SentimentRollupRepository(BaseRepository):
+    """
+    Materialized daily sentiment rollups for `rss_news`.
+
+    One document per (day, source, sentiment) bucket holding the article count,
+    the sum of sentiment scores and the ids of the strongest articles. Only
+    served articles are counted (`RSSRepository.is_servable`). Buckets are
+    maintained incrementally by `RSSRepository.save_news` and can be rebuilt
+    from scratch with `rebuild_from()`.
+    """
+
+    def __init__(self, mongo_client=None):
+        super().__init__(mongo_client, collection_name="news_sentiment_daily")
+
+    # ------------------------------
+    # BUCKET HELPERS
+    # ------------------------------
+    @staticmethod
+    def source_from_link(link: str) -> str:
+        """Derive a normalized source name (e.g. 'economynext.com') from an article link."""
+        host = urlparse(link or "").netloc.lower()
+        return host[4:] if host.startswith("www.") else (host or "unknown")
+
+    @classmethod
+    def bucket_key(cls, article: dict) -> Optional[Tuple[datetime, str, str]]:
+        """Return the (day, source, sentiment) bucket for an article, or None if undated."""
+        published = article.get("published")
+        if isinstance(published, str):
+            try:
+                published = datetime.fromisoformat(published.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        if not isinstance(published, datetime):
+            return None
+
+        day = published.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+        source = article.get("source") or cls.source_from_link(article.get("link", ""))
+        sentiment = article.get("sentiment") or "neutral"
+        return day, source, sentiment
+
+    @staticmethod
+    def _score(article: dict) -> float:
+        try:
+            return float(article.get("score") or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _key_filter(key: Tuple[datetime, str, str]) -> dict:
+        day, source, sentiment = key
+        return {"day": day, "source": source, "sentiment": sentiment}
+
+    # ------------------------------
+    # INDEXES
+    # ------------------------------
+    async def ensure_indexes(self):
+        """Create the unique bucket index used by both writes and range reads."""
+        collection = await self._get_collection()
+        await collection.create_index(
+            [("day", ASCENDING), ("source", ASCENDING), ("sentiment", ASCENDING)],
+            unique=True,
+            name="day_source_sentiment",
+        )
+
+    # ------------------------------
+    # INCREMENTAL UPDATES
+    # ------------------------------
+    def _increment_op(self, article: dict, key: Tuple[datetime, str, str]) -> UpdateOne:
+        score = self._score(article)
+        return UpdateOne(
+            self._key_filter(key),
+            {
+                "$inc": {"count": 1, "score_sum": score},
+                "$push": {
+                    "top_articles": {
+                        "$each": [{"id": str(article["_id"]), "score": score, "weight": abs(score)}],
+                        "$sort": {"weight": -1},
+                        "$slice": TOP_ARTICLES_PER_BUCKET,
+                    }
+                },
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+            upsert=True,
+        )
+
+    def _decrement_op(self, article: dict, key: Tuple[datetime, str, str]) -> UpdateOne:
+        return UpdateOne(
+            self._key_filter(key),
+            {
+                "$inc": {"count": -1, "score_sum": -self._score(article)},
+                "$pull": {"top_articles": {"id": str(article["_id"])}},
+                "$set": {"updated_at": datetime.utcnow()},
+            },
+        )
+
+    async def apply_change(self, before: Optional[dict], after: Optional[dict]):
+        """
+        Move an article between buckets after it was written.
+
+        Args:
+            before: Stored document prior to the write (None for new or unserved articles)
+            after: Document as written, including its `_id` (None if it is not served)
+        """
+        new_key = self.bucket_key(after) if after else None
+        old_key = self.bucket_key(before) if before else None
+
+        if old_key == new_key and before and after and self._score(before) == self._score(after):
+            return
+
+        ops = []
+        if old_key:
+            ops.append(self._decrement_op(before, old_key))
+        if new_key:
+            ops.append(self._increment_op(after, new_key))
+        if not ops:
+            return
+
+        collection = await self._get_collection()
+        await collection.bulk_write(ops, ordered=True)
+
+    # ------------------------------
+    # BACKFILL
+    # ------------------------------
+    async def rebuild_from(
+        self,
+        news_collection,
+        servable: Optional[Callable[[dict], bool]] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Recompute every bucket from the raw news collection.
+
+        Args:
+            news_collection: Motor collection holding the raw articles, or a list
+                of them (the hot `rss_news` and the `rss_news_archive` tier)
+            servable: Predicate selecting the articles to count (`RSSRepository.is_servable`);
+                every article is counted when omitted
+            batch_size: Cursor batch size while scanning articles
+
+        Returns:
+            Number of rollup buckets written
+        """
+        buckets: Dict[Tuple[datetime, str, str], Dict[str, Any]] = {}
+        projection = {
+            "_id": 1, "title": 1, "link": 1, "source": 1, "quality_flag": 1,
+            "published": 1, "sentiment": 1, "score": 1
+        }
+
+        news_collections = news_collection if isinstance(news_collection, (list, tuple)) else [news_collection]
+        for collection in news_collections:
+            cursor = collection.find({}, projection).batch_size(batch_size)
+            async for article in cursor:
+                if servable is not None and not servable(article):
+                    continue
+                key = self.bucket_key(article)
+                if not key:
+                    continue
+                score = self._score(article)
+                bucket = buckets.setdefault(key, {"count": 0, "score_sum": 0.0, "top_articles": []})
+                bucket["count"] += 1
+                bucket["score_sum"] += score
+                bucket["top_articles"].append({"id": str(article["_id"]), "score": score, "weight": abs(score)})
+                if len(bucket["top_articles"]) > 2 * TOP_ARTICLES_PER_BUCKET:
+                    bucket["top_articles"].sort(key=lambda a: a["weight"], reverse=True)
+                    del bucket["top_articles"][TOP_ARTICLES_PER_BUCKET:]
+
+        now = datetime.utcnow()
+        docs = []
+        for key, bucket in buckets.items():
+            bucket["top_articles"].sort(key=lambda a: a["weight"], reverse=True)
+            docs.append({
+                **self._key_filter(key),
+                "count": bucket["count"],
+                "score_sum": bucket["score_sum"],
+                "top_articles": bucket["top_articles"][:TOP_ARTICLES_PER_BUCKET],
+                "updated_at": now,
+            })
+
+        collection = await self._get_collection()
+        await collection.delete_many({})
+        if docs:
+            await collection.insert_many(docs, ordered=False)
+        await self.ensure_indexes()
+
+        logger.info(f"[ROLLUP] Rebuilt {len(docs)} sentiment buckets")
+        return len(docs)
+
+    # ------------------------------
+    # READS
+    # ------------------------------
+    async def get_buckets(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        source: Optional[str] = None,
+        sentiment: Optional[str] = None,
+    ) -> List[dict]:
+        """Fetch raw buckets for an inclusive day range with one indexed query."""
+        collection = await self._get_collection(ANALYTIC)
+        query: Dict[str, Any] = {
+            "day": {
+                "$gte": date_from.replace(hour=0, minute=0, second=0, microsecond=0),
+                "$lte": date_to.replace(hour=0, minute=0, second=0, microsecond=0),
+            },
+            "count": {"$gt": 0},
+        }
+        if source:
+            query["source"] = source
+        if sentiment:
+            query["sentiment"] = sentiment
+
+        cursor = collection.find(query, {"_id": 0}).sort("day", ASCENDING)
+        return [doc async for doc in cursor]
+
+    async def get_timeseries(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        source: Optional[str] = None,
+        sentiment: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build a per-day sentiment series with sentiment and source facets.
+
+        Returns:
+            One entry per day that has articles, oldest first
+        """
+        buckets = await self.get_buckets(date_from, date_to, source, sentiment)
+
+        series: Dict[str, Dict[str, Any]] = {}
+        for bucket in buckets:
+            day = bucket["day"].date().isoformat()
+            entry = series.setdefault(day, {
+                "date": day,
+                "total_articles": 0,
+                "score_sum": 0.0,
+                "sentiment_distribution": {},
+                "sources": {},
+                "top_article_ids": {},
+            })
+            count = bucket.get("count", 0)
+            entry["total_articles"] += count
+            entry["score_sum"] += bucket.get("score_sum", 0.0)
+            entry["sentiment_distribution"][bucket["sentiment"]] = (
+                entry["sentiment_distribution"].get(bucket["sentiment"], 0) + count
+            )
+            entry["sources"][bucket["source"]] = entry["sources"].get(bucket["source"], 0) + count
+            entry["top_article_ids"].setdefault(bucket["sentiment"], []).extend(
+                a["id"] for a in bucket.get("top_articles", [])
+            )
+
+        result = []
+        for entry in series.values():
+            total = entry["total_articles"]
+            entry["average_score"] = round(entry.pop("score_sum") / total, 3) if total else 0
+            result.append(entry)
+        return result
+
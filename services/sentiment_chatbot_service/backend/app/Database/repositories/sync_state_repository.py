@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Dict, Any
+from app.Database.repositories.base_repo import BaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStateRepository(BaseRepository):
+    """
+    Persisted checkpoints for sync jobs, one document per job in `sync_state`.
+
+    A checkpoint holds the committed `watermark` (changes up to it are synced)
+    and, while a run is in progress, the run's start time and the last `_id`
+    written, so a crashed run resumes where it stopped.
+    """
+
+    def __init__(self, mongo_client=None):
+        super().__init__(mongo_client, collection_name="sync_state")
+
+    async def get(self, job: str) -> Dict[str, Any]:
+        collection = await self._get_collection()
+        return await collection.find_one({"_id": job}) or {"_id": job}
+
+    async def start_run(self, job: str, started_at: datetime, full: bool) -> Dict[str, Any]:
+        """Begin a run, or return the unfinished one so it can resume."""
+        state = await self.get(job)
+        if state.get("run_started_at") and not full:
+            logger.info(f"[SYNC_STATE] Resuming {job} run from {state['run_started_at']} after _id {state.get('last_id')}")
+            return state
+
+        collection = await self._get_collection()
+        update = {"run_started_at": started_at, "last_id": None, "full": full, "updated_at": datetime.utcnow()}
+        await collection.update_one({"_id": job}, {"$set": update}, upsert=True)
+        return {**state, **update}
+
+    async def save_progress(self, job: str, last_id: Any, synced: int):
+        collection = await self._get_collection()
+        await collection.update_one(
+            {"_id": job},
+            {"$set": {"last_id": last_id, "updated_at": datetime.utcnow()}, "$inc": {"run_synced": synced}}
+        )
+
+    async def finish_run(self, job: str, watermark: datetime):
+        """Commit the new watermark and clear the in-progress run."""
+        collection = await self._get_collection()
+        await collection.update_one(
+            {"_id": job},
+            {
+                "$set": {"watermark": watermark, "last_finished_at": datetime.utcnow()},
+                "$unset": {"run_started_at": "", "last_id": "", "full": "", "run_synced": ""},
+            }
+        )
+
+    async def reset(self, job: str):
+        collection = await self._get_collection()
+        await collection.delete_one({"_id": job})
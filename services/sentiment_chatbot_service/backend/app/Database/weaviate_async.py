@@ -0,0 +1,93 @@
+# weaviate_async.py
+import os
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Any
+
+logger = logging.getLogger(__name__)
+
+
+class WeaviateExecutor:
+    """
+    Bounded thread pool for synchronous Weaviate v4 calls.
+
+    The v4 `collection.query.*` methods block on HTTP/gRPC round trips. Running
+    them here keeps the event loop free for other requests, while the pool size
+    caps how many queries hit Weaviate at once. The executor is process-wide,
+    so its size comes from WEAVIATE_MAX_CONCURRENCY only.
+    """
+
+    _instance: Optional["WeaviateExecutor"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.max_workers = int(os.getenv("WEAVIATE_MAX_CONCURRENCY", "8"))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._initialized = True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="weaviate-query"
+            )
+            logger.info(f"Weaviate executor started with {self.max_workers} workers")
+        return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking Weaviate call in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads (called on application shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            logger.info("Weaviate executor stopped")
+
+
+class AsyncWeaviateQuery:
+    """
+    Async facade over a Weaviate collection's `query` namespace.
+
+    The collection is resolved lazily through `collection_getter` on every call,
+    so reconnects and collection reloads are picked up without rebuilding this object.
+    Resolving it may block (health check, reconnect), so it runs in the pool too.
+    """
+
+    def __init__(self, collection_getter: Callable[[], Any], executor: WeaviateExecutor = None):
+        self._collection_getter = collection_getter
+        self._executor = executor or WeaviateExecutor()
+
+    def _query(self, method: str, **kwargs):
+        return getattr(self._collection_getter().query, method)(**kwargs)
+
+    async def _run_query(self, method: str, **kwargs):
+        return await self._executor.run(self._query, method, **kwargs)
+
+    async def hybrid(self, **kwargs):
+        """Async `collection.query.hybrid(...)`."""
+        return await self._run_query("hybrid", **kwargs)
+
+    async def near_text(self, **kwargs):
+        """Async `collection.query.near_text(...)`."""
+        return await self._run_query("near_text", **kwargs)
+
+    async def bm25(self, **kwargs):
+        """Async `collection.query.bm25(...)`."""
+        return await self._run_query("bm25", **kwargs)
+
+    async def fetch_objects(self, **kwargs):
+        """Async `collection.query.fetch_objects(...)`."""
+        return await self._run_query("fetch_objects", **kwargs)
@@ -1,21 +1,60 @@
 # weaviate_client.py
+import os
+import time
+import threading
 import weaviate
 from weaviate.classes.config import Property, DataType, Configure
+from weaviate.classes.init import AdditionalConfig, Timeout
 import logging
 from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
-class WeaviateClient:
+# Vector compression for new collections: "none" (Weaviate default), "pq" or "bq"
+VECTOR_COMPRESSION = os.getenv("WEAVIATE_VECTOR_COMPRESSION", "none").lower()
+# BQ: candidates re-ranked with the full-precision vectors per query
+RESCORE_LIMIT = int(os.getenv("WEAVIATE_RESCORE_LIMIT", "200"))
+# PQ: objects used to train the codebook (compression starts once reached)
+PQ_TRAINING_LIMIT = int(os.getenv("WEAVIATE_PQ_TRAINING_LIMIT", "100000"))
+
+
+def vector_index_config(compression: str = None, rescore_limit: int = None, pq_training_limit: int = None):
     """
-    Reusable Weaviate client with:
-    - Singleton pattern
-    - Safe connection handling
-    - Auto-load or create News collection
-    - Support for manual embeddings (Ollama)
+    HNSW config with product or binary quantization, or None for the server default.
+
+    PQ keeps ~1 byte per segment per vector (segments default to a quarter of
+    the dimensions) and BQ 1 bit per dimension in memory; Weaviate re-ranks the
+    compressed candidates with the uncompressed vectors from disk.
+    """
+    compression = (compression or VECTOR_COMPRESSION).lower()
+    if compression == "none":
+        return None
+    if compression == "bq":
+        quantizer = Configure.VectorIndex.Quantizer.bq(
+            rescore_limit=rescore_limit or RESCORE_LIMIT,
+            cache=True
+        )
+    elif compression == "pq":
+        quantizer = Configure.VectorIndex.Quantizer.pq(
+            training_limit=pq_training_limit or PQ_TRAINING_LIMIT,
+            centroids=256
+        )
+    else:
+        raise ValueError(f"Unknown vector compression '{compression}' (expected none, pq or bq)")
+    return Configure.VectorIndex.hnsw(quantizer=quantizer)
+
+
+class WeaviateRegistry:
+    """
+    Owns the process-wide Weaviate connection and hands out per-collection handles.
+
+    - One pooled client shared by every service and collection
+    - Lazy connect, and reconnect when a periodic readiness check fails
+    - Configurable init/query/insert timeouts (applied to HTTP and gRPC)
+    - Graceful close on application shutdown
     """
 
-    _instance: Optional["WeaviateClient"] = None
+    _instance: Optional["WeaviateRegistry"] = None
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -25,50 +64,43 @@ class WeaviateClient:
 
     def __init__(
         self,
-        collection_name: str = None,
-        host: str = "weaviate",
-        http_port: int = 8080,
-        grpc_port: int = 50051,
+        host: str = None,
+        http_port: int = None,
+        grpc_port: int = None,
         http_secure: bool = False,
         grpc_secure: bool = False,
     ):
-        if self._initialized and collection_name and collection_name != self.collection_name:
-            logger.info(f"Updating collection from {self.collection_name} to {collection_name}")
-            self.collection_name = collection_name
-            self._collection = None
-            if self._client:
-                self._load_collection()
-            return
-        
         if self._initialized:
             return
 
-        self.collection_name = collection_name
-        self.host = host
-        self.http_port = http_port
-        self.grpc_port = grpc_port
+        self.host = host or os.getenv("WEAVIATE_HOST", "weaviate")
+        self.http_port = http_port or int(os.getenv("WEAVIATE_PORT", "8080"))
+        self.grpc_port = grpc_port or int(os.getenv("WEAVIATE_GRPC_PORT", "50051"))
         self.http_secure = http_secure
         self.grpc_secure = grpc_secure
 
+        # Seconds; query/insert timeouts cover both the HTTP and gRPC transports
+        self.timeout_init = int(os.getenv("WEAVIATE_TIMEOUT_INIT", "10"))
+        self.timeout_query = int(os.getenv("WEAVIATE_TIMEOUT_QUERY", "30"))
+        self.timeout_insert = int(os.getenv("WEAVIATE_TIMEOUT_INSERT", "90"))
+        self.health_check_interval = float(os.getenv("WEAVIATE_HEALTH_CHECK_SECONDS", "30"))
+
         self._client: Optional[weaviate.WeaviateClient] = None
-        self._collection = None
+        self._lock = threading.Lock()     # queries run on executor threads
+        self._handles: Dict[str, "WeaviateClient"] = {}
+        self._last_health_check = 0.0
+        self.generation = 0               # bumped on every (re)connect so handles reload collections
+        self.reconnects = 0
         self._initialized = True
 
-    # ---------- Context Manager ----------
-    def __enter__(self):
-        self.connect()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
-        return False
-
     # ---------- Connection ----------
     def connect(self):
-        """Establish connection to Weaviate and load collection if provided."""
-        if self._client is not None:
-            return
+        """Connect if not connected yet."""
+        with self._lock:
+            if self._client is None:
+                self._open()
 
+    def _open(self):
         try:
             self._client = weaviate.connect_to_custom(
                 http_host=self.host,
@@ -77,27 +109,139 @@ class WeaviateClient:
                 grpc_host=self.host,
                 grpc_port=self.grpc_port,
                 grpc_secure=self.grpc_secure,
+                additional_config=AdditionalConfig(
+                    timeout=Timeout(init=self.timeout_init, query=self.timeout_query, insert=self.timeout_insert)
+                ),
             )
+            self.generation += 1
+            self._last_health_check = time.monotonic()
             logger.info(f"Connected to Weaviate at {self.host}:{self.http_port}")
-
-            if self.collection_name:
-                self._load_collection()
-
         except Exception as e:
+            self._client = None
             logger.error(f"Failed to connect to Weaviate: {e}")
             raise
 
+    def _close_client(self):
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception as e:
+                logger.warning(f"Error closing Weaviate connection: {e}")
+            self._client = None
+
+    def _is_ready(self) -> bool:
+        try:
+            return self._client.is_ready()
+        except Exception:
+            return False
+
+    @property
+    def client(self) -> weaviate.WeaviateClient:
+        """The shared client, connected lazily and re-checked every `health_check_interval` seconds."""
+        client = self._client
+        if client is not None and time.monotonic() - self._last_health_check < self.health_check_interval:
+            return client
+
+        with self._lock:
+            if self._client is None:
+                self._open()
+            elif time.monotonic() - self._last_health_check >= self.health_check_interval:
+                if self._is_ready():
+                    self._last_health_check = time.monotonic()
+                else:
+                    logger.warning("Weaviate health check failed, reconnecting")
+                    self._close_client()
+                    self.reconnects += 1
+                    self._open()
+            return self._client
+
+    def close(self):
+        """Close the shared connection (application shutdown)."""
+        with self._lock:
+            if self._client is not None:
+                self._close_client()
+                logger.info("Weaviate connection closed")
+
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None
+
+    def alias_target(self, name: str) -> Optional[str]:
+        """Collection that the alias `name` points at (None if it is not an alias)."""
+        try:
+            alias = self.client.alias.get(alias_name=name)
+        except Exception:
+            return None  # server or client without alias support
+        return alias.collection if alias else None
+
+    # ---------- Handles ----------
+    def collection(self, name: str) -> "WeaviateClient":
+        """Get the handle for a collection (one per name, shared by all callers)."""
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = self._handles.setdefault(name, WeaviateClient(collection_name=name, registry=self))
+        return handle
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self.is_connected,
+            "host": f"{self.host}:{self.http_port}",
+            "reconnects": self.reconnects,
+            "timeouts": {"init": self.timeout_init, "query": self.timeout_query, "insert": self.timeout_insert},
+            "collections": sorted(self._handles),
+        }
+
+
+class WeaviateClient:
+    """
+    Handle for one Weaviate collection on the shared connection:
+    - Fixed collection name (no cross-talk between services)
+    - Lazy (re)connect through WeaviateRegistry
+    - Auto-load or create News collection
+    - Support for manual embeddings (Ollama)
+
+    Prefer `WeaviateRegistry().collection(name)`; constructing a WeaviateClient
+    directly also works and shares the same connection.
+    """
+
+    def __init__(self, collection_name: str = None, registry: WeaviateRegistry = None, **connection_kwargs):
+        self.collection_name = collection_name
+        # Connection settings only take effect if the registry does not exist yet
+        self.registry = registry or WeaviateRegistry(**connection_kwargs)
+        self._collection = None
+        self._generation = 0
+
+    # ---------- Context Manager ----------
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # ---------- Connection ----------
+    def connect(self):
+        """Establish the shared connection and load the collection if provided."""
+        self.registry.connect()
+        if self.collection_name:
+            self._load_collection()
+
     # ---------- Collection Loader ----------
     def _load_collection(self):
         if not self.collection_name:
             logger.warning("No collection name provided")
             return
-        
+
         try:
-            if self._client.collections.exists(self.collection_name):
-                self._collection = self._client.collections.get(self.collection_name)
+            client = self.registry.client
+            # Versioned collections are reached through an alias (see weaviate_schema.py)
+            if client.collections.exists(self.collection_name) or self.registry.alias_target(self.collection_name):
+                self._collection = client.collections.get(self.collection_name)
+                self._generation = self.registry.generation
                 logger.info(f"Loaded existing collection: {self.collection_name}")
             else:
+                self._collection = None
                 logger.warning(
                     f"Collection '{self.collection_name}' does not exist. "
                     f"Call create_collection() or create_news_collection()."
@@ -107,23 +251,25 @@ class WeaviateClient:
             raise
 
     # ---------- NEWS COLLECTION CREATION ----------
-    def create_news_collection(self):
+    def create_news_collection(self, compression: str = None):
         """
         Create `News` collection for storing embedded news articles
         with vector support via Ollama embeddings.
+
+        Args:
+            compression: "none", "pq" or "bq" (default WEAVIATE_VECTOR_COMPRESSION)
         """
-        if not self._client:
-            raise RuntimeError("Client not connected. Call connect() first.")
+        client = self.client
 
         try:
-            if self._client.collections.exists("News"):
-                self._collection = self._client.collections.get("News")
+            if client.collections.exists("News"):
+                self._collection = client.collections.get("News")
                 logger.info("Loaded existing collection: News")
                 return self._collection
 
             logger.info("Creating Weaviate collection: News")
 
-            self._collection = self._client.collections.create(
+            self._collection = client.collections.create(
                 name="rss_news",
                 properties=[
                     Property(name="title", data_type=DataType.TEXT),
@@ -132,8 +278,10 @@ class WeaviateClient:
                     Property(name="published_at", data_type=DataType.DATE),
                     Property(name="url", data_type=DataType.TEXT),
                 ],
-                vectorizer_config=Configure.Vectorizer.none()  # using Ollama embeddings
+                vectorizer_config=Configure.Vectorizer.none(),  # using Ollama embeddings
+                vector_index_config=vector_index_config(compression)
             )
+            self._generation = self.registry.generation
 
             logger.info("Created collection: News")
             return self._collection
@@ -146,7 +294,7 @@ class WeaviateClient:
     def list_collections(self) -> List[str]:
         """List all available collections."""
         try:
-            collections = self._client.collections.list_all()
+            collections = self.client.collections.list_all()
             return [col for col in collections.keys()]
         except Exception as e:
             logger.error(f"Failed to list collections: {e}")
@@ -155,7 +303,7 @@ class WeaviateClient:
     def delete_collection(self, name: str):
         """Delete a specific collection."""
         try:
-            self._client.collections.delete(name)
+            self.client.collections.delete(name)
             logger.info(f"Deleted collection: {name}")
             if name == self.collection_name:
                 self._collection = None
@@ -164,28 +312,30 @@ class WeaviateClient:
             raise
 
     def close(self):
-        """Close the Weaviate connection."""
-        if self._client:
-            self._client.close()
-            self._client = None
-            self._collection = None
-            logger.info("Weaviate connection closed")
+        """Release this handle; the shared connection stays open for the other handles.
+
+        The connection itself is closed once, at shutdown, via ``WeaviateRegistry().close()``.
+        """
+        self._collection = None
 
     def reset_instance(self):
-        """Reset singleton instance (useful for testing only)."""
-        self.close()
-        WeaviateClient._instance = None
-        self._initialized = False
+        """Close the connection and drop the registry (useful for testing only)."""
+        self.registry.close()
+        WeaviateRegistry._instance = None
+        self._collection = None
 
     # ---------- Properties ----------
     @property
     def client(self):
-        if self._client is None:
-            raise RuntimeError("Client not connected. Call connect() first.")
-        return self._client
+        return self.registry.client
 
     @property
     def collection(self):
+        client = self.registry.client
+        # Collection objects are bound to a connection; reload after a reconnect
+        if self._collection is None or self._generation != self.registry.generation:
+            if client is not None and self.collection_name:
+                self._load_collection()
         if self._collection is None:
             raise RuntimeError(
                 f"Collection '{self.collection_name}' not loaded. "
@@ -195,7 +345,7 @@ class WeaviateClient:
 
     @property
     def is_connected(self) -> bool:
-        return self._client is not None
+        return self.registry.is_connected
 
     @property
     def has_collection(self) -> bool:
@@ -0,0 +1,308 @@
+# weaviate_schema.py
+"""
+Versioned RSSNews schema and alias-swap migrations.
+
+Readers and writers use the alias `RSSNews`; it points at a versioned
+collection (`RSSNews_v2`, ...). A migration creates the next version,
+backfills it from the current one, catches up on articles saved in MongoDB
+meanwhile, and then repoints the alias in one call, so queries and ingest
+never see a missing or half-filled collection. A legacy unversioned
+`RSSNews` collection counts as version 1.
+"""
+import os
+import re
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from weaviate.classes.config import Property, DataType, Configure, Reconfigure, Tokenization
+from app.Database.weaviate_client import WeaviateRegistry, vector_index_config, RESCORE_LIMIT, PQ_TRAINING_LIMIT
+
+logger = logging.getLogger(__name__)
+
+NEWS_ALIAS = os.getenv("WEAVIATE_NEWS_ALIAS", "RSSNews")
+LATEST_NEWS_SCHEMA_VERSION = 2
+
+
+def versioned_name(version: int) -> str:
+    return f"{NEWS_ALIAS}_v{version}"
+
+
+def news_properties(version: int) -> List[Property]:
+    """RSSNews properties for a schema version."""
+    if version == 1:
+        # Original layout: every text field vectorized, no range indexes
+        return [
+            Property(name="mongoId", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="link", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="content", data_type=DataType.TEXT),
+            Property(name="clean_text", data_type=DataType.TEXT),
+            Property(name="published", data_type=DataType.DATE, skip_vectorization=True),
+            Property(name="summary", data_type=DataType.TEXT),
+            Property(name="sentiment", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="score", data_type=DataType.NUMBER, skip_vectorization=True),
+        ]
+    if version == 2:
+        # Embed title + clean_text only: `content` is the same text as raw HTML and
+        # `summary` is generated from it. Range indexes for date/score filters.
+        # `text_hash` lets the CDC consumer reuse vectors when only other fields change.
+        return [
+            Property(name="mongoId", data_type=DataType.TEXT, skip_vectorization=True,
+                     tokenization=Tokenization.FIELD, index_searchable=False),
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="link", data_type=DataType.TEXT, skip_vectorization=True, index_searchable=False),
+            Property(name="content", data_type=DataType.TEXT, skip_vectorization=True,
+                     index_searchable=False, index_filterable=False),
+            Property(name="clean_text", data_type=DataType.TEXT),
+            Property(name="published", data_type=DataType.DATE, skip_vectorization=True, index_range_filters=True),
+            Property(name="summary", data_type=DataType.TEXT, skip_vectorization=True),
+            Property(name="sentiment", data_type=DataType.TEXT, skip_vectorization=True, tokenization=Tokenization.FIELD),
+            Property(name="score", data_type=DataType.NUMBER, skip_vectorization=True, index_range_filters=True),
+            Property(name="text_hash", data_type=DataType.TEXT, skip_vectorization=True,
+                     tokenization=Tokenization.FIELD, index_searchable=False),
+        ]
+    raise ValueError(f"Unknown RSSNews schema version: {version}")
+
+
+def vectorized_fields(version: int) -> List[str]:
+    return [p.name for p in news_properties(version) if p.dataType == DataType.TEXT and not p.skip_vectorization]
+
+
+class NewsSchemaMigrator:
+    """Create, backfill and alias-swap versioned RSSNews collections."""
+
+    def __init__(self, registry: WeaviateRegistry = None):
+        self.registry = registry or WeaviateRegistry()
+        self.ollama_host = os.getenv("OLLAMA_HOST", "http://ollama:11434")
+        self.embedding_model = os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text")
+
+    @property
+    def client(self):
+        return self.registry.client
+
+    # ------------------------------
+    # STATE
+    # ------------------------------
+    def current(self) -> Tuple[Optional[str], Optional[int]]:
+        """(collection, version) currently served as `RSSNews`; (None, None) if nothing exists yet."""
+        target = self.registry.alias_target(NEWS_ALIAS)
+        if target:
+            match = re.search(r"_v(\d+)$", target)
+            return target, int(match.group(1)) if match else 1
+        if self.client.collections.exists(NEWS_ALIAS):
+            return NEWS_ALIAS, 1  # legacy collection, not yet behind an alias
+        return None, None
+
+    def versions(self) -> Dict[int, str]:
+        """Versioned collections that exist, by version."""
+        pattern = re.compile(rf"^{re.escape(NEWS_ALIAS)}_v(\d+)$")
+        found = {}
+        for name in self.client.collections.list_all(simple=True):
+            match = pattern.match(name)
+            if match:
+                found[int(match.group(1))] = name
+        return dict(sorted(found.items()))
+
+    def count(self, name: str) -> int:
+        result = self.client.collections.get(name).aggregate.over_all(total_count=True)
+        return result.total_count if hasattr(result, 'total_count') else 0
+
+    def status(self) -> Dict[str, Any]:
+        current, version = self.current()
+        return {
+            "alias": NEWS_ALIAS,
+            "serving": current,
+            "version": version,
+            "latest_version": LATEST_NEWS_SCHEMA_VERSION,
+            "collections": {name: self.count(name) for name in self.versions().values()},
+        }
+
+    # ------------------------------
+    # MIGRATION STEPS
+    # ------------------------------
+    def create_version(self, version: int, name: str = None, compression: str = None) -> str:
+        """Create the collection for `version` (no-op if it exists), compressed per WEAVIATE_VECTOR_COMPRESSION."""
+        name = name or versioned_name(version)
+        if self.client.collections.exists(name):
+            logger.info(f"[SCHEMA] {name} already exists")
+            return name
+        self.client.collections.create(
+            name=name,
+            properties=news_properties(version),
+            vectorizer_config=Configure.Vectorizer.text2vec_ollama(
+                api_endpoint=self.ollama_host,
+                model=self.embedding_model,
+                vectorize_collection_name=False
+            ),
+            vector_index_config=vector_index_config(compression)
+        )
+        logger.info(f"[SCHEMA] Created {name} (schema v{version}, vectorizes {', '.join(vectorized_fields(version))})")
+        return name
+
+    def backfill(self, source: str, target: str, batch_size: int = 200, concurrency: int = 2,
+                 keep_vectors: bool = False) -> Dict[str, Any]:
+        """
+        Copy every object from `source` into `target`, keeping UUIDs.
+
+        Vectors are not copied by default: the vectorized fields differ
+        between versions, so the target embeds each object once with its own
+        vectorizer. `keep_vectors` copies them for a same-schema copy.
+        """
+        source_collection = self.client.collections.get(source)
+        target_collection = self.client.collections.get(target)
+        target_fields = {p.name for p in target_collection.config.get().properties}
+
+        started = time.perf_counter()
+        copied = 0
+        with target_collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrency) as batch:
+            for obj in source_collection.iterator(include_vector=keep_vectors):
+                properties = {k: v for k, v in obj.properties.items() if k in target_fields and v is not None}
+                vector = obj.vector.get("default") if keep_vectors and isinstance(obj.vector, dict) else None
+                batch.add_object(properties=properties, uuid=obj.uuid, vector=vector)
+                copied += 1
+                if copied % 1000 == 0:
+                    logger.info(f"[SCHEMA] Backfilled {copied} objects into {target}...")
+
+        failed = target_collection.batch.failed_objects
+        for failure in failed[:5]:
+            logger.error(f"[SCHEMA] Failed to copy {failure.object_.uuid}: {failure.message}")
+        elapsed = time.perf_counter() - started
+        return {"copied": copied - len(failed), "failed": len(failed), "seconds": round(elapsed, 1)}
+
+    async def catch_up(self, target: str, since: datetime) -> Dict[str, Any]:
+        """Upsert articles saved in MongoDB since the backfill started, and drop deleted ones."""
+        from app.services.news.weaviate_sync import WeaviateSyncEngine
+
+        engine = WeaviateSyncEngine(collection_name=target, job=f"schema_migration_{target}")
+        # Start the incremental sync from the backfill start instead of from scratch
+        await engine.state.reset(engine.job)
+        await engine.state.finish_run(engine.job, since)
+        result = await engine.run()
+        result["pruned"] = await engine.prune()
+        await engine.state.reset(engine.job)
+        return result
+
+    def preserve_legacy(self, batch_size: int = 200, concurrency: int = 2) -> str:
+        """
+        Copy the legacy unversioned collection to `RSSNews_v1`, vectors included.
+
+        The copy uses the legacy collection's own config, so it is the same
+        collection under a versioned name that `rollback` can return to.
+        """
+        name = versioned_name(1)
+        if not self.client.collections.exists(name):
+            legacy_config = self.client.collections.get(NEWS_ALIAS).config.get().to_dict()
+            legacy_config["class"] = name
+            self.client.collections.create_from_dict(legacy_config)
+            logger.info(f"[SCHEMA] Created {name} from the legacy {NEWS_ALIAS} config")
+        result = self.backfill(NEWS_ALIAS, name, batch_size, concurrency, keep_vectors=True)
+        logger.info(f"[SCHEMA] Copied legacy {NEWS_ALIAS} to {name}: {result}")
+        return name
+
+    def swap(self, target: str, drop_legacy: bool = False) -> Optional[str]:
+        """
+        Point the alias at `target` and return the collection it pointed at before.
+
+        With an existing alias this is a single atomic update. A legacy
+        unversioned collection holds the alias name, so it must be dropped
+        first; between the delete and the alias create (one round trip)
+        requests for `RSSNews` fail and are retried by callers. It is only
+        dropped once `preserve_legacy` has copied it to `RSSNews_v1`, unless
+        `drop_legacy` accepts losing it.
+        """
+        previous = self.registry.alias_target(NEWS_ALIAS)
+        if previous:
+            self.client.alias.update(alias_name=NEWS_ALIAS, new_target_collection=target)
+        else:
+            if self.client.collections.exists(NEWS_ALIAS):
+                copy = versioned_name(1)
+                copied = self.count(copy) if self.client.collections.exists(copy) else 0
+                if copied < self.count(NEWS_ALIAS) and not drop_legacy:
+                    raise RuntimeError(
+                        f"Legacy {NEWS_ALIAS} is not fully copied to {copy}; run preserve_legacy() first "
+                        f"or pass drop_legacy=True to lose it"
+                    )
+                previous = copy if copied else NEWS_ALIAS
+                self.client.collections.delete(NEWS_ALIAS)
+                logger.warning(f"[SCHEMA] Dropped legacy collection {NEWS_ALIAS} to free the alias name")
+            self.client.alias.create(alias_name=NEWS_ALIAS, target_collection=target)
+        logger.info(f"[SCHEMA] Alias {NEWS_ALIAS} -> {target} (was {previous})")
+        return previous
+
+    def enable_compression(self, compression: str, name: str = None) -> str:
+        """
+        Turn on PQ or BQ for an existing collection (the served one by default).
+
+        Weaviate compresses the stored vectors in place; PQ first trains its
+        codebook on up to WEAVIATE_PQ_TRAINING_LIMIT objects.
+        """
+        name = name or self.current()[0]
+        if compression == "pq":
+            quantizer = Reconfigure.VectorIndex.Quantizer.pq(training_limit=PQ_TRAINING_LIMIT, centroids=256)
+        elif compression == "bq":
+            quantizer = Reconfigure.VectorIndex.Quantizer.bq(rescore_limit=RESCORE_LIMIT)
+        else:
+            raise ValueError(f"Unknown vector compression '{compression}' (expected pq or bq)")
+        self.client.collections.get(name).config.update(
+            vector_index_config=Reconfigure.VectorIndex.hnsw(quantizer=quantizer)
+        )
+        logger.info(f"[SCHEMA] Enabled {compression.upper()} on {name}")
+        return name
+
+    def rollback(self) -> str:
+        """Point the alias back at the newest version older than the current one."""
+        _, version = self.current()
+        older = [v for v in self.versions() if version and v < version]
+        if not older:
+            raise RuntimeError("No older versioned collection to roll back to")
+        target = self.versions()[max(older)]
+        self.swap(target)
+        return target
+
+    def drop(self, version: int):
+        """Delete an old versioned collection (never the one being served)."""
+        name = versioned_name(version)
+        if self.current()[0] == name:
+            raise RuntimeError(f"{name} is being served by {NEWS_ALIAS}; swap first")
+        self.client.collections.delete(name)
+        logger.info(f"[SCHEMA] Dropped {name}")
+
+    async def migrate(self, version: int = LATEST_NEWS_SCHEMA_VERSION, batch_size: int = 200,
+                      concurrency: int = 2, min_ratio: float = 0.99) -> Dict[str, Any]:
+        """
+        Create `version`, backfill it, catch up from MongoDB and swap the alias.
+
+        The swap is skipped if the new collection holds fewer than `min_ratio`
+        of the current collection's objects.
+        """
+        source, current_version = self.current()
+        if source is None:
+            raise RuntimeError(f"Nothing to migrate: neither alias nor collection '{NEWS_ALIAS}' exists")
+        if current_version == version:
+            return {"migrated": False, "reason": f"{source} already uses schema v{version}"}
+
+        started_at = datetime.utcnow()
+        target = self.create_version(version)
+        backfill = self.backfill(source, target, batch_size, concurrency)
+        caught_up_at = datetime.utcnow()
+        catch_up = await self.catch_up(target, started_at)
+
+        source_count, target_count = self.count(source), self.count(target)
+        result = {
+            "source": source, "target": target,
+            "backfill": backfill, "catch_up": catch_up,
+            "source_count": source_count, "target_count": target_count,
+        }
+        if source_count and target_count < source_count * min_ratio:
+            result.update({"migrated": False, "reason": "target holds too few objects; alias not swapped"})
+            return result
+
+        if source == NEWS_ALIAS:
+            # The legacy collection is dropped to free the alias name; keep it as v1 for rollback
+            result["legacy_copy"] = self.preserve_legacy(batch_size, concurrency)
+        result["previous"] = self.swap(target)
+        # Articles saved between the catch-up and the swap went to the old collection
+        result["final_catch_up"] = await self.catch_up(target, caught_up_at)
+        result["migrated"] = True
+        return result
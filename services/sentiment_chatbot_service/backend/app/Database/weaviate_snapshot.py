@@ -0,0 +1,269 @@
+# weaviate_snapshot.py
+"""
+Vector snapshots of Weaviate collections.
+
+A snapshot is one Arrow IPC file (zstd-compressed record batches): a `uuid`
+column, one column per collection property and a float32 `vector` column,
+with the collection config and embedding dimension in the schema metadata.
+Restoring supplies the stored vectors with every object, so the vectorizer
+(Ollama) is never called.
+"""
+import os
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from app.Database.weaviate_client import WeaviateRegistry
+
+try:
+    import numpy as np
+    import pyarrow as pa
+except ImportError as e:
+    logging.getLogger(__name__).warning(f"numpy/pyarrow not available, vector snapshots disabled: {e}")
+    np = None
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = "1"
+
+# Weaviate data type -> Arrow type; anything else is stored as a JSON string
+ARROW_TYPES = {
+    "text": lambda: pa.string(),
+    "date": lambda: pa.timestamp("ms", tz="UTC"),
+    "number": lambda: pa.float64(),
+    "int": lambda: pa.int64(),
+    "boolean": lambda: pa.bool_(),
+    "uuid": lambda: pa.string(),
+}
+
+
+def _object_vector(obj) -> Optional[List[float]]:
+    """The object's vector (the default named vector on clients that return a dict)."""
+    vector = obj.vector
+    if isinstance(vector, dict):
+        vector = vector.get("default") or next(iter(vector.values()), None)
+    return vector
+
+
+class WeaviateSnapshot:
+    """Export a collection with its vectors to a local file, and restore it without re-embedding."""
+
+    def __init__(self, collection_name: str = "RSSNews", registry: WeaviateRegistry = None):
+        if pa is None:
+            raise RuntimeError("Vector snapshots require numpy and pyarrow (pip install pyarrow)")
+        self.collection_name = collection_name
+        self.registry = registry or WeaviateRegistry()
+
+    @staticmethod
+    def _property_types(config: Dict[str, Any]) -> Dict[str, str]:
+        return {prop["name"]: str(prop["dataType"][0]).lower() for prop in config.get("properties", [])}
+
+    @staticmethod
+    def _arrow_schema(property_types: Dict[str, str], dimension: int, metadata: Dict[str, str]):
+        fields = [pa.field("uuid", pa.string())]
+        for name, data_type in property_types.items():
+            fields.append(pa.field(name, ARROW_TYPES.get(data_type, pa.string)()))
+        fields.append(pa.field("vector", pa.list_(pa.float32(), dimension)))
+        return pa.schema(fields, metadata=metadata)
+
+    # ------------------------------
+    # EXPORT
+    # ------------------------------
+    def export(self, path: str, batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        Stream every object with its vector into an Arrow IPC file.
+
+        Args:
+            path: Snapshot file to write (replaced atomically when complete)
+            batch_size: Objects per record batch
+
+        Returns:
+            Object count, dimension, file size and throughput
+        """
+        collection = self.registry.client.collections.get(self.collection_name)
+        config = collection.config.get().to_dict()
+        property_types = self._property_types(config)
+        # Versioned collections are exported through their alias; record both to restore the layout
+        target = self.registry.alias_target(self.collection_name)
+
+        started = time.perf_counter()
+        tmp_path = f"{path}.tmp"
+        writer = None
+        schema = None
+        count = 0
+        rows: List[Dict[str, Any]] = []
+        vectors: List[List[float]] = []
+
+        def flush():
+            vector_array = np.asarray(vectors, dtype=np.float32)
+            columns = [pa.array([row["uuid"] for row in rows], pa.string())]
+            for name, data_type in property_types.items():
+                values = [row["properties"].get(name) for row in rows]
+                if data_type not in ARROW_TYPES:
+                    values = [json.dumps(v, default=str) if v is not None else None for v in values]
+                columns.append(pa.array(values, schema.field(name).type))
+            columns.append(pa.FixedSizeListArray.from_arrays(pa.array(vector_array.ravel()), vector_array.shape[1]))
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+            rows.clear()
+            vectors.clear()
+
+        try:
+            for obj in collection.iterator(include_vector=True):
+                vector = _object_vector(obj)
+                if not vector:
+                    logger.warning(f"[SNAPSHOT] Skipping {obj.uuid}: no vector")
+                    continue
+                if writer is None:
+                    schema = self._arrow_schema(property_types, len(vector), {
+                        "format_version": SNAPSHOT_FORMAT_VERSION,
+                        "collection": self.collection_name,
+                        "versioned_collection": target or self.collection_name,
+                        "alias": self.collection_name if target else "",
+                        "dimension": str(len(vector)),
+                        "collection_config": json.dumps(config, default=str),
+                        "created_at": datetime.utcnow().isoformat(),
+                    })
+                    writer = pa.ipc.new_file(tmp_path, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+                rows.append({"uuid": str(obj.uuid), "properties": obj.properties})
+                vectors.append(vector)
+                count += 1
+                if len(rows) >= batch_size:
+                    flush()
+                    logger.info(f"[SNAPSHOT] Exported {count} objects...")
+            if writer is None:
+                raise RuntimeError(f"Collection '{self.collection_name}' has no vectorized objects to export")
+            if rows:
+                flush()
+            writer.close()
+        except Exception:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+
+        elapsed = time.perf_counter() - started
+        size = os.path.getsize(path)
+        return {
+            "collection": self.collection_name,
+            "objects": count,
+            "dimension": int(schema.metadata[b"dimension"]),
+            "file": path,
+            "bytes": size,
+            "bytes_per_object": round(size / count, 1),
+            "seconds": round(elapsed, 2),
+            "objects_per_second": round(count / elapsed, 1) if elapsed else None,
+        }
+
+    # ------------------------------
+    # IMPORT
+    # ------------------------------
+    @staticmethod
+    def read_metadata(path: str) -> Dict[str, Any]:
+        """Snapshot metadata and object count, without reading the vectors."""
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = {k.decode(): v.decode() for k, v in (reader.schema.metadata or {}).items()}
+            metadata["objects"] = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        return metadata
+
+    def _ensure_target(self, metadata: Dict[str, str]):
+        """
+        Resolve or create the collection to restore into.
+
+        An existing alias or collection is used as is. Otherwise the snapshot's
+        layout is recreated from its config: a snapshot taken through an alias
+        (`RSSNews` -> `RSSNews_v2`) restored under the same name creates the
+        versioned collection and then the alias, so schema migrations and the
+        CDC consumer find the layout they expect.
+        """
+        client = self.registry.client
+        # Versioned collections are reached through an alias: restore into the collection it points at
+        target = self.registry.alias_target(self.collection_name)
+        if target:
+            logger.info(f"[SNAPSHOT] Restoring into {target} (alias {self.collection_name})")
+            return client.collections.get(target)
+        if client.collections.exists(self.collection_name):
+            return client.collections.get(self.collection_name)
+
+        config = json.loads(metadata["collection_config"])
+        versioned = None
+        if metadata.get("alias") == self.collection_name:
+            versioned = metadata["versioned_collection"]
+        elif "alias" not in metadata and metadata.get("collection") == self.collection_name \
+                and str(config.get("class", "")).startswith(f"{self.collection_name}_v"):
+            versioned = config["class"]  # snapshot written before the alias was recorded
+
+        if versioned is None:
+            config["class"] = self.collection_name
+            logger.info(f"[SNAPSHOT] Creating {self.collection_name} from snapshot config")
+            return client.collections.create_from_dict(config)
+
+        if not client.collections.exists(versioned):
+            config["class"] = versioned
+            logger.info(f"[SNAPSHOT] Creating {versioned} from snapshot config")
+            client.collections.create_from_dict(config)
+        client.alias.create(alias_name=self.collection_name, target_collection=versioned)
+        logger.info(f"[SNAPSHOT] Created alias {self.collection_name} -> {versioned}")
+        return client.collections.get(versioned)
+
+    def restore(self, path: str, batch_size: int = 200, concurrency: int = 2) -> Dict[str, Any]:
+        """
+        Bulk-import a snapshot with its stored vectors (no embedding calls).
+
+        Objects keep their UUIDs, so restoring into a populated collection
+        overwrites the same objects instead of duplicating them.
+
+        Args:
+            path: Snapshot file written by `export`
+            batch_size: Objects per Weaviate batch request
+            concurrency: Concurrent batch requests
+
+        Returns:
+            Imported/failed counts and throughput
+        """
+        started = time.perf_counter()
+        imported = 0
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            metadata = {k.decode(): v.decode() for k, v in (reader.schema.metadata or {}).items()}
+            collection = self._ensure_target(metadata)
+            dimension = int(metadata["dimension"])
+            json_fields = {
+                name for name, data_type in self._property_types(json.loads(metadata["collection_config"])).items()
+                if data_type not in ARROW_TYPES
+            }
+            property_names = [name for name in reader.schema.names if name not in ("uuid", "vector")]
+
+            with collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrency) as batch:
+                for i in range(reader.num_record_batches):
+                    record_batch = reader.get_batch(i)
+                    uuids = record_batch.column("uuid").to_pylist()
+                    vectors = record_batch.column("vector").flatten().to_numpy().reshape(-1, dimension)
+                    columns = {name: record_batch.column(name).to_pylist() for name in property_names}
+                    for row, uuid in enumerate(uuids):
+                        properties = {}
+                        for name in property_names:
+                            value = columns[name][row]
+                            if value is None:
+                                continue
+                            properties[name] = json.loads(value) if name in json_fields else value
+                        batch.add_object(properties=properties, uuid=uuid, vector=vectors[row].tolist())
+                    imported += len(uuids)
+                    logger.info(f"[SNAPSHOT] Queued {imported} objects...")
+
+        failed = collection.batch.failed_objects
+        for failure in failed[:5]:
+            logger.error(f"[SNAPSHOT] Failed to import {failure.object_.uuid}: {failure.message}")
+
+        elapsed = time.perf_counter() - started
+        return {
+            "collection": self.collection_name,
+            "objects": imported - len(failed),
+            "failed": len(failed),
+            "seconds": round(elapsed, 2),
+            "objects_per_second": round(imported / elapsed, 1) if elapsed else None,
+        }
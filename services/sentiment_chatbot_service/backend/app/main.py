@@ -6,6 +6,8 @@ import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from app.Database.mongo_client import MongoClient
+from app.services.news.retrieval_cache import NewsChangeWatcher
+from app.services.news.bm25_index import BM25NewsIndex
 from app.routes.rss_routes import router as rss_router
 from app.routes.chat_routes import router as chat_router
 from app.routes.news_chat_routes import router as news_chat_router
@@ -14,6 +16,7 @@ from app.routes.knowledge_routes import router as knowledge_router
 from app.routes.lstm_routes import router as lstm_router
 from app.routes.rag_routes import router as rag_router
 from app.routes.plot_routes import router as plot_router
+from app.routes.export_routes import router as export_router
 from app.llm.client.ollama_client import OllamaClient
 from app.llm.LLMFactory import LLMFactory 
 
@@ -60,6 +63,16 @@ async def collect_rss_feeds():
     except Exception as e:
         logger.error(f"RSS collection job failed: {e}")
 
+# Background task for hot/cold tiering
+async def archive_aged_news():
+    """Move articles older than NEWS_HOT_TIER_DAYS to the archive collection."""
+    try:
+        from app.services.news.news_tiering import NewsTieringJob
+        result = await NewsTieringJob().run()
+        logger.info(f"News tiering completed: {result}")
+    except Exception as e:
+        logger.error(f"News tiering job failed: {e}")
+
 @app.get("/")
 def read_root():
     return {
@@ -92,6 +105,9 @@ router_llm = LLMFactory.get_llm("ollama")
 # MongoDB Singleton Instance
 mongo_client = MongoClient()
 
+# Change stream watcher that keeps the retrieval cache fresh
+news_change_watcher = NewsChangeWatcher(mongo_client)
+
 # Register all Routers
 app.include_router(rss_router)
 app.include_router(chat_router)
@@ -101,6 +117,7 @@ app.include_router(lstm_router, prefix="/api", tags=["LSTM Predictions"])
 app.include_router(admin_router)
 app.include_router(knowledge_router)
 app.include_router(rag_router)
+app.include_router(export_router)
 
 @app.on_event("startup")
 async def startup():
@@ -108,6 +125,50 @@ async def startup():
     await mongo_client.connect()
     logger.info("MongoDB connection initialized")
     
+    # Ensure the sentiment rollup index exists
+    try:
+        from app.Database.repositories.sentiment_rollup_repository import SentimentRollupRepository
+        await SentimentRollupRepository(mongo_client).ensure_indexes()
+        logger.info("Sentiment rollup indexes ensured")
+    except Exception as e:
+        logger.warning(f"Could not ensure sentiment rollup indexes: {e}")
+    
+    # Ensure the weighted news text index exists ($text search)
+    try:
+        from app.Database.repositories.rss_repository import RSSRepository
+        await RSSRepository().ensure_text_index()
+    except Exception as e:
+        logger.warning(f"Could not ensure news text index, search falls back to regex: {e}")
+    
+    # Ensure the managed rss_news indexes and switch to the indexed source filter once backfilled
+    try:
+        from app.Database.index_manager import NewsIndexManager
+        from app.Database.repositories.rss_repository import RSSRepository
+        await NewsIndexManager(mongo_client).ensure_indexes()
+        await RSSRepository().check_source_fields()
+    except Exception as e:
+        logger.warning(f"Could not ensure news indexes: {e}")
+    
+    # Let queries fan out to the archive tier once it holds articles
+    try:
+        from app.Database.repositories.rss_repository import RSSRepository
+        await RSSRepository().check_archive()
+    except Exception as e:
+        logger.warning(f"Could not read news archive, queries use the hot tier only: {e}")
+    
+    # Build the in-process BM25 news index in the background
+    news_index = BM25NewsIndex()
+    if news_index.enabled:
+        from app.Database.repositories.rss_repository import RSSRepository
+        # Full scan: read from a secondary when available
+        asyncio.create_task(news_index.build_from(
+            mongo_client.get_analytics_db["rss_news"], RSSRepository().serving_filter()
+        ))
+        logger.info("BM25 news index build started")
+    
+    # Invalidate cached retrievals when articles change
+    news_change_watcher.start()
+    
     # Start the scheduler
     scheduler.add_job(
         collect_rss_feeds,
@@ -116,6 +177,15 @@ async def startup():
         name='Collect RSS feeds',
         replace_existing=True
     )
+    from app.Database.repositories.news_archive_repository import HOT_TIER_DAYS
+    if HOT_TIER_DAYS > 0:
+        scheduler.add_job(
+            archive_aged_news,
+            trigger=IntervalTrigger(hours=24),
+            id='news_tiering_job',
+            name='Archive aged news',
+            replace_existing=True
+        )
     scheduler.start()
     logger.info("RSS collection scheduler started (runs every 30 minutes)")
     
@@ -129,6 +199,17 @@ async def shutdown():
     scheduler.shutdown()
     logger.info("RSS collection scheduler stopped")
     
+    # Stop the retrieval cache watcher
+    await news_change_watcher.stop()
+    
+    # Stop Weaviate query workers
+    from app.Database.weaviate_async import WeaviateExecutor
+    WeaviateExecutor().shutdown(wait=False)
+    
+    # Close the shared Weaviate connection
+    from app.Database.weaviate_client import WeaviateRegistry
+    WeaviateRegistry().close()
+    
     # Close MongoDB
     await mongo_client.close()
     logger.info("MongoDB connection closed")
@@ -0,0 +1,69 @@
+"""
+News Export Routes
+Bulk, columnar access to the news archive (date-partitioned Parquet).
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+from datetime import datetime
+from app.services.news.parquet_export import NewsParquetExporter
+import logging
+
+router = APIRouter(prefix="/export", tags=["Export"])
+logger = logging.getLogger(__name__)
+
+
+def _get_exporter() -> NewsParquetExporter:
+    try:
+        return NewsParquetExporter()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.post("/news/parquet")
+async def export_news_parquet(full: bool = Query(False, description="Rewrite every day instead of only changed days")):
+    """
+    Export new and changed days of served news to Parquet.
+
+    Incremental by default: only days containing articles saved since the
+    previous export are (re)written.
+    """
+    exporter = _get_exporter()
+    if exporter.is_running():
+        raise HTTPException(status_code=409, detail="An export is already running")
+    try:
+        return {"success": True, **await exporter.export(full=full)}
+    except Exception as e:
+        logger.error(f"Error exporting news to Parquet: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/news/parquet")
+async def list_news_partitions():
+    """List exported days with their article counts and the export watermark."""
+    exporter = _get_exporter()
+    manifest = exporter.read_manifest()
+    return {
+        "watermark": manifest.get("watermark"),
+        "schema": manifest.get("schema", []),
+        "partitions": manifest.get("partitions", {}),
+        "running": exporter.is_running(),
+    }
+
+
+@router.get("/news/parquet/{day}")
+async def download_news_partition(day: str):
+    """Download one day's Parquet file (day as YYYY-MM-DD)."""
+    try:
+        day = datetime.strptime(day, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="day must be YYYY-MM-DD")
+
+    path = _get_exporter().partition_path(day)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail=f"No export for {day}")
+    return FileResponse(
+        path,
+        media_type="application/vnd.apache.parquet",
+        filename=f"news_{day}.parquet"
+    )
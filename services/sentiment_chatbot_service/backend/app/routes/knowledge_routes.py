@@ -49,6 +49,7 @@ class StatsResponse(BaseModel):
     total_chunks: Optional[int] = None
     model: Optional[str] = None
     embedding_model: Optional[str] = None
+    embedding_dimensions: Optional[int] = None
     collection_name: Optional[str] = None
     error: Optional[str] = None
 
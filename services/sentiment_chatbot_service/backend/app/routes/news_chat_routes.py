@@ -4,11 +4,13 @@ Provides conversational interface for querying financial news with RAG.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from app.services.news_rag_service import NewsRAGService
 import logging
+import json
 
 router = APIRouter(prefix="/news-chat", tags=["News Chat"])
 logger = logging.getLogger(__name__)
@@ -42,6 +44,14 @@ class NewsChatRequest(BaseModel):
     context_limit: int = Field(default=5, ge=1, le=20, description="Number of articles to use as context")
 
 
+class BatchNewsChatRequest(BaseModel):
+    """Request for answering several questions at once."""
+    questions: List[str] = Field(..., description="Questions to answer", min_length=1, max_length=20)
+    user_id: str = Field(default="anonymous", description="User identifier")
+    include_sources: bool = Field(default=True, description="Include source articles in each answer")
+    context_limit: int = Field(default=5, ge=1, le=20, description="Number of articles to use as context per question")
+
+
 class NewsChatResponse(BaseModel):
     """Response from news chat."""
     message: str = Field(..., description="Assistant's response")
@@ -58,6 +68,9 @@ class SearchNewsRequest(BaseModel):
     limit: int = Field(default=10, ge=1, le=50, description="Maximum results")
     sentiment_filter: Optional[str] = Field(None, description="Filter by sentiment: positive, negative, neutral")
     days: Optional[int] = Field(None, ge=1, le=90, description="Only return news from last N days")
+    fields: Optional[List[str]] = Field(None, description="Fields to return, e.g. ['title', 'summary', 'sentiment']")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's next_cursor")
+    paginate: bool = Field(default=False, description="Return a page envelope with next_cursor instead of a plain list")
 
 
 class SentimentRequest(BaseModel):
@@ -111,11 +124,40 @@ async def ask_question(request: NewsChatRequest):
         raise HTTPException(status_code=500, detail=f"Failed to process question: {str(e)}")
 
 
-@router.post("/search", response_model=List[Dict[str, Any]])
+@router.post("/ask/batch")
+async def ask_questions_batch(request: BatchNewsChatRequest):
+    """
+    Answer several questions in one request.
+    
+    Results are streamed as newline-delimited JSON, one line per question in
+    completion order. Each line carries the question's `index` in the request.
+    """
+    if any(not question.strip() for question in request.questions):
+        raise HTTPException(status_code=400, detail="Questions must not be empty")
+    
+    logger.info(f"User {request.user_id} asked a batch of {len(request.questions)} questions")
+    news_rag = get_news_rag()
+    
+    async def stream_answers():
+        async for result in news_rag.answer_questions_batch(
+            questions=request.questions,
+            context_limit=request.context_limit,
+            include_sources=request.include_sources
+        ):
+            yield json.dumps(result, default=str) + "\n"
+    
+    return StreamingResponse(stream_answers(), media_type="application/x-ndjson")
+
+
+@router.post("/search", response_model=Union[List[Dict[str, Any]], Dict[str, Any]])
 async def search_news(request: SearchNewsRequest):
     """
     Search for news articles using semantic search.
     Returns relevant articles without generating an answer.
+    
+    With `paginate` (or a `cursor`) the response is a page:
+    {"results": [...], "count": n, "next_cursor": "..."}; pass `next_cursor`
+    back as `cursor` to fetch the next page. `fields` limits the returned fields.
     """
     try:
         logger.info(f"Searching news with query: {request.query}")
@@ -127,6 +169,24 @@ async def search_news(request: SearchNewsRequest):
             date_from = datetime.utcnow() - timedelta(days=request.days)
         
         news_rag = get_news_rag()
+        
+        if request.paginate or request.cursor or request.fields:
+            page = await news_rag.search_news_page(
+                query=request.query,
+                limit=request.limit,
+                sentiment_filter=request.sentiment_filter,
+                date_from=date_from,
+                fields=request.fields,
+                cursor=request.cursor
+            )
+            if not (request.paginate or request.cursor):
+                return page["results"]
+            return {
+                "results": page["results"],
+                "count": len(page["results"]),
+                "next_cursor": page["next_cursor"]
+            }
+        
         results = await news_rag.search_news_by_text(
             query=request.query,
             limit=request.limit,
@@ -136,6 +196,8 @@ async def search_news(request: SearchNewsRequest):
         
         return results
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error in search_news: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to search news: {str(e)}")
@@ -164,22 +226,29 @@ async def get_trending(days: int = 7, limit: int = 10):
 
 
 @router.get("/latest")
-async def get_latest_news(limit: int = 10):
+async def get_latest_news(limit: int = 10, fields: Optional[str] = None, cursor: Optional[str] = None):
     """
     Get the latest news articles sorted by published date.
     This is useful for testing the latest news functionality.
+    
+    `fields` is a comma-separated projection (e.g. "title,summary,sentiment");
+    pass the returned `next_cursor` as `cursor` to fetch the next page.
     """
     try:
         logger.info(f"Getting {limit} latest news articles")
         news_rag = get_news_rag()
-        results = await news_rag._get_latest_from_mongodb(limit=limit)
+        page = await news_rag.get_latest_page(limit=limit, fields=fields, cursor=cursor)
+        results = page["results"]
         
         return {
             "status": "success",
             "count": len(results),
-            "results": results
+            "results": results,
+            "next_cursor": page["next_cursor"]
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error in get_latest_news: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get latest news: {str(e)}")
@@ -231,6 +300,55 @@ async def analyze_sentiment(request: SentimentRequest):
         raise HTTPException(status_code=500, detail=f"Failed to analyze sentiment: {str(e)}")
 
 
+@router.get("/sentiment/timeseries")
+async def get_sentiment_timeseries(
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    days: int = 30,
+    source: Optional[str] = None,
+    sentiment: Optional[str] = None
+):
+    """
+    Get daily sentiment counts and average scores for a date range.
+    Served from the materialized daily rollups, so any range is a single indexed read.
+    
+    Examples:
+    - GET /sentiment/timeseries?days=90
+    - GET /sentiment/timeseries?date_from=2025-01-01&date_to=2025-03-31&source=economynext.com
+    """
+    try:
+        date_to = date_to or datetime.utcnow()
+        if date_from is None:
+            from datetime import timedelta
+            date_from = date_to - timedelta(days=days)
+        
+        if date_from > date_to:
+            raise HTTPException(status_code=400, detail="date_from must be before date_to")
+        
+        news_rag = get_news_rag()
+        series = await news_rag.get_sentiment_timeseries(
+            date_from=date_from,
+            date_to=date_to,
+            source=source,
+            sentiment=sentiment
+        )
+        
+        return {
+            "status": "success",
+            "date_from": date_from.date().isoformat(),
+            "date_to": date_to.date().isoformat(),
+            "source": source,
+            "count": len(series),
+            "series": series
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_sentiment_timeseries: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to get sentiment timeseries: {str(e)}")
+
+
 @router.get("/health")
 async def health_check():
     """
@@ -240,16 +358,15 @@ async def health_check():
         # Try to get collection info
         news_rag = get_news_rag()
         if news_rag.weaviate_client.is_connected:
-            collection = news_rag.weaviate_client.collection
-            
             # Try a simple query to verify it's working
-            response = collection.query.fetch_objects(limit=1)
+            response = await news_rag.news_query.fetch_objects(limit=1)
             
             return {
                 "status": "healthy",
                 "weaviate_connected": True,
                 "collection": "RSSNews",
                 "sample_count": len(response.objects),
+                "weaviate": news_rag.weaviate_registry.stats(),
                 "timestamp": datetime.utcnow().isoformat()
             }
         else:
@@ -269,6 +386,21 @@ async def health_check():
         }
 
 
+@router.get("/cache/stats")
+async def get_cache_statistics():
+    """
+    Get retrieval cache metrics (entries, memory use, hit ratio, evictions, invalidations),
+    the state of the in-process BM25 news index and hedged retrieval counters.
+    """
+    news_rag = get_news_rag()
+    return {
+        "retrieval_cache": news_rag.retrieval_cache.stats(),
+        "bm25_index": news_rag.news_index.stats(),
+        "hedged_retrieval": news_rag.hedge_stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.get("/stats")
 async def get_statistics():
     """
@@ -276,10 +408,6 @@ async def get_statistics():
     """
     try:
         news_rag = get_news_rag()
-        collection = news_rag.weaviate_client.collection
-        
-        # Get total count
-        total_response = collection.query.fetch_objects(limit=1)
         
         # Get sentiment distribution
         sentiment_summary = await news_rag.get_sentiment_summary(days=30)
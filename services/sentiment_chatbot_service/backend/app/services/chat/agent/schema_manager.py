@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from typing import List, Dict
+from app.Database.mongo_client import ANALYTIC
 from app.Database.repositories.rss_repository import RSSRepository
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ class DynamicSchemaManager:
         ]
 
         try:
-            collection = await self.repo._get_collection()
+            collection = await self.repo._get_collection(ANALYTIC)
             result = await collection.aggregate(pipeline).to_list(1)
 
             if result and "values" in result[0]:
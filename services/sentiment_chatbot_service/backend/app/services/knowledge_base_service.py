@@ -15,6 +15,7 @@ from datetime import datetime
 import PyPDF2 
 import time
 import os
+from app.utils.embeddings import truncate_embedding, DIMENSIONS_KEY, MODEL_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,8 @@ class KnowledgeBaseService:
                  model_name: str = None,
                  embedding_model: str = None,
                  db_path: str = "./data/knowledge_base",
-                 ollama_host: str = None):
+                 ollama_host: str = None,
+                 embedding_dimensions: int = None):
         """
         Initialize Knowledge Base Service
         
@@ -35,11 +37,19 @@ class KnowledgeBaseService:
             embedding_model: Model for embeddings (defaults to env var or nomic-embed-text)
             db_path: Path to ChromaDB storage
             ollama_host: Ollama host URL (defaults to env var or http://localhost:11434)
+            embedding_dimensions: Matryoshka-truncate embeddings to this many dimensions when
+                building (defaults to env var, 0 = full size). Existing collections keep the
+                dimension recorded in their metadata.
         """
         # Get configuration from environment variables or defaults
         self.model_name = model_name or os.getenv('KNOWLEDGE_BASE_MODEL', 'llama3.2')
         self.embedding_model = embedding_model or os.getenv('KNOWLEDGE_BASE_EMBEDDING_MODEL', 'nomic-embed-text')
         self.ollama_host = ollama_host or os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+        self.build_dimensions = embedding_dimensions if embedding_dimensions is not None else int(
+            os.getenv('KNOWLEDGE_BASE_EMBEDDING_DIMENSIONS', os.getenv('EMBEDDING_DIMENSIONS', '0'))
+        )
+        # Dimension used for queries; follows the loaded collection's metadata
+        self.embedding_dimensions = self.build_dimensions
         self.db_path = Path(db_path)
         
         # Configure Ollama client with host
@@ -119,6 +129,13 @@ class KnowledgeBaseService:
         """Load existing collection or prepare for new one"""
         try:
             self.collection = self.client.get_collection(name=collection_name)
+            # Query vectors must match the stored ones; collections without metadata hold full vectors
+            self.embedding_dimensions = int((self.collection.metadata or {}).get(DIMENSIONS_KEY, 0))
+            if self.embedding_dimensions != self.build_dimensions:
+                logger.warning(
+                    f"Collection {collection_name} stores {self.embedding_dimensions or 'full'}-dim embeddings; "
+                    f"rebuild it to use {self.build_dimensions or 'full'} dimensions"
+                )
             logger.info(f"Loaded existing collection: {collection_name}")
         except Exception as e:
             logger.info(f"Collection not found: {collection_name}. Use build_from_pdf to create.")
@@ -210,7 +227,7 @@ class KnowledgeBaseService:
         return chunks
     
     def get_embeddings(self, text: str, retry_count: int = 3) -> List[float]:
-        """Generate embeddings using Ollama with retry logic"""
+        """Generate embeddings using Ollama with retry logic, truncated to `embedding_dimensions`"""
         for attempt in range(retry_count):
             try:
                 response = ollama.embeddings(
@@ -220,9 +237,10 @@ class KnowledgeBaseService:
                 
                 # Handle both dict and object responses
                 if isinstance(response, dict):
-                    return response['embedding']
+                    embedding = response['embedding']
                 else:
-                    return response.embedding
+                    embedding = response.embedding
+                return truncate_embedding(embedding, self.embedding_dimensions)
                     
             except Exception as e:
                 if attempt < retry_count - 1:
@@ -256,11 +274,14 @@ class KnowledgeBaseService:
                     pass
             
             # Create new collection
+            self.embedding_dimensions = self.build_dimensions
             self.collection = self.client.create_collection(
                 name=collection_name,
                 metadata={
                     "created_at": datetime.now().isoformat(),
-                    "source": pdf_path
+                    "source": pdf_path,
+                    MODEL_KEY: self.embedding_model,
+                    DIMENSIONS_KEY: self.embedding_dimensions
                 }
             )
             
@@ -471,6 +492,7 @@ Answer:"""
                 'total_chunks': count,
                 'model': self.model_name,
                 'embedding_model': self.embedding_model,
+                'embedding_dimensions': self.embedding_dimensions,
                 'collection_name': self.collection.name
             }
         except Exception as e:
@@ -0,0 +1,228 @@
+"""
+In-Process BM25 News Index
+Compact inverted index over title, summary and clean_text, used as a lexical
+fallback when Weaviate is unavailable and as a fast leg for ticker/company queries.
+
+Postings are stored as parallel `array` blocks (doc number, weighted term
+frequency) instead of Python objects. Measured with `benchmark_bm25_index.py`
+the index takes roughly 7 MB per 10k synthetic articles (~150-word bodies);
+see README files/NEWS_CHAT_API.md for the full table.
+"""
+
+import os
+import re
+import math
+import asyncio
+import logging
+from array import array
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
+    "is", "it", "its", "of", "on", "or", "that", "the", "to", "was", "were", "will", "with"
+}
+
+# Title matches count three times as much as body text, summary twice
+FIELD_WEIGHTS = {"title": 3.0, "summary": 2.0, "clean_text": 1.0}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; dotted tickers (JKH.N0000) also yield their parts."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall((text or "").lower()):
+        if token in STOPWORDS:
+            continue
+        tokens.append(token)
+        if "." in token:
+            tokens.extend(part for part in token.split(".") if part not in STOPWORDS)
+    return tokens
+
+
+class BM25NewsIndex:
+    """
+    Incremental BM25 index keyed by MongoDB article id.
+
+    Updates tombstone the previous version of an article and append the new
+    one; postings are compacted once tombstones exceed a quarter of the index.
+    """
+
+    _instance: Optional["BM25NewsIndex"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        if self._initialized:
+            return
+
+        self.k1 = k1
+        self.b = b
+        self.enabled = os.getenv("NEWS_BM25_ENABLED", "true").lower() == "true"
+        # Also blend BM25 into Weaviate results for ticker/company queries
+        self.lexical_leg = os.getenv("NEWS_BM25_LEXICAL_LEG", "true").lower() == "true"
+        self.ready = False
+        self._reset()
+        self._initialized = True
+
+    def _reset(self):
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_ids: List[Optional[str]] = []     # doc number -> mongo id (None once removed)
+        self._doc_len = array("f")                  # weighted document length
+        self._published = array("d")                # POSIX timestamp, 0 if unknown
+        self._sentiment: List[Optional[str]] = []
+        self._by_mongo_id: Dict[str, int] = {}
+        self._live_docs = 0
+        self._total_len = 0.0
+        self._tombstones = 0
+
+    # ------------------------------
+    # WRITES
+    # ------------------------------
+    def add(self, article: Dict[str, Any]):
+        """Index (or re-index) an article dict with `_id`, title, summary and clean_text."""
+        mongo_id = str(article.get("_id") or article.get("mongoId") or "")
+        if not mongo_id:
+            return
+        if mongo_id in self._by_mongo_id:
+            self.remove(mongo_id)
+
+        term_freqs: Dict[str, float] = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(article.get(field) or ""):
+                term_freqs[token] = term_freqs.get(token, 0.0) + weight
+                length += weight
+
+        doc = len(self._doc_ids)
+        self._doc_ids.append(mongo_id)
+        self._doc_len.append(length)
+        published = article.get("published")
+        self._published.append(published.timestamp() if isinstance(published, datetime) else 0.0)
+        self._sentiment.append(article.get("sentiment"))
+        self._by_mongo_id[mongo_id] = doc
+        self._live_docs += 1
+        self._total_len += length
+
+        for term, tf in term_freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = (array("I"), array("f"))
+                self._postings[term] = postings
+            postings[0].append(doc)
+            postings[1].append(tf)
+
+    def remove(self, mongo_id: str):
+        """Tombstone an article; its postings are dropped on the next compaction."""
+        doc = self._by_mongo_id.pop(str(mongo_id), None)
+        if doc is None:
+            return
+        self._doc_ids[doc] = None
+        self._live_docs -= 1
+        self._total_len -= self._doc_len[doc]
+        self._tombstones += 1
+        if self._tombstones > max(1000, self._live_docs // 4):
+            self._compact()
+
+    def _compact(self):
+        for term in list(self._postings):
+            docs, tfs = self._postings[term]
+            keep = [i for i, doc in enumerate(docs) if self._doc_ids[doc] is not None]
+            if not keep:
+                del self._postings[term]
+            elif len(keep) < len(docs):
+                self._postings[term] = (array("I", (docs[i] for i in keep)), array("f", (tfs[i] for i in keep)))
+        self._tombstones = 0
+        logger.info(f"[BM25] Compacted index ({self._live_docs} live articles)")
+
+    async def build_from(self, news_collection, query: dict = None, batch_size: int = 1000) -> int:
+        """
+        Rebuild the index by streaming articles from MongoDB.
+
+        Args:
+            news_collection: rss_news collection
+            query: Articles to index (the repository's serving filter, so placeholders are never ranked)
+            batch_size: Documents per cursor batch; yields to the event loop between batches
+        """
+        self._reset()
+        self.ready = False
+        projection = {"_id": 1, "title": 1, "summary": 1, "clean_text": 1, "published": 1, "sentiment": 1}
+
+        count = 0
+        cursor = news_collection.find(query or {}, projection).batch_size(batch_size)
+        async for article in cursor:
+            self.add(article)
+            count += 1
+            if count % batch_size == 0:
+                await asyncio.sleep(0)
+
+        self.ready = True
+        logger.info(f"[BM25] Built news index: {count} articles, {len(self._postings)} terms")
+        return count
+
+    # ------------------------------
+    # SEARCH
+    # ------------------------------
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank articles for a query.
+
+        Returns:
+            (mongo id, BM25 score) pairs, best first
+        """
+        if not self._live_docs:
+            return []
+
+        n_docs = self._live_docs
+        avg_len = self._total_len / n_docs if n_docs else 1.0
+        min_ts = date_from.timestamp() if date_from else None
+        k1, b = self.k1, self.b
+
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            docs, tfs = postings
+            df = len(docs)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc, tf in zip(docs, tfs):
+                if self._doc_ids[doc] is None:
+                    continue
+                norm = k1 * (1 - b + b * self._doc_len[doc] / avg_len)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        candidates = []
+        for doc, score in scores.items():
+            if sentiment_filter and self._sentiment[doc] != sentiment_filter:
+                continue
+            if min_ts is not None and self._published[doc] < min_ts:
+                continue
+            candidates.append((self._doc_ids[doc], score))
+
+        candidates.sort(key=lambda item: item[1], reverse=True)
+        return candidates[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        postings = sum(len(docs) for docs, _ in self._postings.values())
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "articles": self._live_docs,
+            "terms": len(self._postings),
+            "postings": postings,
+            "tombstones": self._tombstones,
+        }
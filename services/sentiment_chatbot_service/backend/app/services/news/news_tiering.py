@@ -0,0 +1,79 @@
+"""
+Hot/Cold News Tiering
+Moves articles older than NEWS_HOT_TIER_DAYS from `rss_news` into the
+compressed `rss_news_archive` collection, so the hot collection (and every
+regex fallback, sort and aggregation on it) only holds recent news.
+"""
+
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any
+from app.Database.index_manager import NewsIndexManager
+from app.Database.repositories.rss_repository import RSSRepository
+from app.Database.repositories.news_archive_repository import HOT_TIER_DAYS, ARCHIVE_COLLECTION
+from app.services.news.bm25_index import BM25NewsIndex
+
+logger = logging.getLogger(__name__)
+
+
+class NewsTieringJob:
+    """
+    Copies aged articles to the archive, then deletes them from the hot tier.
+
+    Each batch is upserted into the archive by `_id` before it is deleted,
+    so an interrupted run loses nothing and simply re-copies on the next run.
+    """
+
+    def __init__(self, hot_days: int = None, batch_size: int = None):
+        self.hot_days = HOT_TIER_DAYS if hot_days is None else hot_days
+        self.batch_size = batch_size or int(os.getenv("NEWS_TIERING_BATCH_SIZE", "500"))
+        self.rss_repository = RSSRepository()
+        self.archive = self.rss_repository.archive
+
+    @property
+    def enabled(self) -> bool:
+        return self.hot_days > 0
+
+    def cutoff(self) -> datetime:
+        return datetime.utcnow() - timedelta(days=self.hot_days)
+
+    async def pending(self) -> int:
+        """Hot articles old enough to be archived."""
+        collection = await self.rss_repository._get_collection()
+        return await collection.count_documents({"published": {"$lt": self.cutoff()}})
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Archive every hot article published before the cutoff.
+
+        Returns:
+            Cutoff and number of articles moved
+        """
+        if not self.enabled:
+            return {"enabled": False, "moved": 0}
+
+        cutoff = self.cutoff()
+        await self.archive.ensure_collection()
+        await NewsIndexManager(self.rss_repository.mongo_client, ARCHIVE_COLLECTION).ensure_indexes()
+
+        hot = await self.rss_repository._get_collection()
+        # Archived articles leave the in-process BM25 index along with the hot tier
+        news_index = BM25NewsIndex()
+        moved = 0
+        async for batch in self.rss_repository.iter_batches(
+            {"published": {"$lt": cutoff}},
+            batch_size=self.batch_size,
+            sort=[("_id", 1)],
+            string_ids=False
+        ):
+            await self.archive.archive_batch(batch)
+            result = await hot.delete_many({"_id": {"$in": [article["_id"] for article in batch]}})
+            moved += result.deleted_count
+            for article in batch:
+                news_index.remove(str(article["_id"]))
+            logger.info(f"[TIERING] Archived {moved} articles...")
+
+        await self.rss_repository.check_archive()
+        logger.info(f"[TIERING] Moved {moved} articles published before {cutoff} to {ARCHIVE_COLLECTION}")
+        return {"enabled": True, "cutoff": cutoff.isoformat(), "moved": moved}
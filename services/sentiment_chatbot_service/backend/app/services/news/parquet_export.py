@@ -0,0 +1,246 @@
+"""
+Columnar News Export
+Writes served `rss_news` articles to date-partitioned, zstd-compressed Parquet
+files for analysts and backtests:
+
+    <export_dir>/published_date=YYYY-MM-DD/news.parquet
+
+The Hive-style directory names let pandas, pyarrow.dataset, DuckDB and Spark
+read the whole export as one dataset and prune days by `published_date`.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+from app.Database.mongo_client import ANALYTIC, TRANSACTIONAL
+from app.Database.repositories.rss_repository import RSSRepository
+from app.Database.repositories.sentiment_rollup_repository import SentimentRollupRepository
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:
+    logging.getLogger(__name__).warning(f"pyarrow not available, Parquet export disabled: {e}")
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = os.getenv("NEWS_EXPORT_DIR", str(Path(__file__).resolve().parents[3] / "data" / "exports" / "news"))
+PARTITION_KEY = "published_date"
+PARTITION_FILE = "news.parquet"
+MANIFEST_FILE = "_manifest.json"
+
+# Stable column order and types; add new columns at the end only
+EXPORT_SCHEMA = pa.schema([
+    ("title", pa.string()),
+    ("source", pa.string()),
+    ("published", pa.timestamp("ms", tz="UTC")),
+    ("summary", pa.string()),
+    ("sentiment", pa.string()),
+    ("score", pa.float64()),
+]) if pa else None
+
+EXPORT_PROJECTION = {"title": 1, "source": 1, "link": 1, "published": 1, "summary": 1, "sentiment": 1, "score": 1}
+
+
+def to_export_row(article: Dict[str, Any]) -> Dict[str, Any]:
+    score = article.get("score")
+    return {
+        "title": article.get("title", ""),
+        "source": article.get("source") or SentimentRollupRepository.source_from_link(article.get("link", "")),
+        "published": article["published"],
+        "summary": article.get("summary", ""),
+        "sentiment": article.get("sentiment", "neutral"),
+        "score": float(score) if isinstance(score, (int, float)) else None,
+    }
+
+
+class NewsParquetExporter:
+    """
+    Incremental Parquet export of served news, one file per publication day.
+
+    The first run writes every day. Later runs only rewrite the days that
+    contain articles saved since the previous run (new days are added, days
+    with late or re-scored articles are replaced), tracked by a watermark in
+    `_manifest.json` inside the export directory. Each file is written to a
+    temporary name and renamed, so readers never see a partial partition.
+
+    Incremental runs read from the primary, so the watermark never passes a
+    write a lagging secondary has not replicated yet. Full runs read from
+    secondaries and back-date the watermark by the staleness bound instead.
+    Deleted articles leave nothing behind to match the watermark: a day whose
+    articles were all deleted keeps its file until a full run.
+    """
+
+    # One export at a time per process (CLI or API)
+    _lock = asyncio.Lock()
+
+    def __init__(self, export_dir: str = None, batch_size: int = None):
+        if pa is None:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+        self.export_dir = Path(export_dir or EXPORT_DIR)
+        self.batch_size = batch_size or int(os.getenv("NEWS_EXPORT_BATCH_SIZE", "5000"))
+        self.compression_level = int(os.getenv("NEWS_EXPORT_ZSTD_LEVEL", "6"))
+        # Re-read a little before the watermark to cover clock skew between app servers
+        self.overlap = timedelta(seconds=int(os.getenv("NEWS_EXPORT_OVERLAP_SECONDS", "60")))
+        self.rss_repository = RSSRepository()
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._lock.locked()
+
+    # ------------------------------
+    # MANIFEST
+    # ------------------------------
+    @property
+    def manifest_path(self) -> Path:
+        return self.export_dir / MANIFEST_FILE
+
+    def read_manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path.exists():
+            return {"watermark": None, "partitions": {}}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def partition_path(self, day: str) -> Path:
+        return self.export_dir / f"{PARTITION_KEY}={day}" / PARTITION_FILE
+
+    # ------------------------------
+    # EXPORT
+    # ------------------------------
+    def _tiers(self, published_from: Optional[datetime]) -> list:
+        """Repositories holding articles published since `published_from` (hot, plus the archive if reached)."""
+        tiers = [self.rss_repository]
+        if self.rss_repository.reaches_archive(published_from):
+            tiers.append(self.rss_repository.archive)
+        return tiers
+
+    async def _changed_days(self, since: Optional[datetime], workload: str = ANALYTIC) -> List[str]:
+        """Publication days (YYYY-MM-DD) with articles saved at or after `since` (all days if None)."""
+        match = {"$and": [{"published": {"$type": "date"}}]}
+        if since is None:
+            match["$and"].append(self.rss_repository.serving_filter())
+        else:
+            # Served or not: an article that stopped being served must leave its day's file
+            match["$and"].append(self.rss_repository.changed_since_filter(since))
+        pipeline = [
+            {"$match": match},
+            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$published"}}}},
+        ]
+        # Moving articles to the archive does not change them, so only full runs read it
+        tiers = self._tiers(None) if since is None else [self.rss_repository]
+        days = set()
+        for tier in tiers:
+            collection = await tier._get_collection(workload)
+            days.update([doc["_id"] async for doc in collection.aggregate(pipeline, allowDiskUse=True)])
+        return sorted(days)
+
+    async def _write_day(self, day: str, workload: str = ANALYTIC) -> int:
+        """Rewrite one day's partition from MongoDB and return its row count."""
+        start = datetime.strptime(day, "%Y-%m-%d")
+        query = {"$and": [
+            self.rss_repository.serving_filter(),
+            {"published": {"$gte": start, "$lt": start + timedelta(days=1)}},
+        ]}
+        path = self.partition_path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".parquet.tmp")
+
+        rows = 0
+        writer = pq.ParquetWriter(tmp_path, EXPORT_SCHEMA, compression="zstd", compression_level=self.compression_level)
+        try:
+            for tier in self._tiers(start):
+                async for batch in tier.iter_batches(
+                    query, EXPORT_PROJECTION, batch_size=self.batch_size,
+                    sort=[("published", 1), ("_id", 1)], workload=workload
+                ):
+                    table = pa.Table.from_pylist([to_export_row(article) for article in batch], schema=EXPORT_SCHEMA)
+                    await asyncio.to_thread(writer.write_table, table)
+                    rows += len(batch)
+        except Exception:
+            writer.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        writer.close()
+
+        if rows:
+            os.replace(tmp_path, path)
+        else:
+            # Every article of the day was removed or is no longer served
+            tmp_path.unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+        return rows
+
+    async def export(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Export new and changed days.
+
+        Args:
+            full: Rewrite every day, ignoring the watermark
+
+        Returns:
+            Days written, rows written and the new watermark
+
+        Days whose articles were all deleted are only removed by a full run.
+        """
+        async with self._lock:
+            manifest = self.read_manifest()
+            if full:
+                manifest = {"watermark": None, "partitions": {}}
+            watermark = manifest.get("watermark")
+            since = datetime.fromisoformat(watermark) - self.overlap if watermark else None
+            run_started_at = datetime.utcnow()
+            watermark_at = run_started_at
+            staleness = self.rss_repository.mongo_client.max_staleness_seconds
+            if since is None and staleness > 0:
+                # A full scan may read from a secondary up to `staleness` behind the primary
+                workload = ANALYTIC
+                watermark_at = run_started_at - timedelta(seconds=staleness)
+            else:
+                workload = TRANSACTIONAL
+
+            days = await self._changed_days(since, workload)
+            logger.info(f"[EXPORT] {'Full' if since is None else 'Incremental'} export of {len(days)} days to {self.export_dir}")
+
+            rows = 0
+            for day in days:
+                day_rows = await self._write_day(day, workload)
+                if day_rows:
+                    manifest["partitions"][day] = day_rows
+                else:
+                    manifest["partitions"].pop(day, None)
+                rows += day_rows
+                logger.info(f"[EXPORT] {day}: {day_rows} articles")
+
+            if since is None:
+                # Days without served articles any more (e.g. all deleted) are only found here
+                for path in self.export_dir.glob(f"{PARTITION_KEY}=*/{PARTITION_FILE}"):
+                    if path.parent.name.split("=", 1)[1] not in days:
+                        path.unlink(missing_ok=True)
+                        logger.info(f"[EXPORT] Removed {path.parent.name}: no served articles")
+
+            # Only advance the watermark once every changed day is on disk
+            manifest["watermark"] = watermark_at.isoformat()
+            manifest["schema"] = [field.name for field in EXPORT_SCHEMA]
+            self._write_manifest(manifest)
+
+            return {
+                "days_written": len(days),
+                "rows_written": rows,
+                "total_days": len(manifest["partitions"]),
+                "total_rows": sum(manifest["partitions"].values()),
+                "watermark": manifest["watermark"],
+                "export_dir": str(self.export_dir),
+            }
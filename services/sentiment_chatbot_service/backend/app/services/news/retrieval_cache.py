@@ -0,0 +1,277 @@
+"""
+Retrieval Result Cache
+Caches news retrieval results keyed by normalized query, filters and limit, and
+drops only the entries whose date range covers articles that changed in MongoDB.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (normalized query, sentiment filter, date_from bucket, limit)
+CacheKey = Tuple[str, Optional[str], Optional[datetime], int]
+
+
+class RetrievalCache:
+    """
+    In-process LRU cache for `NewsRAGService.search_news_by_text` results.
+
+    Entries are indexed by the start of their date range. When an article
+    published on day D changes, only entries whose range starts on or before
+    D are dropped; narrower windows that cannot contain it are kept.
+    """
+
+    _instance: Optional["RetrievalCache"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None, ttl_seconds: int = None):
+        if self._initialized:
+            return
+
+        self.enabled = os.getenv("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+        self.max_entries = max_entries or int(os.getenv("RETRIEVAL_CACHE_MAX_ENTRIES", "512"))
+        self.max_bytes = max_bytes or int(os.getenv("RETRIEVAL_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+        self.ttl_seconds = ttl_seconds or int(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "900"))
+        # Degraded (lexical/BM25 fallback) results are only kept briefly, so a slow Weaviate call does not pin them
+        self.fallback_ttl_seconds = int(os.getenv("RETRIEVAL_CACHE_FALLBACK_TTL_SECONDS", "30"))
+
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._by_range_start: Dict[Optional[datetime], set] = {}
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+        self._initialized = True
+
+    # ------------------------------
+    # KEYS
+    # ------------------------------
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Lowercase, collapse whitespace and strip surrounding punctuation."""
+        return re.sub(r"\s+", " ", query.lower()).strip(" ?!.,;:'\"")
+
+    @staticmethod
+    def bucket_date(date_from: Optional[datetime]) -> Optional[datetime]:
+        """
+        Floor a date filter to the hour.
+
+        Callers query with the floored value so requests issued a few minutes
+        apart ("last 7 days") share an entry and return identical results.
+        """
+        if date_from is None:
+            return None
+        return date_from.replace(minute=0, second=0, microsecond=0)
+
+    def make_key(self, query: str, limit: int, sentiment_filter: Optional[str] = None,
+                 date_from: Optional[datetime] = None) -> CacheKey:
+        return (self.normalize_query(query), sentiment_filter, self.bucket_date(date_from), limit)
+
+    # ------------------------------
+    # GET / PUT
+    # ------------------------------
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        if time.monotonic() - entry["stored_at"] > entry["ttl"]:
+            self._remove(key)
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return [dict(item) for item in entry["results"]]
+
+    def put(self, key: CacheKey, results: List[Dict[str, Any]], ttl_seconds: Optional[int] = None):
+        """Store results for `ttl_seconds` (default RETRIEVAL_CACHE_TTL_SECONDS; 0 skips caching)."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if not self.enabled or not results or ttl <= 0:
+            return
+
+        size = len(json.dumps(results, default=str))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = {
+            "results": [dict(item) for item in results], "size": size, "stored_at": time.monotonic(), "ttl": ttl
+        }
+        self._by_range_start.setdefault(key[2], set()).add(key)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry["size"]
+        keys = self._by_range_start.get(key[2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_range_start[key[2]]
+
+    # ------------------------------
+    # INVALIDATION
+    # ------------------------------
+    def invalidate_published(self, published: Optional[datetime]) -> int:
+        """
+        Drop entries whose date range can contain an article published at `published`.
+
+        Passing None (e.g. a delete without the document) drops everything.
+        """
+        if published is None:
+            return self.clear()
+
+        # Ranges are open-ended towards now, so any range starting at or before
+        # the end of the article's day may include it.
+        day_end = published.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None) + timedelta(days=1)
+        affected = [start for start in self._by_range_start if start is None or start < day_end]
+
+        removed = 0
+        for start in affected:
+            for key in list(self._by_range_start.get(start, ())):
+                self._remove(key)
+                removed += 1
+
+        self._stats["invalidations"] += removed
+        return removed
+
+    def clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        self._by_range_start.clear()
+        self._bytes = 0
+        self._stats["invalidations"] += removed
+        return removed
+
+    # ------------------------------
+    # METRICS
+    # ------------------------------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "fallback_ttl_seconds": self.fallback_ttl_seconds,
+            "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            **self._stats
+        }
+
+
+class NewsChangeWatcher:
+    """
+    Watches the `rss_news` change stream and invalidates affected cache entries.
+
+    Weaviate is fed from MongoDB through CDC, so it lags the change stream a
+    little. Each invalidation is repeated after `cdc_lag_seconds` so entries
+    re-cached in between (still missing the article) are dropped too.
+
+    An update that moves an article's `published` date must also drop the
+    ranges that covered the old date. With change stream pre-images enabled on
+    `rss_news` (`changeStreamPreAndPostImages`), the old date comes from the
+    pre-image; without them, such updates clear the whole cache.
+    """
+
+    def __init__(self, mongo_client, cache: RetrievalCache = None, cdc_lag_seconds: float = None):
+        self.mongo_client = mongo_client
+        self.cache = cache or RetrievalCache()
+        self.cdc_lag_seconds = cdc_lag_seconds if cdc_lag_seconds is not None else float(
+            os.getenv("RETRIEVAL_CACHE_CDC_LAG_SECONDS", "10")
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None and self.cache.enabled:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Retrieval cache change stream watcher started")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Retrieval cache change stream watcher stopped")
+
+    def _invalidate(self, published: Optional[datetime]):
+        removed = self.cache.invalidate_published(published)
+        if removed:
+            logger.info(f"[CACHE] Invalidated {removed} retrieval entries for articles published {published}")
+
+    @staticmethod
+    def _published(document: Optional[dict]) -> Optional[datetime]:
+        published = (document or {}).get("published")
+        return published if isinstance(published, datetime) else None
+
+    def stale_dates(self, change: dict) -> List[Optional[datetime]]:
+        """Publication dates whose cached ranges a change affects (None = every range)."""
+        operation = change.get("operationType")
+        before = change.get("fullDocumentBeforeChange")
+        if operation == "delete":
+            # Without a pre-image the deleted article's date is unknown
+            return [self._published(before)]
+
+        published = self._published(change.get("fullDocument"))
+        if before is not None:
+            previous = self._published(before)
+            return [published] if previous == published else [published, previous]
+        description = change.get("updateDescription") or {}
+        moved = "published" in (description.get("updatedFields") or {}) or \
+            "published" in (description.get("removedFields") or [])
+        if operation == "replace" or moved:
+            # The old date is unknown, so any range may still hold the article
+            return [None]
+        return [published]
+
+    async def _run(self):
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+        loop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                collection = self.mongo_client.get_db["rss_news"]
+                async with collection.watch(
+                    pipeline, full_document="updateLookup", full_document_before_change="whenAvailable"
+                ) as stream:
+                    async for change in stream:
+                        for published in self.stale_dates(change):
+                            self._invalidate(published)
+                            loop.call_later(self.cdc_lag_seconds, self._invalidate, published)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Without change events we cannot tell what went stale
+                self.cache.clear()
+                logger.warning(f"[CACHE] Change stream unavailable, retrying in 30s: {e}")
+                await asyncio.sleep(30)
@@ -8,10 +8,12 @@ from datetime import datetime
 from urllib.parse import urlparse, urlunparse
 from app.models.rss_model import RSSNews
 from app.Database.repositories.rss_repository import RSSRepository
+from app.services.news.bm25_index import BM25NewsIndex
 
 class RSSService:
     def __init__(self, llm=None):
         self.repo = RSSRepository()
+        self.news_index = BM25NewsIndex()
         self.llm = llm
 
     # ------------------------------
@@ -202,9 +204,14 @@ Respond with JSON only:"""
                 article.score = sentiment_data.get("score", 0)
 
                 # Save to DB
-                await self.repo.save_news(article.to_dict())
+                doc = article.to_dict()
+                article_id = await self.repo.save_news(doc)
                 count += 1
 
+                # Keep the in-process lexical index current (served articles only)
+                if article_id is not None and self.news_index.ready and self.repo.is_servable(doc):
+                    self.news_index.add({**doc, "_id": article_id})
+
             return {"status": "success", "new_articles": count}
 
         except Exception as e:
@@ -0,0 +1,218 @@
+"""
+Incremental MongoDB -> Weaviate Sync
+Upserts only articles changed since the last committed watermark, using
+deterministic object UUIDs so re-running a batch never duplicates objects
+and unchanged articles are never re-vectorized.
+"""
+
+import os
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any
+from weaviate.classes.config import DataType
+from weaviate.classes.query import Filter
+from weaviate.util import generate_uuid5
+from app.Database.mongo_client import TRANSACTIONAL
+from app.Database.weaviate_async import WeaviateExecutor
+from app.Database.weaviate_client import WeaviateRegistry
+from app.Database.repositories.rss_repository import RSSRepository
+from app.Database.repositories.sync_state_repository import SyncStateRepository
+
+logger = logging.getLogger(__name__)
+
+SYNC_JOB = "weaviate_rss_news"
+
+# Hash of the vectorized text; the CDC consumer reuses stored vectors while it matches
+TEXT_HASH_PROPERTY = "text_hash"
+
+# Fields copied to RSSNews objects
+SYNC_PROJECTION = {
+    "title": 1, "content": 1, "clean_text": 1, "summary": 1,
+    "link": 1, "published": 1, "sentiment": 1, "score": 1
+}
+
+
+def article_uuid(mongo_id: str) -> str:
+    """Weaviate UUID for an article; the CDC consumer derives the same one."""
+    return str(generate_uuid5(str(mongo_id)))
+
+
+def text_hash(article: Dict[str, Any], fields: List[str]) -> str:
+    """Hash of the vectorized fields, computed exactly as the CDC consumer does."""
+    text = "\x1f".join(f"{field}={article.get(field) or ''}" for field in fields)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def to_weaviate_properties(article: Dict[str, Any], hash_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """RSSNews properties for an article; with `hash_fields`, also its `text_hash`."""
+    properties = {
+        "mongoId": str(article["_id"]),
+        "title": article.get("title", ""),
+        "content": article.get("content", ""),
+        "clean_text": article.get("clean_text", ""),
+        "summary": article.get("summary", ""),
+        "link": article.get("link", ""),
+        "published": article.get("published", datetime.utcnow()),
+        "sentiment": article.get("sentiment", "neutral"),
+        "score": article.get("score", 0.0)
+    }
+    if hash_fields:
+        properties[TEXT_HASH_PROPERTY] = text_hash(article, hash_fields)
+    return properties
+
+
+class WeaviateSyncEngine:
+    """
+    Checkpointed, resumable sync of served `rss_news` articles into RSSNews.
+
+    Each run reads articles whose `updated_at` (or, for older documents,
+    `created_at`) is at or after the committed watermark, in `_id` order, and
+    writes them in chunks. The last `_id` of every flushed chunk is persisted,
+    so a crashed run resumes after it. The watermark only advances when a run
+    completes.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = None,
+        concurrency: int = None,
+        collection_name: str = "RSSNews",
+        job: str = SYNC_JOB
+    ):
+        self.batch_size = batch_size or int(os.getenv("WEAVIATE_SYNC_BATCH_SIZE", "200"))
+        self.concurrency = concurrency or int(os.getenv("WEAVIATE_SYNC_CONCURRENCY", "2"))
+        # Re-read a little before the watermark to cover clock skew between app servers
+        self.overlap = timedelta(seconds=int(os.getenv("WEAVIATE_SYNC_OVERLAP_SECONDS", "60")))
+        self.job = job
+        self.rss_repository = RSSRepository()
+        self.state = SyncStateRepository()
+        self.handle = WeaviateRegistry().collection(collection_name)
+        self.executor = WeaviateExecutor()
+        self._hash_fields: Optional[List[str]] = None
+
+    def _changed_filter(self, watermark: Optional[datetime], last_id) -> dict:
+        clauses = [self.rss_repository.serving_filter()]
+        if watermark is not None:
+            clauses.append(self.rss_repository.changed_since_filter(watermark - self.overlap))
+        if last_id is not None:
+            clauses.append({"_id": {"$gt": last_id}})
+        return {"$and": clauses}
+
+    # ------------------------------
+    # WEAVIATE WRITES (executor threads)
+    # ------------------------------
+    def _text_hash_fields(self, collection) -> List[str]:
+        """
+        Vectorized fields of the target, in schema order (empty if it has no `text_hash` property).
+
+        Upserts replace every property, so writing the hash keeps the
+        consumer's vector reuse working for objects this engine wrote.
+        """
+        if self._hash_fields is None:
+            properties = collection.config.get().properties
+            if TEXT_HASH_PROPERTY in {p.name for p in properties}:
+                self._hash_fields = [
+                    p.name for p in properties
+                    if p.data_type == DataType.TEXT and not (p.vectorizer_config and p.vectorizer_config.skip)
+                ]
+            else:
+                self._hash_fields = []
+        return self._hash_fields
+
+    def _write_chunk(self, articles: List[Dict[str, Any]]) -> int:
+        """Upsert one chunk and return the number of failed objects."""
+        collection = self.handle.collection
+        mongo_ids = [str(article["_id"]) for article in articles]
+
+        # Objects written before deterministic UUIDs have random ids; drop them so they are not duplicated
+        expected = {article_uuid(mongo_id) for mongo_id in mongo_ids}
+        existing = collection.query.fetch_objects(
+            filters=Filter.by_property("mongoId").contains_any(mongo_ids),
+            limit=len(mongo_ids) * 2,
+            return_properties=["mongoId"]
+        )
+        for obj in existing.objects:
+            if str(obj.uuid) not in expected:
+                collection.data.delete_by_id(obj.uuid)
+
+        hash_fields = self._text_hash_fields(collection)
+        with collection.batch.fixed_size(batch_size=self.batch_size, concurrent_requests=self.concurrency) as batch:
+            for article in articles:
+                batch.add_object(
+                    properties=to_weaviate_properties(article, hash_fields), uuid=article_uuid(article["_id"])
+                )
+
+        failed = collection.batch.failed_objects
+        for failure in failed[:5]:
+            logger.error(f"[SYNC] Failed to upsert {failure.object_.uuid}: {failure.message}")
+        return len(failed)
+
+    def _prune_chunk(self, mongo_ids: List[str], live_ids: set) -> int:
+        collection = self.handle.collection
+        stale = [mongo_id for mongo_id in mongo_ids if mongo_id not in live_ids]
+        if stale:
+            collection.data.delete_many(where=Filter.by_property("mongoId").contains_any(stale))
+        return len(stale)
+
+    # ------------------------------
+    # RUNS
+    # ------------------------------
+    async def run(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Sync changed articles.
+
+        Args:
+            full: Ignore the watermark and upsert every served article
+
+        Returns:
+            Counts for the run
+        """
+        state = await self.state.start_run(self.job, datetime.utcnow(), full)
+        watermark = None if state.get("full") else state.get("watermark")
+        last_id = state.get("last_id")
+        logger.info(f"[SYNC] Starting {'full' if watermark is None else 'incremental'} sync (watermark={watermark})")
+
+        synced = failed = 0
+        async for chunk in self.rss_repository.iter_batches(
+            self._changed_filter(watermark, last_id),
+            SYNC_PROJECTION,
+            batch_size=self.batch_size,
+            sort=[("_id", 1)],
+            # Primary reads: a secondary may lag past the overlap window, and writes it has
+            # not replicated yet would fall before the next run's watermark
+            workload=TRANSACTIONAL,
+            string_ids=False
+        ):
+            failed_in_chunk = await self.executor.run(self._write_chunk, chunk)
+            if failed_in_chunk:
+                # Leave the checkpoint before this chunk so the next run retries it
+                failed += failed_in_chunk
+                logger.error(f"[SYNC] {failed_in_chunk} objects failed; stopping so the run can be resumed")
+                break
+            synced += len(chunk)
+            await self.state.save_progress(self.job, chunk[-1]["_id"], len(chunk))
+            logger.info(f"[SYNC] Upserted {synced} articles...")
+
+        if not failed:
+            await self.state.finish_run(self.job, state["run_started_at"])
+        return {"synced": synced, "failed": failed, "watermark": None if failed else state["run_started_at"]}
+
+    async def prune(self) -> int:
+        """Delete Weaviate objects whose article no longer exists in MongoDB (deletes the CDC consumer missed)."""
+        def read_ids() -> List[str]:
+            return [obj.properties.get("mongoId") for obj in self.handle.collection.iterator(return_properties=["mongoId"])]
+
+        weaviate_ids = [mongo_id for mongo_id in await self.executor.run(read_ids) if mongo_id]
+        removed = 0
+        for start in range(0, len(weaviate_ids), self.batch_size):
+            chunk = weaviate_ids[start:start + self.batch_size]
+            live = await self.rss_repository.get_by_ids(chunk, {"_id": 1})
+            live_ids = {doc["_id"] for doc in live}
+            removed += await self.executor.run(self._prune_chunk, chunk, live_ids)
+        logger.info(f"[SYNC] Pruned {removed} orphaned objects")
+        return removed
+
+    async def reset(self):
+        """Forget the watermark and any unfinished run."""
+        await self.state.reset(self.job)
@@ -3,27 +3,63 @@ News RAG (Retrieval-Augmented Generation) Service
 Handles querying news from Weaviate and generating contextual responses using LLM.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime, timedelta
-from app.Database.weaviate_client import WeaviateClient
+from app.Database.weaviate_client import WeaviateRegistry
+from app.Database.weaviate_async import AsyncWeaviateQuery
 from app.Database.repositories.rss_repository import RSSRepository
+from app.services.news.retrieval_cache import RetrievalCache
+from app.services.news.bm25_index import BM25NewsIndex
 from app.llm.LLMFactory import LLMFactory
 from app.utils.query_classifier import QueryClassifier
+from app.utils.passages import PASSAGE_COLLECTION
+from app.utils.pagination import (
+    InvalidCursorError, decode_cursor, encode_cursor, mongo_projection,
+    project, resolve_fields, weaviate_return_properties
+)
 from weaviate.classes.query import Filter
+import os
+import asyncio
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# CSE-style tickers: JKH, COMB.N0000, HNB.X0000
+TICKER_PATTERN = re.compile(r"\b[A-Z]{2,5}(?:\.[NXRW]\d{4})?\b")
+
+# Parent articles of passage hits; their full text is not needed for the prompt
+PASSAGE_PARENT_PROJECTION = {"title": 1, "summary": 1, "link": 1, "published": 1, "sentiment": 1, "score": 1}
+
 
 class NewsRAGService:
     """Service for RAG-based news querying and response generation."""
     
     def __init__(self):
-        self.weaviate_client = WeaviateClient(collection_name="RSSNews")
+        # Per-collection handles on the shared Weaviate connection
+        self.weaviate_registry = WeaviateRegistry()
+        self.weaviate_client = self.weaviate_registry.collection("RSSNews")
+        self.passage_collection = self.weaviate_registry.collection(PASSAGE_COLLECTION)
+        # Non-blocking access to RSSNews queries (runs in the bounded Weaviate executor)
+        self.news_query = AsyncWeaviateQuery(lambda: self.weaviate_client.collection)
+        # Passage-level index (RSSNewsPassage): overlapping passages linked to their article by mongoId
+        self.passage_query = AsyncWeaviateQuery(lambda: self.passage_collection.collection)
+        self.passage_retrieval = os.getenv("NEWS_PASSAGE_RETRIEVAL", "true").lower() == "true"
+        self.passages_per_article = int(os.getenv("NEWS_PASSAGES_PER_ARTICLE", "2"))
         self.rss_repository = RSSRepository()
+        self.retrieval_cache = RetrievalCache()
+        self.news_index = BM25NewsIndex()
         self.llm_provider = LLMFactory.get_provider("ollama")
         self.llm = self.llm_provider.get_llm()
         self.query_classifier = QueryClassifier()
+        # Hedged retrieval: start the lexical fallback if Weaviate is slow, first usable answer wins
+        self.hedge_enabled = os.getenv("NEWS_HEDGED_RETRIEVAL", "true").lower() == "true"
+        self.hedge_delay = int(os.getenv("NEWS_HEDGE_DELAY_MS", "1500")) / 1000
+        self.retrieval_deadline = int(os.getenv("NEWS_RETRIEVAL_DEADLINE_MS", "8000")) / 1000
+        self.hedge_min_results = int(os.getenv("NEWS_HEDGE_MIN_RESULTS", "1"))
+        self._hedge_stats = {"hedged": 0, "weaviate_wins": 0, "fallback_wins": 0, "deadline_misses": 0}
+        # LLM generations allowed in flight per batch request
+        self.batch_generation_concurrency = int(os.getenv("NEWS_BATCH_GENERATION_CONCURRENCY", "2"))
         self._ensure_connected()
     
     def _ensure_connected(self):
@@ -70,6 +106,63 @@ class NewsRAGService:
         # No time filter detected
         return None
     
+    @staticmethod
+    def _build_filters(sentiment_filter: Optional[str] = None, date_from: Optional[datetime] = None):
+        """Build the Weaviate filter for sentiment and date constraints (None if unfiltered)."""
+        filter_conditions = []
+        
+        if sentiment_filter:
+            filter_conditions.append(
+                Filter.by_property("sentiment").equal(sentiment_filter)
+            )
+        
+        if date_from:
+            filter_conditions.append(
+                Filter.by_property("published").greater_or_equal(date_from)
+            )
+        
+        if not filter_conditions:
+            return None
+        
+        # Combine filters with AND
+        if len(filter_conditions) == 1:
+            return filter_conditions[0]
+        return Filter.all_of(filter_conditions)
+    
+    @staticmethod
+    def _format_weaviate_object(obj) -> Dict[str, Any]:
+        """Convert a Weaviate RSSNews object into the common news result shape."""
+        return {
+            "id": str(obj.uuid),
+            "mongoId": obj.properties.get("mongoId"),
+            "title": obj.properties.get("title"),
+            "content": obj.properties.get("content"),
+            "clean_text": obj.properties.get("clean_text"),
+            "summary": obj.properties.get("summary"),
+            "link": obj.properties.get("link"),
+            "published": obj.properties.get("published"),
+            "sentiment": obj.properties.get("sentiment"),
+            "score": obj.properties.get("score"),
+            "relevance_score": obj.metadata.score if hasattr(obj.metadata, 'score') else None
+        }
+    
+    @staticmethod
+    def _format_mongo_article(article: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a MongoDB rss_news document into the common news result shape."""
+        return {
+            "id": article.get("_id"),
+            "mongoId": article.get("_id"),
+            "title": article.get("title", "No title"),
+            "content": article.get("content", ""),
+            "clean_text": article.get("clean_text", ""),
+            "summary": article.get("summary", ""),
+            "link": article.get("link", ""),
+            "published": article.get("published", ""),
+            "sentiment": article.get("sentiment", "neutral"),
+            "score": article.get("score", 0),
+            "relevance_score": None
+        }
+    
     async def search_news_by_text(
         self,
         query: str,
@@ -77,6 +170,44 @@ class NewsRAGService:
         sentiment_filter: Optional[str] = None,
         date_from: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
+        """
+        Search news using text-based semantic search, served from the retrieval cache when possible.
+        
+        Args:
+            query: Natural language search query
+            limit: Maximum number of results
+            sentiment_filter: Filter by sentiment (positive, negative, neutral)
+            date_from: Only return news after this date
+            
+        Returns:
+            List of news articles with metadata
+        """
+        if not self.retrieval_cache.enabled:
+            results, _ = await self._search_news_uncached(query, limit, sentiment_filter, date_from)
+            return results
+        
+        # Query with the bucketed date so every request sharing the key sees the same results
+        date_from = self.retrieval_cache.bucket_date(date_from)
+        key = self.retrieval_cache.make_key(query, limit, sentiment_filter, date_from)
+        
+        cached = self.retrieval_cache.get(key)
+        if cached is not None:
+            logger.info(f"Retrieval cache hit for query: '{query}'")
+            return cached
+        
+        results, source = await self._search_news_uncached(query, limit, sentiment_filter, date_from)
+        # Fallback results stand in for a slow or failing Weaviate; keep them only briefly
+        ttl = self.retrieval_cache.fallback_ttl_seconds if source == "fallback" else None
+        self.retrieval_cache.put(key, results, ttl)
+        return results
+    
+    async def _search_news_uncached(
+        self,
+        query: str,
+        limit: int = 5,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
         """
         Search news using text-based semantic search.
         Falls back to MongoDB if Weaviate has no results.
@@ -88,7 +219,8 @@ class NewsRAGService:
             date_from: Only return news after this date
             
         Returns:
-            List of news articles with metadata
+            (news articles with metadata, source): source is "weaviate", "latest"
+            (date-sorted MongoDB listing) or "fallback" (lexical/BM25 fallback)
         """
         try:
             query_lower = query.lower()
@@ -103,85 +235,293 @@ class NewsRAGService:
             # For generic latest news requests, go straight to MongoDB sorted by date
             if is_generic_latest or (len(query.split()) <= 5 and 'latest' in query_lower):
                 logger.info(f"Detected generic latest news query, using MongoDB with date sort")
-                return await self._get_latest_from_mongodb(limit, sentiment_filter, date_from)
+                return await self._get_latest_from_mongodb(limit, sentiment_filter, date_from), "latest"
             
-            collection = self.weaviate_client.collection
+            # Race the lexical fallback against a slow Weaviate instead of waiting for it
+            if self.hedge_enabled:
+                return await self._hedged_search(query, limit, sentiment_filter, date_from)
             
-            # Build filters
-            filters = None
-            if sentiment_filter or date_from:
-                filter_conditions = []
-                
-                if sentiment_filter:
-                    filter_conditions.append(
-                        Filter.by_property("sentiment").equal(sentiment_filter)
-                    )
-                
-                if date_from:
-                    filter_conditions.append(
-                        Filter.by_property("published").greater_or_equal(date_from)
-                    )
-                
-                # Combine filters with AND
-                if len(filter_conditions) == 1:
-                    filters = filter_conditions[0]
-                else:
-                    filters = Filter.all_of(filter_conditions)
-            
-            # Perform hybrid search with optimized settings for speed
-            logger.info(f"Searching Weaviate with query: '{query}', limit: {limit}")
-            
-            response = collection.query.hybrid(
-                query=query,
-                limit=limit,
-                filters=filters,
-                return_metadata=["score"],
-                alpha=0.75  # Favor vector search (0.5 = balanced, 1.0 = pure vector)
-            )
-            
-            results = []
-            for obj in response.objects:
-                results.append({
-                    "id": str(obj.uuid),
-                    "mongoId": obj.properties.get("mongoId"),
-                    "title": obj.properties.get("title"),
-                    "content": obj.properties.get("content"),
-                    "clean_text": obj.properties.get("clean_text"),
-                    "summary": obj.properties.get("summary"),
-                    "link": obj.properties.get("link"),
-                    "published": obj.properties.get("published"),
-                    "sentiment": obj.properties.get("sentiment"),
-                    "score": obj.properties.get("score"),
-                    "relevance_score": obj.metadata.score if hasattr(obj.metadata, 'score') else None
-                })
+            results = await self._search_weaviate(query, limit, sentiment_filter, date_from)
             
             if results:
                 logger.info(f"Found {len(results)} news articles in Weaviate")
-                return results
+                return results, "weaviate"
             
             # Fallback to MongoDB if Weaviate has no results
             logger.warning("No results from Weaviate, falling back to MongoDB")
             try:
-                mongo_results = await self._search_mongodb(query, limit, sentiment_filter, date_from)
+                mongo_results = await self._lexical_fallback(query, limit, sentiment_filter, date_from)
                 if mongo_results:
                     logger.info(f"MongoDB fallback successful: {len(mongo_results)} articles")
-                    return mongo_results
+                    return mongo_results, "fallback"
                 else:
                     logger.warning("MongoDB also returned no results")
-                    return []
+                    return [], "fallback"
             except Exception as mongo_err:
                 logger.error(f"MongoDB fallback failed: {mongo_err}", exc_info=True)
-                return []
+                return [], "fallback"
             
         except Exception as e:
             logger.error(f"Error searching Weaviate, falling back to MongoDB: {e}", exc_info=True)
             try:
-                mongo_results = await self._search_mongodb(query, limit, sentiment_filter, date_from)
+                mongo_results = await self._lexical_fallback(query, limit, sentiment_filter, date_from)
                 logger.info(f"MongoDB fallback successful: {len(mongo_results)} articles")
-                return mongo_results
+                return mongo_results, "fallback"
             except Exception as mongo_err:
                 logger.error(f"MongoDB fallback also failed: {mongo_err}", exc_info=True)
-                return []
+                return [], "fallback"
+    
+    async def search_passages(
+        self,
+        query: str,
+        limit: int = 5,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        hydrate: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the passage index and group the best passages per article.
+        
+        Args:
+            query: Natural language search query
+            limit: Maximum number of articles
+            sentiment_filter: Filter by sentiment (positive, negative, neutral)
+            date_from: Only return news after this date
+            hydrate: Load the parent articles from MongoDB; when False, return
+                     the hits only (`mongoId`, `relevance_score`, `passages`)
+            
+        Returns:
+            Articles ranked by their best passage, each with a `passages` list
+            (up to NEWS_PASSAGES_PER_ARTICLE, in reading order). Empty if the
+            passage collection is missing or has no match.
+        """
+        try:
+            response = await self.passage_query.hybrid(
+                query=query,
+                # Over-fetch: several top passages usually come from the same article
+                limit=limit * max(4, self.passages_per_article * 2),
+                filters=self._build_filters(sentiment_filter, date_from),
+                return_properties=["mongoId", "passage_index", "text"],
+                return_metadata=["score"],
+                alpha=0.75
+            )
+        except Exception as e:
+            logger.warning(f"Passage search unavailable, using article search: {e}")
+            return []
+        
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for obj in response.objects:
+            mongo_id = obj.properties.get("mongoId")
+            if not mongo_id:
+                continue
+            group = grouped.get(mongo_id)
+            if group is None:
+                if len(grouped) >= limit:
+                    continue
+                group = grouped[mongo_id] = {"score": obj.metadata.score, "passages": []}
+            if len(group["passages"]) < self.passages_per_article:
+                group["passages"].append((obj.properties.get("passage_index", 0), obj.properties.get("text", "")))
+        
+        if not grouped:
+            return []
+        
+        hits = [
+            {"mongoId": mongo_id, "relevance_score": group["score"],
+             "passages": [text for _, text in sorted(group["passages"])]}
+            for mongo_id, group in grouped.items()
+        ]
+        if not hydrate:
+            return hits
+        
+        results = self._attach_parents(hits, await self._load_parents([hit["mongoId"] for hit in hits]))
+        logger.info(f"Passage search returned {len(results)} articles for query: '{query}'")
+        return results
+    
+    async def _load_parents(self, mongo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load passage parent articles with one MongoDB query, keyed by mongoId."""
+        articles = await self.rss_repository.get_by_ids(mongo_ids, PASSAGE_PARENT_PROJECTION)
+        return {article["_id"]: self._format_mongo_article(article) for article in articles}
+    
+    @staticmethod
+    def _attach_parents(hits: List[Dict[str, Any]], parents: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Passage hits as articles, in rank order; hits whose article is gone are dropped."""
+        return [
+            {**parents[hit["mongoId"]], "relevance_score": hit["relevance_score"], "passages": hit["passages"]}
+            for hit in hits if hit["mongoId"] in parents
+        ]
+    
+    @staticmethod
+    def _is_passage_hit(item: Dict[str, Any]) -> bool:
+        """True for a passage hit returned with `hydrate=False` (no article fields loaded yet)."""
+        return "title" not in item
+    
+    async def _search_weaviate(
+        self,
+        query: str,
+        limit: int,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Primary retrieval: Weaviate hybrid search, fused with BM25 for ticker queries."""
+        # Build filters
+        filters = self._build_filters(sentiment_filter, date_from)
+        
+        # Perform hybrid search with optimized settings for speed
+        logger.info(f"Searching Weaviate with query: '{query}', limit: {limit}")
+        
+        response = await self.news_query.hybrid(
+            query=query,
+            limit=limit,
+            filters=filters,
+            return_metadata=["score"],
+            alpha=0.75  # Favor vector search (0.5 = balanced, 1.0 = pure vector)
+        )
+        
+        results = [self._format_weaviate_object(obj) for obj in response.objects]
+        
+        # Exact ticker/company queries also get a lexical leg from the BM25 index
+        if self.news_index.ready and self.news_index.lexical_leg and self._is_ticker_query(query):
+            lexical = await self._search_bm25(query, limit, sentiment_filter, date_from)
+            results = self._fuse_rankings(results, lexical, limit)
+        
+        return results
+    
+    async def _hedged_search(
+        self,
+        query: str,
+        limit: int,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Hedged retrieval: start Weaviate, and if it has not answered within the
+        hedge delay (or fails / comes back short), start the lexical fallback
+        alongside it. The first result set with at least `hedge_min_results`
+        articles wins and the other request is cancelled.
+        
+        Returns the results with the leg that produced them ("weaviate" or
+        "fallback"); the largest result set seen if nothing qualifies before the deadline.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        hedge_at = started + self.hedge_delay
+        deadline = started + self.retrieval_deadline
+        min_results = max(1, min(limit, self.hedge_min_results))
+        
+        primary = asyncio.create_task(self._search_weaviate(query, limit, sentiment_filter, date_from))
+        fallback: Optional[asyncio.Task] = None
+        pending = {primary}
+        best: List[Dict[str, Any]] = []
+        best_leg = "fallback"
+        
+        try:
+            while pending:
+                wake_at = deadline if fallback is not None else min(hedge_at, deadline)
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, wake_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                # Weaviate first: when both finish together, keep the primary ranking
+                for task in sorted(done, key=lambda t: t is not primary):
+                    leg = "weaviate" if task is primary else "fallback"
+                    try:
+                        results = task.result()
+                    except Exception as e:
+                        logger.warning(f"[HEDGE] {leg} retrieval failed: {e}")
+                        continue
+                    if len(results) >= min_results:
+                        self._hedge_stats[f"{leg}_wins"] += 1
+                        logger.info(f"[HEDGE] {leg} won with {len(results)} articles after {(loop.time() - started) * 1000:.0f}ms")
+                        return results, leg
+                    if len(results) > len(best):
+                        best, best_leg = results, leg
+                
+                if fallback is None and (primary.done() or loop.time() >= hedge_at):
+                    if not primary.done():
+                        self._hedge_stats["hedged"] += 1
+                        logger.info(f"[HEDGE] Weaviate slower than {self.hedge_delay * 1000:.0f}ms, starting fallback")
+                    fallback = asyncio.create_task(self._lexical_fallback(query, limit, sentiment_filter, date_from))
+                    pending.add(fallback)
+                
+                if loop.time() >= deadline:
+                    self._hedge_stats["deadline_misses"] += 1
+                    logger.warning(f"[HEDGE] Retrieval deadline of {self.retrieval_deadline * 1000:.0f}ms reached")
+                    break
+            
+            return best, best_leg
+        finally:
+            # A cancelled Weaviate call stops being awaited; its executor thread finishes on its own
+            for task in (primary, fallback):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    def hedge_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.hedge_enabled,
+            "hedge_delay_ms": int(self.hedge_delay * 1000),
+            "deadline_ms": int(self.retrieval_deadline * 1000),
+            "min_results": self.hedge_min_results,
+            **self._hedge_stats
+        }
+    
+    @staticmethod
+    def _is_ticker_query(query: str) -> bool:
+        """True for queries naming a CSE ticker (JKH, COMB.N0000) where exact terms matter."""
+        return bool(TICKER_PATTERN.search(query))
+    
+    @staticmethod
+    def _fuse_rankings(primary: List[Dict[str, Any]], secondary: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """Merge two ranked result lists with reciprocal rank fusion, keyed by mongoId."""
+        scores: Dict[str, float] = {}
+        articles: Dict[str, Dict[str, Any]] = {}
+        for ranking in (primary, secondary):
+            for rank, article in enumerate(ranking):
+                key = str(article.get("mongoId") or article.get("id"))
+                scores[key] = scores.get(key, 0.0) + 1.0 / (60 + rank)
+                articles.setdefault(key, article)
+        ordered = sorted(scores, key=scores.get, reverse=True)
+        return [articles[key] for key in ordered[:limit]]
+    
+    async def _search_bm25(
+        self,
+        query: str,
+        limit: int,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank articles with the in-process BM25 index and load them from MongoDB by id.
+        """
+        hits = self.news_index.search(query, limit, sentiment_filter, date_from)
+        if not hits:
+            return []
+        
+        scores = dict(hits)
+        articles = await self.rss_repository.get_by_ids([mongo_id for mongo_id, _ in hits])
+        results = []
+        for article in articles:
+            formatted = self._format_mongo_article(article)
+            formatted["relevance_score"] = round(scores.get(article["_id"], 0.0), 4)
+            results.append(formatted)
+        return results
+    
+    async def _lexical_fallback(
+        self,
+        query: str,
+        limit: int,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Weaviate-independent search: BM25 index first, then MongoDB text/regex search."""
+        if self.news_index.ready:
+            try:
+                results = await self._search_bm25(query, limit, sentiment_filter, date_from)
+                if results:
+                    logger.info(f"BM25 fallback returned {len(results)} articles")
+                    return results
+            except Exception as e:
+                logger.warning(f"BM25 fallback failed, using MongoDB search: {e}")
+        return await self._search_mongodb(query, limit, sentiment_filter, date_from)
     
     async def _search_mongodb(
         self, 
@@ -221,21 +561,23 @@ class NewsRAGService:
                 # Build MongoDB filter for specific topic search
                 filter_dict = {}
                 
-                # Text search in title and content
-                if query:
-                    filter_dict["$or"] = [
-                        {"title": {"$regex": query, "$options": "i"}},
-                        {"content": {"$regex": query, "$options": "i"}}
-                    ]
-                
                 if sentiment_filter:
                     filter_dict["sentiment"] = sentiment_filter
                 
                 if date_from:
                     filter_dict["published"] = {"$gte": date_from}
                 
-                # Use the repository to search
-                articles = await self.rss_repository.find_by_filter(filter_dict, limit)
+                # Ranked full-text search on the weighted text index
+                articles = await self.rss_repository.search_text(query, limit, filter_dict) if query else []
+                
+                # Last resort: unanchored regex scan over title and content
+                if not articles:
+                    if query:
+                        filter_dict["$or"] = [
+                            {"title": {"$regex": query, "$options": "i"}},
+                            {"content": {"$regex": query, "$options": "i"}}
+                        ]
+                    articles = await self.rss_repository.find_by_filter(filter_dict, limit)
             
             # Format results to match Weaviate structure
             formatted = []
@@ -286,23 +628,7 @@ class NewsRAGService:
                 articles = [a for a in articles if a.get('sentiment') == sentiment_filter]
             
             # Format results
-            formatted = []
-            for article in articles:
-                if "error" in article:
-                    continue
-                formatted.append({
-                    "id": article.get("_id"),
-                    "mongoId": article.get("_id"),
-                    "title": article.get("title", "No title"),
-                    "content": article.get("content", ""),
-                    "clean_text": article.get("clean_text", ""),
-                    "summary": article.get("summary", ""),
-                    "link": article.get("link", ""),
-                    "published": article.get("published", ""),
-                    "sentiment": article.get("sentiment", "neutral"),
-                    "score": article.get("score", 0),
-                    "relevance_score": None
-                })
+            formatted = [self._format_mongo_article(a) for a in articles if "error" not in a]
             
             logger.info(f"Retrieved {len(formatted)} latest articles from MongoDB")
             return formatted
@@ -311,6 +637,167 @@ class NewsRAGService:
             logger.error(f"Error getting latest from MongoDB: {e}", exc_info=True)
             return []
     
+    async def search_news_page(
+        self,
+        query: str,
+        limit: int = 10,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Cursor-paginated, field-projected variant of `search_news_by_text`.
+        
+        Weaviate pages are ordered by relevance and continue from the offset and
+        (score, uuid) of the last result. MongoDB pages (generic "latest" queries
+        and the fallback) are ordered by (published, _id) and use keyset paging.
+        
+        Args:
+            query: Natural language search query
+            limit: Page size
+            sentiment_filter: Filter by sentiment (positive, negative, neutral)
+            date_from: Only return news after this date
+            fields: Result fields to return (all when omitted)
+            cursor: Opaque cursor from a previous page's `next_cursor`
+            
+        Returns:
+            Dict with `results` and `next_cursor` (None on the last page)
+        """
+        fields = resolve_fields(fields)
+        state = decode_cursor(cursor) if cursor else None
+        
+        query_lower = query.lower()
+        is_generic_latest = any(keyword in query_lower for keyword in [
+            'latest news', 'recent news', 'newest news', 'new news',
+            "what's new", 'whats new', 'current news',
+            'latest articles', 'recent articles'
+        ]) or (len(query.split()) <= 5 and 'latest' in query_lower)
+        
+        if is_generic_latest:
+            return await self._mongo_page({}, limit, sentiment_filter, date_from, fields, state)
+        if state and state["src"] == "mongo":
+            return await self._mongo_page(self.rss_repository.text_filter(query), limit, sentiment_filter, date_from, fields, state)
+        
+        try:
+            page = await self._weaviate_page(query, limit, sentiment_filter, date_from, fields, state)
+            if page["results"] or state:
+                return page
+            logger.warning("No results from Weaviate, falling back to MongoDB page")
+        except Exception as e:
+            if state:
+                raise
+            logger.error(f"Error paging Weaviate, falling back to MongoDB: {e}", exc_info=True)
+        
+        return await self._mongo_page(self.rss_repository.text_filter(query), limit, sentiment_filter, date_from, fields, None)
+    
+    async def get_latest_page(
+        self,
+        limit: int = 10,
+        sentiment_filter: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cursor-paginated, field-projected latest news from MongoDB (newest first)."""
+        fields = resolve_fields(fields)
+        state = decode_cursor(cursor) if cursor else None
+        if state and state["src"] != "mongo":
+            raise InvalidCursorError("Cursor does not belong to the latest news listing")
+        return await self._mongo_page({}, limit, sentiment_filter, date_from, fields, state)
+    
+    async def _weaviate_page(
+        self,
+        query: str,
+        limit: int,
+        sentiment_filter: Optional[str],
+        date_from: Optional[datetime],
+        fields: List[str],
+        state: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Fetch one relevance-ordered page from Weaviate."""
+        offset = state.get("o", 0) if state else 0
+        
+        response = await self.news_query.hybrid(
+            query=query,
+            limit=limit + 1,
+            offset=offset,
+            filters=self._build_filters(sentiment_filter, date_from),
+            return_properties=weaviate_return_properties(fields),
+            return_metadata=["score"],
+            alpha=0.75
+        )
+        
+        has_more = len(response.objects) > limit
+        page_objects = response.objects[:limit]
+        
+        # Skip anything the previous page already returned if rankings shifted
+        objects = page_objects
+        if state:
+            last_score, last_id = state.get("s"), state.get("id")
+            objects = [
+                obj for obj in page_objects
+                if str(obj.uuid) != last_id
+                and (last_score is None or obj.metadata.score is None or obj.metadata.score <= last_score)
+            ]
+        
+        results = [project(self._format_weaviate_object(obj), fields) for obj in objects]
+        
+        next_cursor = None
+        if has_more and page_objects:
+            last = page_objects[-1]
+            next_cursor = encode_cursor({
+                "src": "weaviate",
+                "o": offset + limit,
+                "s": last.metadata.score,
+                "id": str(last.uuid)
+            })
+        
+        return {"results": results, "next_cursor": next_cursor}
+    
+    async def _mongo_page(
+        self,
+        filter_dict: Dict[str, Any],
+        limit: int,
+        sentiment_filter: Optional[str],
+        date_from: Optional[datetime],
+        fields: List[str],
+        state: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Fetch one (published, _id)-ordered page from MongoDB."""
+        filter_dict = dict(filter_dict)
+        if sentiment_filter:
+            filter_dict["sentiment"] = sentiment_filter
+        if date_from:
+            filter_dict["published"] = {"$gte": date_from}
+        
+        after = None
+        if state:
+            after = (datetime.fromisoformat(state["p"]), state["id"])
+        
+        articles = await self.rss_repository.find_by_filter(
+            filter_dict,
+            limit + 1,
+            projection=mongo_projection(fields),
+            after=after
+        )
+        articles = [a for a in articles if "error" not in a]
+        
+        has_more = len(articles) > limit
+        articles = articles[:limit]
+        results = [project(self._format_mongo_article(a), fields) for a in articles]
+        
+        next_cursor = None
+        if has_more and articles and isinstance(articles[-1].get("published"), datetime):
+            last = articles[-1]
+            next_cursor = encode_cursor({
+                "src": "mongo",
+                "p": last["published"].isoformat(),
+                "id": last["_id"]
+            })
+        
+        return {"results": results, "next_cursor": next_cursor}
+    
     async def get_trending_topics(self, days: int = 7, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get trending news from the last N days sorted by sentiment score.
@@ -323,12 +810,11 @@ class NewsRAGService:
             List of trending news articles
         """
         try:
-            collection = self.weaviate_client.collection
             date_from = datetime.utcnow() - timedelta(days=days)
             
             logger.info(f"Getting trending topics from last {days} days")
             
-            response = collection.query.fetch_objects(
+            response = await self.news_query.fetch_objects(
                 filters=Filter.by_property("published").greater_or_equal(date_from),
                 limit=limit
             )
@@ -355,6 +841,221 @@ class NewsRAGService:
             logger.error(f"Error getting trending topics: {e}", exc_info=True)
             return []
     
+    @staticmethod
+    def _direct_response(classification: str, direct_response: str) -> Dict[str, Any]:
+        """Response for greetings and out-of-scope queries (no retrieval)."""
+        return {
+            "answer": direct_response,
+            "sources": [],
+            "context_used": 0,
+            "timestamp": datetime.utcnow().isoformat(),
+            "metadata": {
+                "classification": classification,
+                "direct_response": True,
+                "articles_retrieved": False
+            }
+        }
+    
+    @staticmethod
+    def _no_articles_response() -> Dict[str, Any]:
+        return {
+            "answer": "I couldn't find any relevant news articles to answer your question. This could mean there are no articles in the database yet. Please try asking about a different topic or check back later.",
+            "sources": [],
+            "context_used": 0
+        }
+    
+    @staticmethod
+    def _error_response(error: Exception) -> Dict[str, Any]:
+        return {
+            "answer": f"I encountered an error while processing your question: {str(error)}",
+            "sources": [],
+            "context_used": 0,
+            "error": str(error)
+        }
+    
+    async def _retrieve_for_question(
+        self,
+        question: str,
+        context_limit: int,
+        hydrate: bool = True
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[datetime]]:
+        """
+        Retrieve context articles for a question, widening the date range when nothing is found.
+        
+        Args:
+            hydrate: Load passage parents from MongoDB; when False, passage
+                     results are hits for the caller to load (see `search_passages`)
+        
+        Returns:
+            (articles, date range description, date filter detected from the question)
+        """
+        # Detect time-based filters from question
+        date_filter = self._detect_time_filter(question)
+        
+        # Check if this is a generic "latest news" query
+        question_lower = question.lower()
+        is_generic_latest = any(keyword in question_lower for keyword in [
+            'latest news', 'recent news', 'newest news', 'new news',
+            "what's new", 'whats new', 'current news'
+        ])
+        
+        # Passages answer specific questions better; "latest news" stays a date-sorted article query
+        use_passages = self.passage_retrieval and not is_generic_latest
+        
+        news_articles = await self._retrieve_context(question, context_limit, date_filter, use_passages, hydrate)
+        
+        # Fallback mechanism: If no results and not a generic latest query, try broader search
+        date_range_used = "the past 7 days" if date_filter and (datetime.utcnow() - date_filter).days <= 7 else None
+        
+        if not news_articles and date_filter and not is_generic_latest:
+            logger.warning(f"No articles found with original date filter. Trying fallback...")
+            
+            # Fallback 1: Try last 14 days
+            fallback_filter = datetime.utcnow() - timedelta(days=14)
+            logger.info(f"Fallback: Searching last 14 days...")
+            news_articles = await self._retrieve_context(question, context_limit, fallback_filter, use_passages, hydrate)
+            date_range_used = "the past 14 days"
+            
+            # Fallback 2: Try last 30 days
+            if not news_articles:
+                fallback_filter = datetime.utcnow() - timedelta(days=30)
+                logger.info(f"Fallback: Searching last 30 days...")
+                news_articles = await self._retrieve_context(question, context_limit, fallback_filter, use_passages, hydrate)
+                date_range_used = "the past 30 days"
+            
+            # Fallback 3: Try all time
+            if not news_articles:
+                logger.info(f"Fallback: Searching all articles (no date filter)...")
+                news_articles = await self._retrieve_context(question, context_limit, None, use_passages, hydrate)
+                date_range_used = "available news archives"
+        
+        return news_articles, date_range_used, date_filter
+    
+    async def _retrieve_context(
+        self,
+        question: str,
+        limit: int,
+        date_from: Optional[datetime],
+        use_passages: bool,
+        hydrate: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Passage-level retrieval when enabled and populated, whole-article search otherwise."""
+        if use_passages:
+            articles = await self.search_passages(question, limit, date_from=date_from, hydrate=hydrate)
+            if articles:
+                return articles
+        return await self.search_news_by_text(query=question, limit=limit, date_from=date_from)
+    
+    @staticmethod
+    def _article_snippet(article: Dict[str, Any]) -> str:
+        """Context text for one article: title, date and its matching passages (or the first 300 characters)."""
+        if article.get('passages'):
+            # Passage hits carry the relevant part of the article, wherever it sits
+            content = " ... ".join(article['passages'])
+        else:
+            # Use clean_text or content for better context
+            content = article.get('clean_text', article.get('content', ''))
+            if not content:
+                content = article.get('summary', '')
+            
+            # Truncate to 300 chars for better context
+            content = content[:300] + '...' if len(content) > 300 else content
+        
+        # Include publication date for context
+        pub_date = article.get('published', 'Unknown date')
+        return f"Title: {article['title']}\nDate: {pub_date}\nContent: {content}\n"
+    
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        return str(article.get("mongoId") or article.get("id") or article.get("link"))
+    
+    def _build_answer_prompt(
+        self,
+        question: str,
+        news_articles: List[Dict[str, Any]],
+        date_range_used: Optional[str],
+        original_filter: Optional[datetime],
+        snippets: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Build the grounded answer prompt.
+        
+        Args:
+            snippets: Optional article key -> snippet map shared across questions,
+                      so each article's context text is built only once per batch
+        """
+        context_parts = []
+        for idx, article in enumerate(news_articles, 1):
+            # Passage snippets depend on the question, so only whole-article snippets are shared
+            if snippets is None or article.get("passages"):
+                snippet = self._article_snippet(article)
+            else:
+                key = self._article_key(article)
+                snippet = snippets.get(key)
+                if snippet is None:
+                    snippet = snippets[key] = self._article_snippet(article)
+            context_parts.append(f"[Article {idx}]\n{snippet}")
+        
+        context = "\n".join(context_parts)
+        
+        # Add note about date range if fallback was used
+        date_note = ""
+        if date_range_used and original_filter:
+            if date_range_used != "today":
+                date_note = f"\n\nNOTE: The user asked about recent/today's news, but no articles were found for today. These articles are from {date_range_used}."
+        
+        return f"""You are a news assistant. Answer the user's question using ONLY the information from the news articles provided below. 
+
+STRICT RULES:
+- Use ONLY the information from the articles below
+- Do NOT use your general knowledge or training data
+- If the articles don't contain information to answer the question, say "I don't have information about this in the recent news articles."
+- Do NOT mention Bitcoin, cryptocurrency, or any other topics not present in the articles
+- Be concise and factual
+- Cite article numbers when referencing information (e.g., "According to Article 1...")
+{date_note}
+
+NEWS ARTICLES:
+{context}
+
+USER QUESTION: {question}
+
+ANSWER (based only on the articles above):"""
+    
+    @staticmethod
+    def _build_answer_response(
+        answer: str,
+        news_articles: List[Dict[str, Any]],
+        date_range_used: Optional[str],
+        include_sources: bool
+    ) -> Dict[str, Any]:
+        response = {
+            "answer": answer,
+            "context_used": len(news_articles),
+            "timestamp": datetime.utcnow().isoformat(),
+            "date_range_used": date_range_used,  # Inform user about the actual date range
+            "metadata": {
+                "classification": "in_scope",
+                "direct_response": False,
+                "articles_retrieved": True
+            }
+        }
+        
+        if include_sources:
+            response["sources"] = [
+                {
+                    "title": article["title"],
+                    "summary": article["summary"],
+                    "link": article["link"],
+                    "published": article["published"],
+                    "sentiment": article["sentiment"],
+                    "relevance_score": article.get("relevance_score")
+                }
+                for article in news_articles
+            ]
+        
+        return response
+    
     async def answer_question(
         self,
         question: str,
@@ -382,167 +1083,143 @@ class NewsRAGService:
             # If it's a greeting or out-of-scope, return direct response without retrieval
             if classification in ['greeting', 'out_of_scope']:
                 logger.info(f"Query classified as '{classification}', returning direct response without article retrieval")
-                return {
-                    "answer": direct_response,
-                    "sources": [],
-                    "context_used": 0,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "metadata": {
-                        "classification": classification,
-                        "direct_response": True,
-                        "articles_retrieved": False
-                    }
-                }
+                return self._direct_response(classification, direct_response)
             
             # If in-scope, proceed with normal RAG flow
             logger.info(f"Query classified as 'in_scope', proceeding with RAG retrieval")
             
-            # Detect time-based filters from question
-            date_filter = self._detect_time_filter(question)
-            original_filter = date_filter
-            
-            # Check if this is a generic "latest news" query
-            question_lower = question.lower()
-            is_generic_latest = any(keyword in question_lower for keyword in [
-                'latest news', 'recent news', 'newest news', 'new news',
-                "what's new", 'whats new', 'current news'
-            ])
-            
             # Step 1: Retrieve relevant news articles
-            news_articles = await self.search_news_by_text(
-                query=question,
-                limit=context_limit,
-                date_from=date_filter
-            )
-            
-            # Fallback mechanism: If no results and not a generic latest query, try broader search
-            date_range_used = "the past 7 days" if date_filter and (datetime.utcnow() - date_filter).days <= 7 else None
-            
-            if not news_articles and date_filter and not is_generic_latest:
-                logger.warning(f"No articles found with original date filter. Trying fallback...")
-                
-                # Fallback 1: Try last 14 days
-                fallback_filter = datetime.utcnow() - timedelta(days=14)
-                logger.info(f"Fallback: Searching last 14 days...")
-                news_articles = await self.search_news_by_text(
-                    query=question,
-                    limit=context_limit,
-                    date_from=fallback_filter
-                )
-                date_range_used = "the past 14 days"
-                
-                # Fallback 2: Try last 30 days
-                if not news_articles:
-                    fallback_filter = datetime.utcnow() - timedelta(days=30)
-                    logger.info(f"Fallback: Searching last 30 days...")
-                    news_articles = await self.search_news_by_text(
-                        query=question,
-                        limit=context_limit,
-                        date_from=fallback_filter
-                    )
-                    date_range_used = "the past 30 days"
-                
-                # Fallback 3: Try all time
-                if not news_articles:
-                    logger.info(f"Fallback: Searching all articles (no date filter)...")
-                    news_articles = await self.search_news_by_text(
-                        query=question,
-                        limit=context_limit,
-                        date_from=None
-                    )
-                    date_range_used = "available news archives"
+            news_articles, date_range_used, original_filter = await self._retrieve_for_question(question, context_limit)
             
             if not news_articles:
-                return {
-                    "answer": "I couldn't find any relevant news articles to answer your question. This could mean there are no articles in the database yet. Please try asking about a different topic or check back later.",
-                    "sources": [],
-                    "context_used": 0
-                }
-            
-            # Step 2: Build compact context (optimized for speed)
-            context_parts = []
-            for idx, article in enumerate(news_articles, 1):
-                # Use clean_text or content for better context
-                content = article.get('clean_text', article.get('content', ''))
-                if not content:
-                    content = article.get('summary', '')
-                
-                # Truncate to 300 chars for better context
-                content = content[:300] + '...' if len(content) > 300 else content
-                
-                # Include publication date for context
-                pub_date = article.get('published', 'Unknown date')
-                context_parts.append(
-                    f"[Article {idx}]\nTitle: {article['title']}\nDate: {pub_date}\nContent: {content}\n"
-                )
-            
-            context = "\n".join(context_parts)
+                return self._no_articles_response()
             
-            # Add note about date range if fallback was used
-            date_note = ""
-            if date_range_used and original_filter:
-                if date_range_used != "today":
-                    date_note = f"\n\nNOTE: The user asked about recent/today's news, but no articles were found for today. These articles are from {date_range_used}."
-            
-            # Step 3: Generate answer using LLM with strict prompt
-            prompt = f"""You are a news assistant. Answer the user's question using ONLY the information from the news articles provided below. 
-
-STRICT RULES:
-- Use ONLY the information from the articles below
-- Do NOT use your general knowledge or training data
-- If the articles don't contain information to answer the question, say "I don't have information about this in the recent news articles."
-- Do NOT mention Bitcoin, cryptocurrency, or any other topics not present in the articles
-- Be concise and factual
-- Cite article numbers when referencing information (e.g., "According to Article 1...")
-{date_note}
-
-NEWS ARTICLES:
-{context}
-
-USER QUESTION: {question}
-
-ANSWER (based only on the articles above):"""
+            # Step 2-3: Build compact context and generate answer using LLM with strict prompt
+            prompt = self._build_answer_prompt(question, news_articles, date_range_used, original_filter)
             
             logger.info(f"Generating answer with {len(news_articles)} articles as context")
             answer = await self.llm_provider.generate(prompt)
             
             # Step 4: Prepare response
-            response = {
-                "answer": answer,
-                "context_used": len(news_articles),
-                "timestamp": datetime.utcnow().isoformat(),
-                "date_range_used": date_range_used,  # Inform user about the actual date range
-                "metadata": {
-                    "classification": "in_scope",
-                    "direct_response": False,
-                    "articles_retrieved": True
-                }
-            }
-            
-            if include_sources:
-                response["sources"] = [
-                    {
-                        "title": article["title"],
-                        "summary": article["summary"],
-                        "link": article["link"],
-                        "published": article["published"],
-                        "sentiment": article["sentiment"],
-                        "relevance_score": article.get("relevance_score")
-                    }
-                    for article in news_articles
-                ]
+            response = self._build_answer_response(answer, news_articles, date_range_used, include_sources)
             
             logger.info(f"Successfully generated answer with RAG (date range: {date_range_used})")
             return response
             
         except Exception as e:
             logger.error(f"Error answering question: {e}", exc_info=True)
-            return {
-                "answer": f"I encountered an error while processing your question: {str(e)}",
-                "sources": [],
-                "context_used": 0,
-                "error": str(e)
+            return self._error_response(e)
+    
+    async def answer_questions_batch(
+        self,
+        questions: List[str],
+        context_limit: int = 5,
+        include_sources: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Answer several questions, yielding each result as soon as it is ready.
+        
+        Repeated questions are answered once and retrievals run concurrently.
+        Passage retrievals return hits only; once every retrieval is done, the
+        unique parent articles across the batch are loaded with one MongoDB
+        query, reusing articles a whole-article search already returned. Each
+        article's context snippet is built once for the batch, and LLM
+        generations go through a bounded queue (NEWS_BATCH_GENERATION_CONCURRENCY).
+        
+        Args:
+            questions: User questions, in request order
+            context_limit: Number of news articles to use as context per question
+            include_sources: Whether to include source articles in each result
+            
+        Yields:
+            Dicts with the question's `index` and `question` plus the answer_question fields
+        """
+        # Normalized question -> positions in the request
+        positions: Dict[str, List[int]] = {}
+        for index, question in enumerate(questions):
+            positions.setdefault(self.retrieval_cache.normalize_query(question), []).append(index)
+        
+        snippets: Dict[str, str] = {}
+        generation_slots = asyncio.Semaphore(self.batch_generation_concurrency)
+        logger.info(f"Answering batch of {len(questions)} questions ({len(positions)} unique)")
+        
+        def results_for(key: str, result: Dict[str, Any]):
+            return [{"index": index, "question": questions[index], **result} for index in positions[key]]
+        
+        async def retrieve_one(key: str):
+            """(key, final response or None, retrieval) for one unique question."""
+            question = questions[positions[key][0]]
+            try:
+                classification, direct_response = self.query_classifier.classify_query(question)
+                if classification in ['greeting', 'out_of_scope']:
+                    return key, self._direct_response(classification, direct_response), None
+                return key, None, await self._retrieve_for_question(question, context_limit, hydrate=False)
+            except Exception as e:
+                logger.error(f"Error retrieving for batch question '{question}': {e}", exc_info=True)
+                return key, self._error_response(e), None
+        
+        async def answer_one(key: str, news_articles, date_range_used, original_filter) -> Tuple[str, Dict[str, Any]]:
+            question = questions[positions[key][0]]
+            try:
+                if not news_articles:
+                    return key, self._no_articles_response()
+                
+                prompt = self._build_answer_prompt(question, news_articles, date_range_used, original_filter, snippets)
+                async with generation_slots:
+                    answer = await self.llm_provider.generate(prompt)
+                
+                return key, self._build_answer_response(answer, news_articles, date_range_used, include_sources)
+            except Exception as e:
+                logger.error(f"Error answering batch question '{question}': {e}", exc_info=True)
+                return key, self._error_response(e)
+        
+        tasks = [asyncio.create_task(retrieve_one(key)) for key in positions]
+        try:
+            retrievals = {}
+            for next_done in asyncio.as_completed(tasks):
+                key, result, retrieval = await next_done
+                if result is not None:
+                    for line in results_for(key, result):
+                        yield line
+                else:
+                    retrievals[key] = retrieval
+            
+            # Every unique article once: from the searches that returned it, else one load for the batch
+            parents = {
+                str(article["mongoId"]): article
+                for news_articles, _, _ in retrievals.values()
+                for article in news_articles if not self._is_passage_hit(article) and article.get("mongoId")
             }
+            missing = list(dict.fromkeys(
+                article["mongoId"]
+                for news_articles, _, _ in retrievals.values()
+                for article in news_articles if self._is_passage_hit(article) and article["mongoId"] not in parents
+            ))
+            if missing:
+                try:
+                    parents.update(await self._load_parents(missing))
+                except Exception as e:
+                    logger.error(f"Error loading {len(missing)} batch articles: {e}", exc_info=True)
+            logger.info(f"Batch context: {len(parents)} unique articles, {len(missing)} loaded in one query")
+            
+            tasks = []
+            for key, (news_articles, date_range_used, original_filter) in retrievals.items():
+                articles = [
+                    self._attach_parents([article], parents)[0] if self._is_passage_hit(article) else article
+                    for article in news_articles
+                    if not self._is_passage_hit(article) or article["mongoId"] in parents
+                ]
+                tasks.append(asyncio.create_task(answer_one(key, articles, date_range_used, original_filter)))
+            
+            for next_done in asyncio.as_completed(tasks):
+                key, result = await next_done
+                for line in results_for(key, result):
+                    yield line
+        finally:
+            # Client went away mid-stream: stop the remaining work
+            for task in tasks:
+                task.cancel()
+    
     
     async def get_sentiment_summary(self, topic: Optional[str] = None, days: int = 7) -> Dict[str, Any]:
         """
@@ -568,9 +1245,13 @@ ANSWER (based only on the articles above):"""
                     date_from=date_from
                 )
             else:
+                # Overall market sentiment comes straight from the daily rollups
+                rollup_summary = await self._sentiment_summary_from_rollups(days, date_from)
+                if rollup_summary:
+                    return rollup_summary
+
                 # Get all recent articles
-                collection = self.weaviate_client.collection
-                response = collection.query.fetch_objects(
+                response = await self.news_query.fetch_objects(
                     filters=Filter.by_property("published").greater_or_equal(date_from),
                     limit=50
                 )
@@ -633,8 +1314,66 @@ ANSWER (based only on the articles above):"""
                 "message": "Failed to generate sentiment summary"
             }
     
+    async def _sentiment_summary_from_rollups(self, days: int, date_from: datetime) -> Optional[Dict[str, Any]]:
+        """Build the overall sentiment summary from materialized rollups, or None if none exist."""
+        try:
+            buckets = await self.rss_repository.rollups.get_buckets(date_from, datetime.utcnow())
+        except Exception as e:
+            logger.warning(f"Sentiment rollups unavailable, using raw articles: {e}")
+            return None
+        
+        if not buckets:
+            return None
+        
+        sentiments = {}
+        total_score = 0.0
+        total_articles = 0
+        for bucket in buckets:
+            sentiments[bucket["sentiment"]] = sentiments.get(bucket["sentiment"], 0) + bucket["count"]
+            total_score += bucket.get("score_sum", 0.0)
+            total_articles += bucket["count"]
+        
+        avg_score = total_score / total_articles if total_articles else 0
+        dominant_sentiment = max(sentiments, key=sentiments.get) if sentiments else "neutral"
+        
+        summary_text = f"Over the last {days} days, the overall sentiment is **{dominant_sentiment}** "
+        summary_text += f"with an average score of {avg_score:.2f}. "
+        summary_text += f"Analyzed {total_articles} articles."
+        
+        return {
+            "topic": "all",
+            "period_days": days,
+            "total_articles": total_articles,
+            "sentiment_distribution": sentiments,
+            "average_score": round(avg_score, 3),
+            "dominant_sentiment": dominant_sentiment,
+            "summary": summary_text
+        }
+    
+    async def get_sentiment_timeseries(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        source: Optional[str] = None,
+        sentiment: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the daily sentiment series for a date range from the rollup collection.
+        
+        Args:
+            date_from: First day of the range (inclusive)
+            date_to: Last day of the range (inclusive)
+            source: Optional source filter (e.g. 'economynext.com')
+            sentiment: Optional sentiment filter
+            
+        Returns:
+            One entry per day with counts, average score and facets
+        """
+        logger.info(f"Getting sentiment timeseries from {date_from} to {date_to} (source={source}, sentiment={sentiment})")
+        return await self.rss_repository.rollups.get_timeseries(date_from, date_to, source, sentiment)
+    
     def close(self):
-        """Close connections."""
+        """Release the Weaviate handle (the shared connection is closed at shutdown)."""
         if self.weaviate_client:
             self.weaviate_client.close()
-            logger.info("NewsRAGService: Closed connections")
+            logger.info("NewsRAGService: Released Weaviate handle")
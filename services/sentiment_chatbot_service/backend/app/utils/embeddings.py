@@ -0,0 +1,44 @@
+"""
+Embedding Utility
+Matryoshka truncation for nomic-embed-text (v1.5) vectors: the leading
+dimensions carry most of the signal, so a layer-normed prefix re-normalized
+to unit length is a smaller embedding of the same text.
+"""
+
+from typing import List, Optional
+import math
+import os
+
+# 0 keeps the model's full dimension (768 for nomic-embed-text)
+EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "0"))
+
+# Collection metadata keys describing the stored vectors
+DIMENSIONS_KEY = "embedding_dimensions"
+MODEL_KEY = "embedding_model"
+
+
+# Epsilon of nomic's layer norm (torch.nn.functional.layer_norm default)
+LAYER_NORM_EPS = 1e-5
+
+
+def truncate_embedding(vector: List[float], dimensions: Optional[int] = EMBEDDING_DIMENSIONS) -> List[float]:
+    """
+    Matryoshka-truncate a nomic-embed-text v1.5 vector.
+
+    Follows the model's recipe: layer norm (no affine) over the full vector,
+    then keep the first `dimensions` values and re-normalize to unit length.
+    Slicing the raw vector skips the layer norm and loses recall.
+
+    Returns the vector unchanged when `dimensions` is 0/None or not smaller
+    than the vector, so full-size embeddings keep their original values.
+    """
+    if not dimensions or dimensions >= len(vector):
+        return list(vector)
+    mean = sum(vector) / len(vector)
+    variance = sum((v - mean) ** 2 for v in vector) / len(vector)
+    scale = 1.0 / math.sqrt(variance + LAYER_NORM_EPS)
+    head = [(v - mean) * scale for v in vector[:dimensions]]
+    norm = math.sqrt(sum(v * v for v in head))
+    if norm == 0:
+        return head
+    return [v / norm for v in head]
@@ -0,0 +1,85 @@
+"""
+Pagination Utility
+Opaque cursors and field projections for paged news responses.
+"""
+
+from typing import Dict, List, Optional, Any, Iterable
+import base64
+import json
+
+# Fields a news result can expose, in response order
+NEWS_FIELDS = [
+    "id", "mongoId", "title", "content", "clean_text", "summary",
+    "link", "published", "sentiment", "score", "relevance_score"
+]
+
+# Result fields that are stored as properties on Weaviate RSSNews objects
+WEAVIATE_PROPERTIES = {
+    "mongoId", "title", "content", "clean_text", "summary",
+    "link", "published", "sentiment", "score"
+}
+
+# Result fields that are stored on MongoDB rss_news documents
+MONGO_FIELDS = {
+    "title", "content", "clean_text", "summary",
+    "link", "published", "sentiment", "score"
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor that cannot be decoded."""
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode pagination state as an opaque, URL-safe cursor string."""
+    raw = json.dumps(state, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+    if not isinstance(state, dict) or "src" not in state:
+        raise InvalidCursorError("Invalid cursor: missing source")
+    return state
+
+
+def resolve_fields(fields: Optional[Iterable[str]]) -> List[str]:
+    """
+    Validate a requested field list.
+
+    Accepts a list or a comma-separated string. Returns all fields when none are given.
+    """
+    if fields is None:
+        return list(NEWS_FIELDS)
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    requested = [f.strip() for f in fields if f and f.strip()]
+    unknown = [f for f in requested if f not in NEWS_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(NEWS_FIELDS)}")
+    if not requested:
+        return list(NEWS_FIELDS)
+    return [f for f in NEWS_FIELDS if f in requested]
+
+
+def weaviate_return_properties(fields: List[str]) -> List[str]:
+    """Map result fields to Weaviate `return_properties`."""
+    return [f for f in fields if f in WEAVIATE_PROPERTIES]
+
+
+def mongo_projection(fields: List[str]) -> Dict[str, int]:
+    """Map result fields to a MongoDB projection (published is kept for keyset paging)."""
+    projection = {f: 1 for f in fields if f in MONGO_FIELDS}
+    projection["published"] = 1
+    return projection
+
+
+def project(item: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Keep only the requested fields of a formatted result."""
+    return {f: item.get(f) for f in fields}
@@ -0,0 +1,33 @@
+"""
+Passage Utility
+Splits articles into overlapping passages for the RSSNewsPassage collection.
+Mirrors consumer/Scripts/passages.py, which indexes passages on CDC events.
+"""
+
+from typing import List
+import os
+
+PASSAGE_COLLECTION = os.getenv("PASSAGE_COLLECTION", "RSSNewsPassage")
+PASSAGE_WORDS = int(os.getenv("PASSAGE_WORDS", "80"))
+PASSAGE_OVERLAP = int(os.getenv("PASSAGE_OVERLAP", "20"))
+
+
+def split_passages(text: str, words_per_passage: int = PASSAGE_WORDS, overlap: int = PASSAGE_OVERLAP) -> List[str]:
+    """
+    Split article text into overlapping word windows.
+
+    Overlap keeps a fact that straddles a boundary intact in at least one passage.
+    """
+    words = (text or "").split()
+    if not words:
+        return []
+    if len(words) <= words_per_passage:
+        return [" ".join(words)]
+
+    step = max(1, words_per_passage - overlap)
+    passages = []
+    for start in range(0, len(words), step):
+        passages.append(" ".join(words[start:start + words_per_passage]))
+        if start + words_per_passage >= len(words):
+            break
+    return passages
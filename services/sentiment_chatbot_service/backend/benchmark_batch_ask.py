@@ -0,0 +1,77 @@
+"""
+Benchmark batch question answering against sequential /ask calls
+Answers the same questions one by one with `answer_question`, then in one
+`answer_questions_batch` call, and compares wall-clock time.
+Needs MongoDB, Weaviate and Ollama running.
+
+Usage:
+    python benchmark_batch_ask.py [--questions 10] [--context-limit 5]
+"""
+import argparse
+import asyncio
+import time
+from app.Database.mongo_client import MongoClient
+from app.Database.weaviate_client import WeaviateRegistry
+from app.services.news_rag_service import NewsRAGService
+
+QUESTIONS = [
+    "What is the latest on Central Bank interest rates?",
+    "How is the rupee performing against the dollar?",
+    "What did the IMF say about Sri Lanka's debt restructuring?",
+    "Any news about tea exports?",
+    "How are Colombo Stock Exchange shares doing?",
+    "What is happening with electricity tariffs?",
+    "Tell me about tourism earnings this month",
+    "What are banks reporting about credit growth?",
+    "Any updates on the budget deficit?",
+    "What is the latest on Central Bank interest rates?",   # duplicate on purpose
+]
+
+
+async def run_benchmark(count: int, context_limit: int):
+    print("\n" + "="*70)
+    print("BENCHMARK: BATCH vs SEQUENTIAL QUESTION ANSWERING")
+    print("="*70 + "\n")
+
+    mongo_client = MongoClient()
+    await mongo_client.connect()
+    news_rag = NewsRAGService()
+    questions = (QUESTIONS * (count // len(QUESTIONS) + 1))[:count]
+
+    # Each run starts cold so the batch does not benefit from the sequential run's cache
+    news_rag.retrieval_cache.clear()
+    print(f" Sequential: {len(questions)} x answer_question...")
+    started = time.perf_counter()
+    for question in questions:
+        await news_rag.answer_question(question, context_limit=context_limit)
+    sequential_seconds = time.perf_counter() - started
+
+    news_rag.retrieval_cache.clear()
+    print(f" Batch: answer_questions_batch (generation concurrency {news_rag.batch_generation_concurrency})...")
+    started = time.perf_counter()
+    first_result = None
+    async for result in news_rag.answer_questions_batch(questions, context_limit=context_limit):
+        if first_result is None:
+            first_result = time.perf_counter() - started
+        print(f"   [{time.perf_counter() - started:6.1f}s] #{result['index']}: {result['question'][:50]}")
+    batch_seconds = time.perf_counter() - started
+
+    print(f"\n{'mode':<14}{'total s':>10}{'first result s':>18}")
+    print("-" * 42)
+    print(f"{'sequential':<14}{sequential_seconds:>10.1f}{'-':>18}")
+    print(f"{'batch':<14}{batch_seconds:>10.1f}{first_result or 0:>18.1f}")
+    print(f"\n Speedup: {sequential_seconds / batch_seconds:.1f}x")
+
+    news_rag.close()
+    WeaviateRegistry().close()
+    await mongo_client.close()
+    print("\n" + "="*70 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch vs sequential question answering")
+    parser.add_argument("--questions", type=int, default=10, help="Questions per run")
+    parser.add_argument("--context-limit", type=int, default=5, help="Articles of context per question")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.questions, args.context_limit))
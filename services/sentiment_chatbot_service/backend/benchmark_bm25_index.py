@@ -0,0 +1,102 @@
+"""
+Benchmark the in-process BM25 news index
+Measures build time, memory per 10k articles and query latency on synthetic articles.
+Runs without MongoDB or Weaviate.
+
+Usage:
+    python benchmark_bm25_index.py [--sizes 10000 50000] [--runs 200]
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from app.services.news.bm25_index import BM25NewsIndex
+
+VOCABULARY = (
+    "central bank interest rates inflation rupee dollar exports imports tourism reserves "
+    "colombo stock exchange aspi shares equities bonds treasury yields budget deficit tax "
+    "imf programme debt restructuring growth gdp tea apparel remittances fuel electricity "
+    "tariff banks credit lending construction property insurance telecom profits earnings "
+    "quarter revenue margin dividend rights issue listing cabinet minister parliament policy"
+).split()
+TICKERS = ["JKH.N0000", "COMB.N0000", "HNB.N0000", "SAMP.N0000", "DIAL.N0000", "LOLC.N0000"]
+
+QUERIES = ["central bank rates", "JKH.N0000 profits", "imf debt restructuring", "tea exports", "COMB dividend"]
+
+
+def _synthetic_articles(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    # Each article gets a few rare words so the vocabulary grows like real news
+    rare = [f"term{i}" for i in range(count // 2 or 1)]
+    for i in range(count):
+        words = [rng.choice(VOCABULARY) for _ in range(150)] + rng.sample(rare, min(5, len(rare)))
+        if rng.random() < 0.2:
+            words.append(rng.choice(TICKERS))
+        rng.shuffle(words)
+        yield {
+            "_id": f"{i:024x}",
+            "title": " ".join(rng.choice(VOCABULARY) for _ in range(9)),
+            "summary": " ".join(words[:35]),
+            "clean_text": " ".join(words),
+            "published": now - timedelta(minutes=i),
+            "sentiment": rng.choice(["positive", "neutral", "negative"]),
+        }
+
+
+def run_benchmark(sizes, runs: int):
+    print("\n" + "="*78)
+    print("BENCHMARK: IN-PROCESS BM25 NEWS INDEX")
+    print("="*78 + "\n")
+    print(f"{'articles':>10}{'build s':>10}{'memory MB':>12}{'MB / 10k':>10}{'terms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    print("-" * 72)
+
+    for size in sizes:
+        articles = list(_synthetic_articles(size))
+
+        BM25NewsIndex._instance = None
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+
+        index = BM25NewsIndex()
+        for article in articles:
+            index.add(article)
+
+        build_seconds = time.perf_counter() - started
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        # Count only memory allocated by the index module itself
+        index_bytes = sum(
+            stat.size_diff for stat in snapshot.compare_to(baseline, "filename")
+            if stat.traceback[0].filename.endswith("bm25_index.py")
+        )
+        memory_mb = index_bytes / (1024 * 1024)
+
+        timings = []
+        for i in range(runs):
+            query = QUERIES[i % len(QUERIES)]
+            t0 = time.perf_counter()
+            index.search(query, limit=10)
+            timings.append((time.perf_counter() - t0) * 1000)
+        timings.sort()
+
+        print(
+            f"{size:>10}{build_seconds:>10.2f}{memory_mb:>12.1f}{memory_mb / (size / 10_000):>10.1f}"
+            f"{index.stats()['terms']:>10}{statistics.median(timings):>10.2f}"
+            f"{timings[int(len(timings) * 0.95) - 1]:>10.2f}"
+        )
+
+    print("\n" + "="*78 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the in-process BM25 news index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000], help="Index sizes to test")
+    parser.add_argument("--runs", type=int, default=200, help="Timed queries per size")
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.runs)
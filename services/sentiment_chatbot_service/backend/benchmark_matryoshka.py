@@ -0,0 +1,157 @@
+"""
+Benchmark Matryoshka-truncated embeddings against full nomic-embed-text vectors
+Embeds a real corpus once at full size through Ollama, then for each dimension
+(256, 512 and the full 768 by default) builds a throwaway ChromaDB index of the
+truncated vectors (nomic v1.5 recipe: layer norm over the full vector, slice,
+re-normalize; see app.utils.embeddings) and reports recall@k against the
+full-vector neighbours, on-disk index size and query latency.
+
+Corpora:
+    kb    chunks of the knowledge base ChromaDB collection (cse_annual_report_2024)
+    news  clean_text of the latest MongoDB news articles
+
+Queries are held-out documents from the same corpus.
+
+Usage:
+    python benchmark_matryoshka.py [--source kb|news] [--documents 2000] [--queries 100]
+        [--k 10] [--dims 256 512 768]
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import numpy as np
+import chromadb
+import ollama
+from chromadb.config import Settings
+from app.utils.embeddings import truncate_embedding
+
+EMBEDDING_MODEL = os.getenv("KNOWLEDGE_BASE_EMBEDDING_MODEL", "nomic-embed-text")
+
+
+def load_kb_texts(limit: int, db_path: str = "./data/knowledge_base",
+                  collection_name: str = "cse_annual_report_2024") -> list:
+    client = chromadb.PersistentClient(path=db_path, settings=Settings(anonymized_telemetry=False))
+    collection = client.get_collection(name=collection_name)
+    return collection.get(limit=limit, include=["documents"])["documents"]
+
+
+def load_news_texts(limit: int) -> list:
+    from app.Database.mongo_client import MongoClient
+    from app.Database.repositories.rss_repository import RSSRepository
+
+    async def fetch():
+        mongo_client = MongoClient()
+        await mongo_client.connect()
+        repo = RSSRepository()
+        texts = [
+            f"{doc.get('title', '')}\n{doc.get('clean_text', '')}"
+            async for doc in repo.iter_documents(
+                repo.serving_filter(), {"title": 1, "clean_text": 1}, sort=[("published", -1)], limit=limit
+            )
+        ]
+        await mongo_client.close()
+        return texts
+
+    return asyncio.run(fetch())
+
+
+def embed_all(texts: list) -> np.ndarray:
+    vectors = []
+    for i, text in enumerate(texts):
+        response = ollama.embeddings(model=EMBEDDING_MODEL, prompt=text)
+        vectors.append(response["embedding"] if isinstance(response, dict) else response.embedding)
+        if (i + 1) % 100 == 0:
+            print(f"   Embedded {i + 1}/{len(texts)} texts...")
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    return np.argsort(-(queries @ corpus.T), axis=1)[:, :k]
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files)
+
+
+def run_dimension(dims: int, corpus: np.ndarray, queries: np.ndarray, truth: np.ndarray, k: int) -> dict:
+    corpus_t = np.asarray([truncate_embedding(v.tolist(), dims) for v in corpus], dtype=np.float32)
+    queries_t = np.asarray([truncate_embedding(v.tolist(), dims) for v in queries], dtype=np.float32)
+
+    path = tempfile.mkdtemp(prefix=f"matryoshka_{dims}_")
+    try:
+        client = chromadb.PersistentClient(path=path, settings=Settings(anonymized_telemetry=False))
+        collection = client.create_collection(name="bench", metadata={"hnsw:space": "cosine", "embedding_dimensions": dims})
+        ids = [str(i) for i in range(len(corpus_t))]
+        for start in range(0, len(ids), 500):
+            collection.add(ids=ids[start:start + 500], embeddings=corpus_t[start:start + 500].tolist())
+
+        timings, hits = [], 0
+        for query, expected in zip(queries_t, truth):
+            started = time.perf_counter()
+            result = collection.query(query_embeddings=[query.tolist()], n_results=k, include=[])
+            timings.append((time.perf_counter() - started) * 1000)
+            hits += len({int(i) for i in result["ids"][0]} & set(expected.tolist()))
+        size = directory_size(path)
+        del client
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    timings.sort()
+    return {
+        "recall": hits / (len(queries_t) * k),
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95) - 1],
+        "index_mb": size / 1e6,
+    }
+
+
+def run_benchmark(source: str, documents: int, queries: int, k: int, dims_list: list):
+    print("\n" + "="*70)
+    print(f"BENCHMARK: MATRYOSHKA EMBEDDING TRUNCATION ({source} corpus, {EMBEDDING_MODEL})")
+    print("="*70 + "\n")
+
+    try:
+        texts = load_kb_texts(documents + queries) if source == "kb" else load_news_texts(documents + queries)
+        texts = [t for t in texts if t and t.strip()]
+        if len(texts) <= queries:
+            print(f" Only {len(texts)} texts found; need more than {queries}")
+            return
+        print(f" Embedding {len(texts)} texts at full size...")
+        vectors = embed_all(texts)
+        corpus, query_vectors = vectors[:-queries], vectors[-queries:]
+        full_dims = corpus.shape[1]
+        truth = top_k(corpus, query_vectors, k)
+        print(f" {len(corpus)} documents, {len(query_vectors)} held-out queries, {full_dims} dims\n")
+
+        print(f"{'dims':>6}{'recall@' + str(k):>11}{'p50 ms':>9}{'p95 ms':>9}{'index MB':>11}")
+        print("-" * 46)
+        for dims in dims_list:
+            dims = min(dims, full_dims)
+            result = run_dimension(dims, corpus, query_vectors, truth, k)
+            print(f"{dims:>6}{result['recall']:>11.3f}{result['p50']:>9.2f}{result['p95']:>9.2f}{result['index_mb']:>11.1f}")
+        print(f"\n Recall is measured against exact neighbours of the full {full_dims}-dim vectors")
+
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+
+    print("\n" + "="*70 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Matryoshka-truncated embeddings")
+    parser.add_argument("--source", choices=["kb", "news"], default="kb", help="Corpus to embed")
+    parser.add_argument("--documents", type=int, default=2000, help="Documents to index")
+    parser.add_argument("--queries", type=int, default=100, help="Held-out query documents")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query for recall@k")
+    parser.add_argument("--dims", type=int, nargs="+", default=[256, 512, 768], help="Dimensions to compare")
+    args = parser.parse_args()
+
+    run_benchmark(args.source, args.documents, args.queries, args.k, args.dims)
@@ -0,0 +1,122 @@
+"""
+Benchmark the "latest news" query plan before and after the managed indexes
+Builds a throwaway `bench_rss_news_indexes` collection (100k articles by default, with
+source/quality_flag set as at ingest), then compares the legacy link-regex query
+with the indexed source filter, with no indexes and with the managed indexes.
+
+Usage:
+    python benchmark_news_indexes.py [--articles 100000] [--runs 20] [--keep]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from app.Database.mongo_client import MongoClient
+from app.Database.index_manager import NEWS_INDEXES
+from app.Database.repositories.rss_repository import FAKE_TITLES, NEWS_SOURCE, classify_quality
+
+BENCH_COLLECTION = "bench_rss_news_indexes"
+SOURCES = [NEWS_SOURCE, NEWS_SOURCE, NEWS_SOURCE, "dailymirror.lk", "ft.lk"]
+SORT = [("published", -1), ("_id", -1)]
+
+
+async def _populate(collection, total: int, batch_size: int = 5000):
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    inserted = 0
+    while inserted < total:
+        batch = []
+        for i in range(inserted, min(inserted + batch_size, total)):
+            source = rng.choice(SOURCES)
+            article = {
+                "title": rng.choice(FAKE_TITLES) if rng.random() < 0.01 else f"Bench article {i}",
+                "link": f"https://{source}/bench-article-{i}/",
+                "summary": "synthetic article",
+                "published": now - timedelta(minutes=i),
+                "sentiment": rng.choice(["positive", "neutral", "negative"]),
+                "source": source,
+            }
+            article["quality_flag"] = classify_quality(article)
+            batch.append(article)
+        await collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+        print(f"   Inserted {inserted}/{total} articles...")
+
+
+def _plan_summary(plan: dict) -> dict:
+    stats = plan.get("executionStats", {})
+    stages = []
+    stage = plan.get("queryPlanner", {}).get("winningPlan", {})
+    while stage:
+        stages.append(stage.get("stage", "?") + (f"({stage['indexName']})" if "indexName" in stage else ""))
+        stage = stage.get("inputStage")
+    return {
+        "plan": " <- ".join(stages),
+        "docs": stats.get("totalDocsExamined", "n/a"),
+        "keys": stats.get("totalKeysExamined", "n/a"),
+    }
+
+
+async def _measure(collection, query: dict, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await collection.find(query).sort(SORT).limit(20).to_list(length=20)
+        timings.append((time.perf_counter() - started) * 1000)
+    plan = await collection.find(query).sort(SORT).limit(20).explain()
+    return {"p50": statistics.median(timings), **_plan_summary(plan)}
+
+
+async def run_benchmark(total_articles: int, runs: int, keep: bool):
+    print("\n" + "="*90)
+    print("BENCHMARK: LATEST-NEWS QUERY PLANS")
+    print("="*90 + "\n")
+
+    mongo_client = MongoClient()
+    await mongo_client.connect()
+    collection = mongo_client.get_db[BENCH_COLLECTION]
+
+    if await collection.count_documents({}) != total_articles:
+        print(f" Building synthetic collection with {total_articles} articles...")
+        await collection.drop()
+        await _populate(collection, total_articles)
+
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    queries = {
+        "legacy regex": {"title": {"$nin": FAKE_TITLES}, "link": {"$regex": "economynext.com"}},
+        "source filter": {"source": NEWS_SOURCE, "quality_flag": "ok"},
+        "source + 7 days": {"source": NEWS_SOURCE, "quality_flag": "ok", "published": {"$gte": week_ago}},
+        "sentiment": {"sentiment": "negative"},
+    }
+
+    for phase in ("no indexes", "managed indexes"):
+        await collection.drop_indexes()
+        if phase == "managed indexes":
+            for name, (keys, options) in NEWS_INDEXES.items():
+                await collection.create_index(keys, name=name, **options)
+
+        print(f"\n[{phase}]")
+        print(f"{'query':<18}{'p50 ms':>9}{'docs':>9}{'keys':>9}   plan")
+        print("-" * 90)
+        for label, query in queries.items():
+            result = await _measure(collection, query, runs)
+            print(f"{label:<18}{result['p50']:>9.1f}{result['docs']:>9}{result['keys']:>9}   {result['plan']}")
+
+    if not keep:
+        await collection.drop()
+        print(f"\n Dropped {BENCH_COLLECTION}")
+
+    await mongo_client.close()
+    print("\n" + "="*90 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark latest-news query plans with and without indexes")
+    parser.add_argument("--articles", type=int, default=100_000, help="Synthetic articles to generate")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic collection afterwards")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.articles, args.runs, args.keep))
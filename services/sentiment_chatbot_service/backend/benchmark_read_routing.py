@@ -0,0 +1,126 @@
+"""
+Benchmark write latency while analytic reads run on the primary vs secondaries
+Inserts articles at a steady rate into a throwaway `bench_read_routing` collection
+and measures insert latency in three phases: no analytics, a full-scan aggregation
+loop on the primary, and the same loop routed through the analytic read preference.
+
+Needs a replica set, e.g. mongo/docker-compose.replica-test.yml:
+    MONGO_URI="mongodb://localhost:27031,localhost:27032,localhost:27033/research_db?replicaSet=rs0" \\
+        python benchmark_read_routing.py [--articles 200000] [--seconds 20]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from app.Database.mongo_client import MongoClient, ANALYTIC, TRANSACTIONAL
+
+BENCH_COLLECTION = "bench_read_routing"
+
+ANALYTIC_PIPELINE = [
+    {"$group": {"_id": {"sentiment": "$sentiment", "day": {"$dateTrunc": {"date": "$published", "unit": "day"}}},
+                "count": {"$sum": 1}, "avg_score": {"$avg": "$score"}}},
+    {"$sort": {"count": -1}},
+]
+
+
+async def _populate(collection, total: int, batch_size: int = 5000):
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    inserted = 0
+    while inserted < total:
+        batch = [{
+            "title": f"Bench article {i}",
+            "clean_text": " ".join(rng.choice(["rates", "rupee", "tea", "imf", "bonds"]) for _ in range(100)),
+            "published": now - timedelta(minutes=i),
+            "sentiment": rng.choice(["positive", "neutral", "negative"]),
+            "score": rng.uniform(-1, 1),
+        } for i in range(inserted, min(inserted + batch_size, total))]
+        await collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+        print(f"   Inserted {inserted}/{total} articles...")
+
+
+async def _writer(collection, seconds: float) -> list:
+    """Insert one article every 10ms and record each insert's latency."""
+    timings = []
+    deadline = time.perf_counter() + seconds
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await collection.insert_one({"title": f"Live article {i}", "published": datetime.utcnow(), "sentiment": "neutral", "score": 0.0})
+        timings.append((time.perf_counter() - started) * 1000)
+        i += 1
+        await asyncio.sleep(0.01)
+    return timings
+
+
+async def _analytics_loop(collection, stop: asyncio.Event, workers: int = 4) -> int:
+    runs = 0
+
+    async def worker():
+        nonlocal runs
+        while not stop.is_set():
+            await collection.aggregate(ANALYTIC_PIPELINE, allowDiskUse=True).to_list(length=None)
+            runs += 1
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return runs
+
+
+async def run_benchmark(total_articles: int, seconds: float, keep: bool):
+    print("\n" + "="*78)
+    print("BENCHMARK: WRITE LATENCY WITH ANALYTIC READ ROUTING")
+    print("="*78 + "\n")
+
+    mongo_client = MongoClient()
+    await mongo_client.connect()
+    write_collection = mongo_client.database(TRANSACTIONAL)[BENCH_COLLECTION]
+    hello = await mongo_client.client.admin.command("hello")
+    print(f" Replica set: {hello.get('setName', 'none (standalone or directConnection)')}, hosts: {hello.get('hosts', [])}")
+    print(f" Analytic read preference: {mongo_client.analytics_read_preference}, "
+          f"max staleness {mongo_client.max_staleness_seconds}s\n")
+
+    if await write_collection.estimated_document_count() < total_articles:
+        print(f" Building synthetic collection with {total_articles} articles...")
+        await write_collection.drop()
+        await _populate(write_collection, total_articles)
+
+    phases = [
+        ("no analytics", None),
+        ("analytics on primary", write_collection),
+        ("analytics routed", mongo_client.database(ANALYTIC)[BENCH_COLLECTION]),
+    ]
+
+    print(f"\n{'phase':<24}{'writes':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'agg runs':>10}")
+    print("-" * 72)
+    for label, read_collection in phases:
+        stop = asyncio.Event()
+        analytics = asyncio.create_task(_analytics_loop(read_collection, stop)) if read_collection is not None else None
+        timings = await _writer(write_collection, seconds)
+        stop.set()
+        runs = await analytics if analytics else 0
+
+        timings.sort()
+        print(
+            f"{label:<24}{len(timings):>8}{statistics.median(timings):>10.2f}"
+            f"{timings[int(len(timings) * 0.95) - 1]:>10.2f}{timings[int(len(timings) * 0.99) - 1]:>10.2f}{runs:>10}"
+        )
+
+    if not keep:
+        await write_collection.drop()
+        print(f"\n Dropped {BENCH_COLLECTION}")
+
+    await mongo_client.close()
+    print("\n" + "="*78 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark write latency with analytic read routing")
+    parser.add_argument("--articles", type=int, default=200_000, help="Synthetic articles for the aggregations to scan")
+    parser.add_argument("--seconds", type=float, default=20, help="Duration of each phase")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic collection afterwards")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.articles, args.seconds, args.keep))
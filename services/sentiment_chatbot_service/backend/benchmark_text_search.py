@@ -0,0 +1,142 @@
+"""
+Benchmark $regex vs $text news search on a synthetic collection
+Builds a throwaway `bench_rss_news` collection (100k articles by default), then compares
+the old unanchored case-insensitive regex fallback with the weighted $text index.
+
+Usage:
+    python benchmark_text_search.py [--articles 100000] [--runs 20] [--keep]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from pymongo import TEXT
+from app.Database.mongo_client import MongoClient
+from app.Database.repositories.rss_repository import TEXT_INDEX_NAME, TEXT_INDEX_WEIGHTS
+
+BENCH_COLLECTION = "bench_rss_news"
+
+VOCABULARY = (
+    "central bank interest rates inflation rupee dollar exports imports tourism reserves "
+    "colombo stock exchange aspi shares equities bonds treasury yields budget deficit tax "
+    "imf programme debt restructuring growth gdp tea apparel remittances fuel electricity "
+    "tariff banks credit lending construction property insurance telecom profits earnings"
+).split()
+
+QUERIES = ["central bank", "rupee", "imf programme", "tea exports", "colombo stock exchange"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+async def _populate(collection, total: int, batch_size: int = 5000):
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    inserted = 0
+    while inserted < total:
+        batch = []
+        for i in range(inserted, min(inserted + batch_size, total)):
+            clean_text = _sentence(rng, 120)
+            batch.append({
+                "title": _sentence(rng, 8).capitalize(),
+                "link": f"https://economynext.com/bench-article-{i}/",
+                "content": f"<p>{clean_text}</p>",
+                "clean_text": clean_text,
+                "summary": _sentence(rng, 30),
+                "published": now - timedelta(minutes=i),
+                "sentiment": rng.choice(["positive", "neutral", "negative"]),
+                "score": round(rng.uniform(-1, 1), 2),
+            })
+        await collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+        print(f"   Inserted {inserted}/{total} articles...")
+
+
+def _regex_query(text: str) -> dict:
+    return {"$or": [
+        {"title": {"$regex": text, "$options": "i"}},
+        {"content": {"$regex": text, "$options": "i"}}
+    ]}
+
+
+async def _time_query(run_query, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await run_query()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+    }
+
+
+async def run_benchmark(total_articles: int, runs: int, keep: bool):
+    print("\n" + "="*70)
+    print("BENCHMARK: $regex vs $text NEWS SEARCH")
+    print("="*70 + "\n")
+
+    mongo_client = MongoClient()
+    await mongo_client.connect()
+    collection = mongo_client.get_db[BENCH_COLLECTION]
+
+    if await collection.count_documents({}) != total_articles:
+        print(f" Building synthetic collection with {total_articles} articles...")
+        await collection.drop()
+        await _populate(collection, total_articles)
+
+    print(" Creating weighted text index...")
+    await collection.create_index(
+        [(field, TEXT) for field in TEXT_INDEX_WEIGHTS],
+        weights=TEXT_INDEX_WEIGHTS,
+        name=TEXT_INDEX_NAME,
+        default_language="english"
+    )
+
+    print(f"\n{'query':<24}{'regex p50':>12}{'regex p95':>12}{'text p50':>12}{'text p95':>12}{'docs (regex/text)':>22}")
+    print("-" * 94)
+
+    for text in QUERIES:
+        async def regex_search():
+            return await collection.find(_regex_query(text)).sort("published", -1).limit(10).to_list(length=10)
+
+        async def text_search():
+            cursor = collection.find(
+                {"$text": {"$search": text}},
+                {"text_score": {"$meta": "textScore"}}
+            ).sort([("text_score", {"$meta": "textScore"})]).limit(10)
+            return await cursor.to_list(length=10)
+
+        regex_timing = await _time_query(regex_search, runs)
+        text_timing = await _time_query(text_search, runs)
+
+        regex_plan = await collection.find(_regex_query(text)).sort("published", -1).limit(10).explain()
+        text_plan = await collection.find({"$text": {"$search": text}}).limit(10).explain()
+        regex_docs = regex_plan.get("executionStats", {}).get("totalDocsExamined", "n/a")
+        text_docs = text_plan.get("executionStats", {}).get("totalDocsExamined", "n/a")
+
+        print(
+            f"{text:<24}{regex_timing['p50']:>10.1f}ms{regex_timing['p95']:>10.1f}ms"
+            f"{text_timing['p50']:>10.1f}ms{text_timing['p95']:>10.1f}ms{f'{regex_docs}/{text_docs}':>22}"
+        )
+
+    if not keep:
+        await collection.drop()
+        print(f"\n Dropped {BENCH_COLLECTION}")
+
+    await mongo_client.close()
+    print("\n" + "="*70 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark $regex vs $text news search")
+    parser.add_argument("--articles", type=int, default=100_000, help="Synthetic articles to generate")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic collection afterwards")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.articles, args.runs, args.keep))
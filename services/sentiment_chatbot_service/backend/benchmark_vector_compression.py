@@ -0,0 +1,165 @@
+"""
+Benchmark vector compression (PQ/BQ with rescoring) against uncompressed HNSW
+Loads the same vectors into throwaway collections (BenchCompression_<config>) with no
+compression, product quantization and binary quantization, then compares recall@k against
+exact (brute-force) neighbours, query latency and estimated in-memory vector size.
+
+Corpora:
+    synthetic  clustered random vectors (default 768 dims, like nomic-embed-text)
+    real       vectors read from an existing collection (RSSNews by default); held-out
+               articles are used as queries
+
+Usage:
+    python benchmark_vector_compression.py [--corpus synthetic|real] [--objects 20000]
+        [--queries 200] [--k 10] [--dims 768] [--collection RSSNews] [--rescore-limit 200] [--keep]
+"""
+import argparse
+import statistics
+import time
+import numpy as np
+from app.Database.weaviate_client import WeaviateRegistry, vector_index_config
+from weaviate.classes.config import Configure, Property, DataType
+from weaviate.classes.query import MetadataQuery
+
+CONFIGS = ["none", "pq", "bq"]
+
+
+def synthetic_corpus(objects: int, queries: int, dims: int, clusters: int = 64):
+    """Unit vectors drawn around random cluster centres (closer to text embeddings than uniform noise)."""
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(clusters, dims))
+    labels = rng.integers(0, clusters, size=objects + queries)
+    vectors = centres[labels] + 0.6 * rng.normal(size=(objects + queries, dims))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors.astype(np.float32)
+    return vectors[:objects], vectors[objects:]
+
+
+def real_corpus(registry: WeaviateRegistry, collection_name: str, objects: int, queries: int):
+    """Vectors from an existing collection; the last `queries` are held out as queries."""
+    vectors = []
+    for obj in registry.client.collections.get(collection_name).iterator(include_vector=True):
+        vector = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+        if vector:
+            vectors.append(vector)
+        if len(vectors) >= objects + queries:
+            break
+    vectors = np.asarray(vectors, dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors[:-queries], vectors[-queries:]
+
+
+def exact_neighbours(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def estimated_vector_bytes(config: str, objects: int, dims: int) -> int:
+    """In-memory vector size: float32, 1 byte per PQ segment (dims/4 by default), 1 bit per dimension for BQ."""
+    if config == "pq":
+        return objects * max(1, dims // 4)
+    if config == "bq":
+        return objects * dims // 8
+    return objects * dims * 4
+
+
+def run_config(registry: WeaviateRegistry, config: str, corpus: np.ndarray, queries: np.ndarray,
+               truth: np.ndarray, k: int, rescore_limit: int, keep: bool) -> dict:
+    client = registry.client
+    name = f"BenchCompression_{config}"
+    if client.collections.exists(name):
+        client.collections.delete(name)
+    collection = client.collections.create(
+        name=name,
+        properties=[Property(name="row", data_type=DataType.INT)],
+        vectorizer_config=Configure.Vectorizer.none(),
+        # PQ trains on the whole synthetic corpus so every vector is compressed
+        vector_index_config=vector_index_config(config, rescore_limit=rescore_limit, pq_training_limit=len(corpus)),
+    )
+
+    started = time.perf_counter()
+    with collection.batch.fixed_size(batch_size=500, concurrent_requests=2) as batch:
+        for row, vector in enumerate(corpus):
+            batch.add_object(properties={"row": row}, vector=vector.tolist())
+    load_seconds = time.perf_counter() - started
+    failed = len(collection.batch.failed_objects)
+    # Give PQ time to finish training/compressing before timing queries
+    time.sleep(5)
+
+    timings, hits = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        response = collection.query.near_vector(
+            near_vector=query.tolist(), limit=k, return_properties=["row"],
+            return_metadata=MetadataQuery(distance=True)
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+        found = {obj.properties["row"] for obj in response.objects}
+        hits += len(found & set(expected.tolist()))
+
+    if not keep:
+        client.collections.delete(name)
+
+    timings.sort()
+    return {
+        "recall": hits / (len(queries) * k),
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95) - 1],
+        "load_s": load_seconds,
+        "failed": failed,
+        "vector_mb": estimated_vector_bytes(config, len(corpus), corpus.shape[1]) / 1e6,
+    }
+
+
+def run_benchmark(corpus_name: str, objects: int, queries: int, k: int, dims: int,
+                  collection_name: str, rescore_limit: int, keep: bool):
+    print("\n" + "="*78)
+    print(f"BENCHMARK: VECTOR COMPRESSION ({corpus_name} corpus)")
+    print("="*78 + "\n")
+
+    registry = WeaviateRegistry()
+    try:
+        registry.connect()
+        if corpus_name == "real":
+            corpus, query_vectors = real_corpus(registry, collection_name, objects, queries)
+            print(f" Read {len(corpus)} vectors (+{len(query_vectors)} held-out queries) from {collection_name}")
+        else:
+            corpus, query_vectors = synthetic_corpus(objects, queries, dims)
+            print(f" Generated {len(corpus)} synthetic vectors (+{len(query_vectors)} queries), {dims} dims")
+
+        truth = exact_neighbours(corpus, query_vectors, k)
+        print(f" Exact top-{k} computed; BQ rescore limit {rescore_limit}\n")
+
+        print(f"{'config':<8}{'recall@' + str(k):>11}{'p50 ms':>9}{'p95 ms':>9}{'load s':>9}{'vectors MB':>12}{'failed':>8}")
+        print("-" * 66)
+        for config in CONFIGS:
+            result = run_config(registry, config, corpus, query_vectors, truth, k, rescore_limit, keep)
+            print(
+                f"{config:<8}{result['recall']:>11.3f}{result['p50']:>9.2f}{result['p95']:>9.2f}"
+                f"{result['load_s']:>9.1f}{result['vector_mb']:>12.1f}{result['failed']:>8}"
+            )
+        print("\n vectors MB is the estimated in-memory vector size; PQ/BQ keep the full vectors on disk for rescoring")
+
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        registry.close()
+
+    print("\n" + "="*78 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark PQ/BQ vector compression against uncompressed HNSW")
+    parser.add_argument("--corpus", choices=["synthetic", "real"], default="synthetic")
+    parser.add_argument("--objects", type=int, default=20_000, help="Vectors to index")
+    parser.add_argument("--queries", type=int, default=200, help="Query vectors")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query for recall@k")
+    parser.add_argument("--dims", type=int, default=768, help="Synthetic vector dimensions")
+    parser.add_argument("--collection", default="RSSNews", help="Source collection for the real corpus")
+    parser.add_argument("--rescore-limit", type=int, default=200, help="BQ candidates re-ranked with full vectors")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections afterwards")
+    args = parser.parse_args()
+
+    run_benchmark(args.corpus, args.objects, args.queries, args.k, args.dims, args.collection, args.rescore_limit, args.keep)
@@ -0,0 +1,83 @@
+"""
+Backfill the passage-level news index
+Splits every MongoDB article into overlapping passages and writes them to the
+RSSNewsPassage collection. New and updated articles are indexed by the CDC
+consumer, which also creates the collection; run this once for existing articles.
+
+Usage:
+    python build_passage_index.py [--clear] [--batch-size 500]
+"""
+import argparse
+import asyncio
+from weaviate.classes.query import Filter
+from weaviate.util import generate_uuid5
+from app.Database.mongo_client import MongoClient
+from app.Database.weaviate_client import WeaviateClient, WeaviateRegistry
+from app.utils.passages import PASSAGE_COLLECTION, split_passages
+
+
+async def build_passage_index(clear: bool, batch_size: int):
+    print("\n" + "="*60)
+    print("BUILDING PASSAGE INDEX")
+    print("="*60 + "\n")
+
+    mongo_client = MongoClient()
+    await mongo_client.connect()
+    weaviate_client = WeaviateClient(collection_name="RSSNews")
+    if not weaviate_client.is_connected:
+        weaviate_client.connect()
+    print(" Connected to MongoDB and Weaviate\n")
+
+    if not weaviate_client.client.collections.exists(PASSAGE_COLLECTION):
+        print(f" Collection '{PASSAGE_COLLECTION}' does not exist.")
+        print("   Start the CDC consumer with PASSAGE_INDEX_ENABLED=true once to create it.")
+        WeaviateRegistry().close()
+        await mongo_client.close()
+        return
+
+    passages_collection = weaviate_client.client.collections.get(PASSAGE_COLLECTION)
+    if clear:
+        print(" Clearing existing passages...")
+        passages_collection.data.delete_many(where=Filter.by_property("mongoId").like("*"))
+
+    projection = {"title": 1, "clean_text": 1, "summary": 1, "link": 1, "published": 1, "sentiment": 1}
+    cursor = mongo_client.get_db["rss_news"].find({}, projection).batch_size(batch_size)
+
+    articles = 0
+    passages = 0
+    with passages_collection.batch.dynamic() as batch:
+        async for article in cursor:
+            mongo_id = str(article["_id"])
+            for index, text in enumerate(split_passages(article.get("clean_text") or article.get("summary") or "")):
+                batch.add_object(
+                    properties={
+                        "mongoId": mongo_id,
+                        "passage_index": index,
+                        "title": article.get("title", ""),
+                        "text": text,
+                        "link": article.get("link", ""),
+                        "published": article.get("published"),
+                        "sentiment": article.get("sentiment", "neutral"),
+                    },
+                    uuid=generate_uuid5(f"{mongo_id}:{index}")
+                )
+                passages += 1
+            articles += 1
+            if articles % 100 == 0:
+                print(f"   Indexed {articles} articles ({passages} passages)...")
+
+    failed = len(passages_collection.batch.failed_objects)
+    print(f"\n Done: {articles} articles, {passages} passages, {failed} failed")
+
+    WeaviateRegistry().close()
+    await mongo_client.close()
+    print("\n" + "="*60 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill the RSSNewsPassage collection from MongoDB")
+    parser.add_argument("--clear", action="store_true", help="Delete all existing passages first")
+    parser.add_argument("--batch-size", type=int, default=500, help="MongoDB cursor batch size")
+    args = parser.parse_args()
+
+    asyncio.run(build_passage_index(args.clear, args.batch_size))
@@ -0,0 +1,63 @@
+"""
+Export news to date-partitioned Parquet
+Streams served `rss_news` articles into one zstd-compressed Parquet file per
+publication day (<dir>/published_date=YYYY-MM-DD/news.parquet). Re-runs only
+rewrite days with articles saved since the previous export.
+
+Usage:
+    python export_news_parquet.py [--full] [--output-dir data/exports/news] [--batch-size 5000]
+
+Load a year of news:
+    pandas.read_parquet("data/exports/news", filters=[("published_date", ">=", "2025-01-01")])
+"""
+import argparse
+import asyncio
+import time
+from app.Database.mongo_client import MongoClient
+from app.Database.repositories.rss_repository import RSSRepository
+from app.services.news.parquet_export import NewsParquetExporter
+
+async def export_news(full: bool, output_dir: str, batch_size: int):
+    print("\n" + "="*60)
+    print("EXPORTING NEWS TO PARQUET")
+    print("="*60 + "\n")
+    
+    try:
+        mongo_client = MongoClient()
+        await mongo_client.connect()
+        await RSSRepository().check_source_fields()
+        await RSSRepository().check_archive()
+        print(" Connected to MongoDB")
+        
+        exporter = NewsParquetExporter(export_dir=output_dir, batch_size=batch_size)
+        manifest = exporter.read_manifest()
+        print(f" Output: {exporter.export_dir}")
+        print(f" Watermark: {manifest.get('watermark') or 'none (full export)'}\n")
+        
+        started = time.perf_counter()
+        result = await exporter.export(full=full)
+        elapsed = time.perf_counter() - started
+        
+        print(f" Export complete in {elapsed:.1f}s")
+        print(f"   Days written: {result['days_written']}")
+        print(f"   Articles written: {result['rows_written']}")
+        print(f"   Total: {result['total_rows']} articles in {result['total_days']} days")
+        print(f"   New watermark: {result['watermark']}")
+        
+        await mongo_client.close()
+        
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    
+    print("\n" + "="*60 + "\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export served news to date-partitioned Parquet")
+    parser.add_argument("--full", action="store_true", help="Rewrite every day, ignoring the watermark")
+    parser.add_argument("--output-dir", default=None, help="Export directory (NEWS_EXPORT_DIR)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Articles per Parquet row group write (NEWS_EXPORT_BATCH_SIZE)")
+    args = parser.parse_args()
+    
+    asyncio.run(export_news(args.full, args.output_dir, args.batch_size))
@@ -0,0 +1,101 @@
+"""
+Backfill `source` and `quality_flag` on existing news articles
+New articles get both fields in RSSRepository.save_news. This migration fills them in
+for older documents, optionally removes duplicate links, and creates the managed indexes.
+Safe to re-run.
+
+Usage:
+    python migrate_news_source_fields.py [--dedupe-links] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+from pymongo import UpdateOne
+from app.Database.mongo_client import MongoClient
+from app.Database.index_manager import NewsIndexManager
+from app.Database.repositories.rss_repository import RSSRepository, classify_quality
+from app.Database.repositories.sentiment_rollup_repository import SentimentRollupRepository
+
+
+async def _dedupe_links(collection) -> int:
+    """Keep the most recently written document per link and delete the rest."""
+    removed = 0
+    pipeline = [
+        {"$sort": {"created_at": -1, "_id": -1}},
+        {"$group": {"_id": "$link", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+    async for group in collection.aggregate(pipeline, allowDiskUse=True):
+        result = await collection.delete_many({"_id": {"$in": group["ids"][1:]}})
+        removed += result.deleted_count
+    return removed
+
+
+async def migrate_news_source_fields(dedupe_links: bool, batch_size: int):
+    print("\n" + "="*60)
+    print("MIGRATING NEWS SOURCE FIELDS")
+    print("="*60 + "\n")
+
+    try:
+        mongo_client = MongoClient()
+        await mongo_client.connect()
+        print(" Connected to MongoDB")
+
+        collection = mongo_client.get_db["rss_news"]
+        pending_filter = {"$or": [{"source": {"$exists": False}}, {"quality_flag": {"$exists": False}}]}
+        pending = await collection.count_documents(pending_filter)
+        print(f"   {pending} articles need source/quality_flag\n")
+
+        updated = 0
+        operations = []
+        cursor = collection.find(pending_filter, {"link": 1, "title": 1}).batch_size(batch_size)
+        async for article in cursor:
+            operations.append(UpdateOne(
+                {"_id": article["_id"]},
+                {"$set": {
+                    "source": SentimentRollupRepository.source_from_link(article.get("link", "")),
+                    "quality_flag": classify_quality(article),
+                }}
+            ))
+            if len(operations) >= batch_size:
+                result = await collection.bulk_write(operations, ordered=False)
+                updated += result.modified_count
+                operations = []
+                print(f"   Updated {updated} articles...")
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+        print(f" Backfill complete: {updated} articles updated")
+
+        if dedupe_links:
+            print("\n Removing duplicate links...")
+            removed = await _dedupe_links(collection)
+            print(f"   Removed {removed} duplicate articles")
+
+        print("\n Ensuring managed indexes...")
+        manager = NewsIndexManager(mongo_client)
+        await manager.ensure_indexes()
+        report = await manager.report()
+        for name, keys in report["indexes"].items():
+            print(f"   {name}: {keys}")
+        if report["missing"]:
+            print(f"\n Missing indexes: {', '.join(report['missing'])}")
+            print("   (link_unique fails while duplicate links exist; re-run with --dedupe-links)")
+
+        await RSSRepository().check_source_fields()
+        await mongo_client.close()
+
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+
+    print("\n" + "="*60 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill source/quality_flag on rss_news and create indexes")
+    parser.add_argument("--dedupe-links", action="store_true", help="Delete older duplicates of the same link")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per bulk write")
+    args = parser.parse_args()
+
+    asyncio.run(migrate_news_source_fields(args.dedupe_links, args.batch_size))
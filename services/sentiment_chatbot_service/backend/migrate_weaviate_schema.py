@@ -0,0 +1,156 @@
+"""
+Migrate the RSSNews Weaviate collection to a new schema version
+Creates the versioned collection (RSSNews_v2: embeds title + clean_text only, range-indexed
+published/score), backfills it from the collection currently served as `RSSNews`, catches up
+on articles saved in MongoDB meanwhile and swaps the `RSSNews` alias to it.
+
+Usage:
+    python migrate_weaviate_schema.py status
+    python migrate_weaviate_schema.py migrate [--version 2] [--batch-size 200] [--concurrency 2]
+    python migrate_weaviate_schema.py rollback          # alias back to the previous version
+    python migrate_weaviate_schema.py drop --version 1  # delete an old version
+    python migrate_weaviate_schema.py compress --compression pq  # quantize the served collection in place
+    python migrate_weaviate_schema.py bench [--from-version 1] [--version 2] [--sample 50] [--runs 20]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from weaviate.classes.query import Filter
+from app.Database.mongo_client import MongoClient
+from app.Database.weaviate_client import WeaviateRegistry
+from app.Database.weaviate_schema import (
+    NewsSchemaMigrator, NEWS_ALIAS, LATEST_NEWS_SCHEMA_VERSION, versioned_name, vectorized_fields
+)
+
+
+def _print_dict(result: dict, indent: str = "   "):
+    for key, value in result.items():
+        if isinstance(value, dict):
+            print(f"{indent}{key}:")
+            _print_dict(value, indent + "   ")
+        else:
+            print(f"{indent}{key}: {value}")
+
+
+def _percentile(timings: list, p: float) -> float:
+    timings = sorted(timings)
+    return timings[max(0, int(len(timings) * p) - 1)]
+
+
+def bench(migrator: NewsSchemaMigrator, from_version: int, to_version: int, sample: int, runs: int):
+    """Compare embedding input size, ingest time and date-filtered query latency between two versions."""
+    serving, serving_version = migrator.current()
+    served_by = {v: versioned_name(v) for v in (from_version, to_version)}
+    if serving_version in served_by:
+        served_by[serving_version] = serving  # a legacy v1 collection is named RSSNews
+    source = served_by[from_version]
+    objects = list(migrator.client.collections.get(source).query.fetch_objects(limit=sample).objects)
+    if not objects:
+        print(f" {source} is empty; nothing to benchmark")
+        return
+    since = datetime.now(timezone.utc) - timedelta(days=7)
+    date_filter = (Filter.by_property("published").greater_or_equal(since)
+                   & Filter.by_property("score").greater_than(0.5))
+
+    print(f"\n{'version':<10}{'embed chars/obj':>17}{'ingest s':>10}{'ms/obj':>9}{'filter p50':>12}{'filter p95':>12}")
+    print("-" * 70)
+    for version in (from_version, to_version):
+        fields = vectorized_fields(version)
+        chars = statistics.mean(sum(len(str(o.properties.get(f) or "")) for f in fields) for o in objects)
+
+        # Ingest: embed the same sample through each schema's vectorizer
+        scratch = f"{NEWS_ALIAS}Bench_v{version}"
+        if migrator.client.collections.exists(scratch):
+            migrator.client.collections.delete(scratch)
+        migrator.create_version(version, name=scratch)
+        collection = migrator.client.collections.get(scratch)
+        started = time.perf_counter()
+        with collection.batch.fixed_size(batch_size=50, concurrent_requests=1) as batch:
+            for obj in objects:
+                batch.add_object(properties={k: v for k, v in obj.properties.items() if v is not None})
+        ingest = time.perf_counter() - started
+        migrator.client.collections.delete(scratch)
+
+        # Date-filtered reads against the full collection of that version
+        target = served_by[version]
+        timings = []
+        if migrator.client.collections.exists(target):
+            served = migrator.client.collections.get(target)
+            for _ in range(runs):
+                started = time.perf_counter()
+                served.query.fetch_objects(filters=date_filter, limit=50)
+                timings.append((time.perf_counter() - started) * 1000)
+        p50 = f"{statistics.median(timings):.1f}" if timings else "n/a"
+        p95 = f"{_percentile(timings, 0.95):.1f}" if timings else "n/a"
+        print(f"v{version:<9}{chars:>17.0f}{ingest:>10.2f}{ingest / len(objects) * 1000:>9.0f}{p50:>12}{p95:>12}")
+
+
+async def run(command: str, version: int, from_version: int, batch_size: int, concurrency: int, sample: int, runs: int,
+              compression: str):
+    print("\n" + "="*60)
+    print(f"RSSNEWS SCHEMA MIGRATION: {command.upper()}")
+    print("="*60 + "\n")
+    
+    registry = WeaviateRegistry()
+    mongo_client = MongoClient()
+    try:
+        registry.connect()
+        migrator = NewsSchemaMigrator(registry)
+        
+        if command == "status":
+            _print_dict(migrator.status())
+        
+        elif command == "migrate":
+            await mongo_client.connect()
+            from app.Database.repositories.rss_repository import RSSRepository
+            await RSSRepository().check_source_fields()
+            await RSSRepository().check_archive()
+            source, current = migrator.current()
+            print(f" Serving {source} (schema v{current}); migrating to v{version}")
+            print(f" New collection embeds: {', '.join(vectorized_fields(version))}\n")
+            result = await migrator.migrate(version, batch_size, concurrency)
+            print(f"\n Migration {'complete' if result.get('migrated') else 'not applied'}")
+            _print_dict(result)
+        
+        elif command == "rollback":
+            target = migrator.rollback()
+            print(f" {NEWS_ALIAS} now serves {target}")
+        
+        elif command == "compress":
+            name = migrator.enable_compression(compression)
+            print(f" {compression.upper()} enabled on {name}")
+        
+        elif command == "drop":
+            migrator.drop(version)
+            print(f" Dropped {versioned_name(version)}")
+        
+        elif command == "bench":
+            bench(migrator, from_version, version, sample, runs)
+        
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        registry.close()
+        await mongo_client.close()
+    
+    print("\n" + "="*60 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Versioned RSSNews schema migrations with alias swap")
+    parser.add_argument("command", choices=["status", "migrate", "rollback", "drop", "compress", "bench"])
+    parser.add_argument("--version", type=int, default=LATEST_NEWS_SCHEMA_VERSION, help="Target (or dropped) schema version")
+    parser.add_argument("--from-version", type=int, default=1, help="Baseline version for bench")
+    parser.add_argument("--batch-size", type=int, default=200, help="Objects per backfill batch")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent backfill batch requests")
+    parser.add_argument("--sample", type=int, default=50, help="Objects embedded per version in bench")
+    parser.add_argument("--runs", type=int, default=20, help="Timed date-filtered queries per version in bench")
+    parser.add_argument("--compression", choices=["pq", "bq"], default="pq", help="Quantizer for compress")
+    args = parser.parse_args()
+    
+    asyncio.run(run(args.command, args.version, args.from_version, args.batch_size, args.concurrency, args.sample, args.runs,
+                    args.compression))
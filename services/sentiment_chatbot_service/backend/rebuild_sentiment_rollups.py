@@ -0,0 +1,50 @@
+"""
+Rebuild the daily sentiment rollups from MongoDB
+Recomputes every (day, source, sentiment) bucket in `news_sentiment_daily` from the served
+articles in `rss_news` and the `rss_news_archive` tier.
+Run once after deploying the rollups, or whenever the buckets drift from the raw articles.
+"""
+import asyncio
+from app.Database.mongo_client import MongoClient
+from app.Database.repositories.rss_repository import RSSRepository
+from app.Database.repositories.sentiment_rollup_repository import SentimentRollupRepository
+from app.Database.repositories.news_archive_repository import ARCHIVE_COLLECTION
+
+async def rebuild_sentiment_rollups():
+    print("\n" + "="*60)
+    print("REBUILDING SENTIMENT ROLLUPS")
+    print("="*60 + "\n")
+    
+    try:
+        mongo_client = MongoClient()
+        await mongo_client.connect()
+        print(" Connected to MongoDB")
+        
+        rollups = SentimentRollupRepository(mongo_client)
+        # Full scan of the raw articles: an analytic read
+        news_collection = mongo_client.get_analytics_db["rss_news"]
+        archive_collection = mongo_client.get_analytics_db[ARCHIVE_COLLECTION]
+        
+        total_articles = await news_collection.count_documents({})
+        archived_articles = await archive_collection.count_documents({})
+        print(f"   Found {total_articles} articles in MongoDB ({archived_articles} archived)\n")
+        
+        print(" Aggregating articles into daily buckets...")
+        bucket_count = await rollups.rebuild_from(
+            [news_collection, archive_collection], servable=RSSRepository.is_servable
+        )
+        
+        print("\n Rebuild complete!")
+        print(f"   Buckets written: {bucket_count}")
+        
+        await mongo_client.close()
+        
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    
+    print("\n" + "="*60 + "\n")
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_sentiment_rollups())
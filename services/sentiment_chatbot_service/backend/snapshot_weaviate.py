@@ -0,0 +1,88 @@
+"""
+Snapshot Weaviate collections with their vectors
+Exports every object of a collection (RSSNews by default) with its vector to a local
+Arrow file, and restores it with the vectors supplied so nothing is re-embedded through
+Ollama. Use it to seed a new environment, recover from a lost volume, or carry vectors
+across a schema change.
+
+Usage:
+    python snapshot_weaviate.py export [--collection RSSNews] [--file data/snapshots/RSSNews.arrow]
+    python snapshot_weaviate.py import [--collection RSSNews] [--file ...] [--batch-size 200] [--concurrency 2]
+    python snapshot_weaviate.py bench  [--collection RSSNews]   # export, restore into a scratch collection, compare
+"""
+import argparse
+import os
+from app.Database.weaviate_client import WeaviateRegistry
+from app.Database.weaviate_snapshot import WeaviateSnapshot
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "snapshots")
+
+
+def _count(registry: WeaviateRegistry, name: str) -> int:
+    result = registry.client.collections.get(name).aggregate.over_all(total_count=True)
+    return result.total_count if hasattr(result, 'total_count') else 0
+
+
+def _print_result(label: str, result: dict):
+    print(f"\n {label} complete!")
+    for key, value in result.items():
+        print(f"   {key}: {value}")
+
+
+def run(command: str, collection: str, path: str, batch_size: int, concurrency: int):
+    print("\n" + "="*60)
+    print(f"WEAVIATE VECTOR SNAPSHOT: {command.upper()}")
+    print("="*60 + "\n")
+    
+    registry = WeaviateRegistry()
+    try:
+        registry.connect()
+        print(f" Connected to Weaviate ({registry.host}:{registry.http_port})")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        if command in ("export", "bench"):
+            print(f" Exporting {collection} ({_count(registry, collection)} objects) to {path}...")
+            _print_result("Export", WeaviateSnapshot(collection, registry).export(path))
+        
+        if command == "import":
+            metadata = WeaviateSnapshot.read_metadata(path)
+            print(f" Snapshot of {metadata['collection']} from {metadata['created_at']}: "
+                  f"{metadata['objects']} objects, {metadata['dimension']} dimensions")
+            result = WeaviateSnapshot(collection, registry).restore(path, batch_size, concurrency)
+            _print_result("Import", result)
+            print(f"   {collection} now holds {_count(registry, collection)} objects")
+        
+        if command == "bench":
+            scratch = f"{collection}SnapshotBench"
+            if registry.client.collections.exists(scratch):
+                registry.client.collections.delete(scratch)
+            print(f"\n Restoring into scratch collection {scratch}...")
+            result = WeaviateSnapshot(scratch, registry).restore(path, batch_size, concurrency)
+            _print_result("Import", result)
+            source_count, restored_count = _count(registry, collection), _count(registry, scratch)
+            print(f"\n Objects: {collection}={source_count}, {scratch}={restored_count} "
+                  f"({'match' if source_count == restored_count else 'MISMATCH'})")
+            registry.client.collections.delete(scratch)
+            print(f" Dropped {scratch}")
+        
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        registry.close()
+    
+    print("\n" + "="*60 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export/import Weaviate objects with their vectors")
+    parser.add_argument("command", choices=["export", "import", "bench"])
+    parser.add_argument("--collection", default="RSSNews", help="Collection to export, or to import into")
+    parser.add_argument("--file", default=None, help="Snapshot file (default data/snapshots/<collection>.arrow)")
+    parser.add_argument("--batch-size", type=int, default=200, help="Objects per import batch request")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent import batch requests")
+    args = parser.parse_args()
+    
+    path = args.file or os.path.join(DEFAULT_DIR, f"{args.collection}.arrow")
+    run(args.command, args.collection, path, args.batch_size, args.concurrency)
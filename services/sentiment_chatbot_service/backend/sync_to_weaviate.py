@@ -1,109 +1,67 @@
 """
 Sync MongoDB news articles to Weaviate
-This will copy all economynext articles from MongoDB to Weaviate for vector search
+Incremental, checkpointed sync of economynext articles from MongoDB into the RSSNews
+collection. Only articles changed since the last completed run are upserted (and
+re-vectorized); object UUIDs are derived from the MongoDB id, so re-runs are idempotent.
+An interrupted run resumes after the last flushed batch.
+
+Usage:
+    python sync_to_weaviate.py                 # incremental (first run syncs everything)
+    python sync_to_weaviate.py --full          # upsert every article, ignoring the watermark
+    python sync_to_weaviate.py --prune         # also delete objects whose article is gone
+    python sync_to_weaviate.py --reset         # forget the watermark and exit
+    [--batch-size 200] [--concurrency 2]
 """
+import argparse
 import asyncio
-from app.Database.repositories.rss_repository import RSSRepository
-from app.Database.weaviate_client import WeaviateClient
-from datetime import datetime
+from app.Database.mongo_client import MongoClient
+from app.Database.weaviate_client import WeaviateRegistry
+from app.services.news.weaviate_sync import WeaviateSyncEngine
 
-async def sync_mongodb_to_weaviate():
+async def sync_mongodb_to_weaviate(full: bool, prune: bool, reset: bool, batch_size: int, concurrency: int):
     print("\n" + "="*60)
     print("SYNCING MONGODB TO WEAVIATE")
     print("="*60 + "\n")
     
     try:
-        # Connect to MongoDB first
-        from app.Database.mongo_client import MongoClient
         mongo_client = MongoClient()
         await mongo_client.connect()
-        print(" Connected to MongoDB")
-        
-        # Connect to both databases
-        mongo_repo = RSSRepository()
-        weaviate_client = WeaviateClient(collection_name="RSSNews")
-        
-        if not weaviate_client.is_connected:
-            weaviate_client.connect()
-        
+        registry = WeaviateRegistry()
+        registry.connect()
         print(" Connected to MongoDB and Weaviate\n")
         
-        # Get all economynext articles from MongoDB
-        print(" Fetching articles from MongoDB...")
-        articles = await mongo_repo.get_latest_news(limit=500)  # Get more articles
-        
-        print(f"   Found {len(articles)} articles in MongoDB")
-        
-        if articles:
-            first_date = articles[0].get("published", "Unknown")
-            last_date = articles[-1].get("published", "Unknown")
-            print(f"   Date range: {last_date} to {first_date}\n")
+        engine = WeaviateSyncEngine(batch_size=batch_size, concurrency=concurrency)
         
-        if not articles:
-            print(" No articles found in MongoDB!")
-            return
+        if reset:
+            await engine.reset()
+            print(" Sync watermark cleared; the next run syncs every article")
+        else:
+            state = await engine.state.get(engine.job)
+            print(f" Watermark: {state.get('watermark', 'none (first run)')}")
+            if state.get("run_started_at"):
+                print(f" Resuming unfinished run from {state['run_started_at']} after _id {state.get('last_id')}")
+            
+            print(f" Syncing with batch size {engine.batch_size}, concurrency {engine.concurrency}...")
+            result = await engine.run(full=full)
+            
+            print(f"\n Sync {'stopped early' if result['failed'] else 'complete'}!")
+            print(f"   Upserted: {result['synced']}")
+            print(f"   Failed: {result['failed']}")
+            if result["watermark"]:
+                print(f"   New watermark: {result['watermark']}")
+            
+            if prune:
+                print("\n Pruning objects whose article no longer exists...")
+                removed = await engine.prune()
+                print(f"   Removed: {removed}")
+            
+            # Verify count
+            result = engine.handle.collection.aggregate.over_all(total_count=True)
+            total = result.total_count if hasattr(result, 'total_count') else 0
+            print(f"\n Total documents in Weaviate now: {total}")
         
-        # Clear existing Weaviate data for fresh sync
-        print(" Clearing existing Weaviate data...")
-        try:
-            weaviate_client.collection.data.delete_many(
-                where={
-                    "path": ["mongoId"],
-                    "operator": "IsNotNull"
-                }
-            )
-            print("   Cleared existing data\n")
-        except Exception as e:
-            print(f"   Note: Could not clear data (might be empty): {e}\n")
-        
-        # Batch sync to Weaviate for better performance
-        print(" Syncing to Weaviate using batch insert...")
-        synced = 0
-        skipped = 0
-        errors = 0
-        
-        # Use batch insert for much faster sync
-        with weaviate_client.collection.batch.dynamic() as batch:
-            for article in articles:
-                try:
-                    mongo_id = str(article.get("_id"))
-                    
-                    # Prepare data for Weaviate
-                    data = {
-                        "mongoId": mongo_id,
-                        "title": article.get("title", ""),
-                        "content": article.get("content", ""),
-                        "clean_text": article.get("clean_text", ""),
-                        "summary": article.get("summary", ""),
-                        "link": article.get("link", ""),
-                        "published": article.get("published", datetime.utcnow()),
-                        "sentiment": article.get("sentiment", "neutral"),
-                        "score": article.get("score", 0.0)
-                    }
-                    
-                    # Add to batch
-                    batch.add_object(properties=data)
-                    synced += 1
-                    
-                    if synced % 50 == 0:
-                        print(f"   Synced {synced} articles...")
-                        
-                except Exception as e:
-                    errors += 1
-                    if errors <= 5:  # Only show first 5 errors
-                        print(f"     Error syncing article '{article.get('title', 'unknown')[:50]}': {e}")
-        
-        print(f"\n Sync complete!")
-        print(f"   Synced: {synced}")
-        print(f"   Skipped: {skipped}")
-        print(f"   Errors: {errors}")
-        
-        # Verify count
-        result = weaviate_client.collection.aggregate.over_all(total_count=True)
-        total = result.total_count if hasattr(result, 'total_count') else 0
-        print(f"\n Total documents in Weaviate now: {total}")
-        
-        weaviate_client.close()
+        registry.close()
+        await mongo_client.close()
         
     except Exception as e:
         print(f"\n ERROR: {e}")
@@ -113,4 +71,12 @@ async def sync_mongodb_to_weaviate():
     print("\n" + "="*60 + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(sync_mongodb_to_weaviate())
+    parser = argparse.ArgumentParser(description="Incrementally sync MongoDB news articles to Weaviate")
+    parser.add_argument("--full", action="store_true", help="Upsert every article, ignoring the watermark")
+    parser.add_argument("--prune", action="store_true", help="Delete Weaviate objects whose article no longer exists")
+    parser.add_argument("--reset", action="store_true", help="Clear the watermark and any unfinished run, then exit")
+    parser.add_argument("--batch-size", type=int, default=None, help="Articles per flushed batch (WEAVIATE_SYNC_BATCH_SIZE)")
+    parser.add_argument("--concurrency", type=int, default=None, help="Concurrent batch requests (WEAVIATE_SYNC_CONCURRENCY)")
+    args = parser.parse_args()
+    
+    asyncio.run(sync_mongodb_to_weaviate(args.full, args.prune, args.reset, args.batch_size, args.concurrency))
@@ -3,6 +3,7 @@ Test script to verify date filtering for "latest news" queries
 """
 import asyncio
 from datetime import datetime, timedelta
+from app.Database.weaviate_client import WeaviateRegistry
 from app.services.news_rag_service import NewsRAGService
 
 async def test_date_filtering():
@@ -61,7 +62,7 @@ async def test_date_filtering():
     print(" TEST COMPLETE")
     print("="*70 + "\n")
     
-    service.weaviate_client.close()
+    WeaviateRegistry().close()
 
 if __name__ == "__main__":
     asyncio.run(test_date_filtering())
@@ -3,6 +3,7 @@ Test the fallback date filtering logic
 """
 import asyncio
 from datetime import datetime
+from app.Database.weaviate_client import WeaviateRegistry
 from app.services.news_rag_service import NewsRAGService
 
 async def test_fallback():
@@ -60,7 +61,7 @@ articles haven't been published yet!
         import traceback
         traceback.print_exc()
     
-    service.weaviate_client.close()
+    WeaviateRegistry().close()
     print("\n" + "="*70 + "\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+"""
+Test hedged retrieval (Weaviate raced against the lexical fallback)
+Simulates a slow and a failing Weaviate leg on a live NewsRAGService and checks
+that retrieval latency stays bounded by the hedge delay plus the fallback.
+"""
+import asyncio
+import time
+from app.Database.weaviate_client import WeaviateRegistry
+from app.services.news_rag_service import NewsRAGService
+
+
+async def test_hedged_retrieval():
+    print("\n" + "="*70)
+    print("TESTING HEDGED RETRIEVAL")
+    print("="*70 + "\n")
+
+    service = NewsRAGService()
+    service.hedge_enabled = True
+    service.hedge_delay = 0.2
+    service.retrieval_deadline = 3.0
+    query = "central bank interest rates"
+    real_search_weaviate = service._search_weaviate
+
+    async def slow_weaviate(*args, **kwargs):
+        await asyncio.sleep(10)
+        return await real_search_weaviate(*args, **kwargs)
+
+    async def failing_weaviate(*args, **kwargs):
+        raise ConnectionError("simulated Weaviate outage")
+
+    scenarios = [
+        ("healthy Weaviate", real_search_weaviate),
+        ("slow Weaviate (10s)", slow_weaviate),
+        ("failing Weaviate", failing_weaviate),
+    ]
+
+    for name, leg in scenarios:
+        service._search_weaviate = leg
+        started = time.perf_counter()
+        results, source = await service._search_news_uncached(query, limit=5)
+        elapsed = time.perf_counter() - started
+
+        print(f" {name:<22} {len(results)} articles from {source} in {elapsed * 1000:.0f}ms")
+        assert elapsed < service.retrieval_deadline + 0.5, f"{name}: retrieval exceeded the deadline"
+
+    print(f"\n Hedge stats: {service.hedge_stats()}")
+    service.close()
+    WeaviateRegistry().close()
+    print("\n" + "="*70 + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_hedged_retrieval())
@@ -0,0 +1,130 @@
+"""
+Test that slow Weaviate queries no longer freeze the event loop.
+Simulates a blocking `collection.query.hybrid` call and checks that a concurrent
+request (a heartbeat coroutine) keeps being scheduled while the queries run.
+Does not need a running Weaviate instance.
+"""
+import asyncio
+import time
+from app.Database.weaviate_async import AsyncWeaviateQuery, WeaviateExecutor
+
+SLOW_QUERY_SECONDS = 0.5
+CONCURRENT_QUERIES = 4
+HEARTBEAT_INTERVAL = 0.05
+
+
+class _SlowQuery:
+    """Stand-in for `collection.query` whose calls block like a gRPC round trip."""
+
+    def hybrid(self, **kwargs):
+        time.sleep(SLOW_QUERY_SECONDS)
+        return {"objects": [], "query": kwargs.get("query")}
+
+
+class _SlowCollection:
+    query = _SlowQuery()
+
+
+async def _heartbeat(stop: asyncio.Event, gaps: list):
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def run_concurrency_check():
+    print("\n" + "="*60)
+    print("TESTING NON-BLOCKING WEAVIATE QUERIES")
+    print("="*60 + "\n")
+
+    executor = WeaviateExecutor()
+    assert executor.max_workers >= CONCURRENT_QUERIES, "set WEAVIATE_MAX_CONCURRENCY to at least 4"
+    news_query = AsyncWeaviateQuery(lambda: _SlowCollection(), executor)
+
+    stop = asyncio.Event()
+    gaps = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, gaps))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[
+        news_query.hybrid(query=f"query {i}", limit=5) for i in range(CONCURRENT_QUERIES)
+    ])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await heartbeat
+
+    max_gap = max(gaps) if gaps else 0
+    print(f" {CONCURRENT_QUERIES} slow queries ({SLOW_QUERY_SECONDS}s each) took {elapsed:.2f}s")
+    print(f" Heartbeat ticks: {len(gaps)}, longest gap: {max_gap * 1000:.0f}ms")
+
+    assert [r["query"] for r in results] == [f"query {i}" for i in range(CONCURRENT_QUERIES)]
+    # Queries overlap instead of running back to back
+    assert elapsed < SLOW_QUERY_SECONDS * CONCURRENT_QUERIES * 0.75
+    # The loop kept serving other work while queries were in flight
+    assert max_gap < SLOW_QUERY_SECONDS / 2
+    assert len(gaps) >= int(SLOW_QUERY_SECONDS / HEARTBEAT_INTERVAL / 2)
+
+    WeaviateExecutor().shutdown()
+    print("\n PASSED: event loop stayed responsive during slow queries")
+    print("\n" + "="*60 + "\n")
+
+
+def _blocking_getter():
+    """Stand-in for a collection lookup whose health check or reconnect blocks."""
+    time.sleep(SLOW_QUERY_SECONDS)
+    return _FastCollection()
+
+
+class _FastQuery:
+    def hybrid(self, **kwargs):
+        return {"objects": [], "query": kwargs.get("query")}
+
+
+class _FastCollection:
+    query = _FastQuery()
+
+
+async def run_blocking_getter_check():
+    print("\n" + "="*60)
+    print("TESTING BLOCKING COLLECTION LOOKUPS")
+    print("="*60 + "\n")
+
+    news_query = AsyncWeaviateQuery(_blocking_getter, WeaviateExecutor())
+
+    stop = asyncio.Event()
+    gaps = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, gaps))
+
+    results = await asyncio.gather(*[
+        news_query.hybrid(query=f"query {i}", limit=5) for i in range(CONCURRENT_QUERIES)
+    ])
+
+    stop.set()
+    await heartbeat
+
+    max_gap = max(gaps) if gaps else 0
+    print(f" {CONCURRENT_QUERIES} lookups blocking {SLOW_QUERY_SECONDS}s each, longest heartbeat gap: {max_gap * 1000:.0f}ms")
+
+    assert [r["query"] for r in results] == [f"query {i}" for i in range(CONCURRENT_QUERIES)]
+    # The lookup ran in the pool, not on the event loop
+    assert max_gap < SLOW_QUERY_SECONDS / 2
+
+    WeaviateExecutor().shutdown()
+    print("\n PASSED: event loop stayed responsive during blocking lookups")
+    print("\n" + "="*60 + "\n")
+
+
+def test_event_loop_stays_responsive():
+    asyncio.run(run_concurrency_check())
+
+
+def test_blocking_lookup_stays_off_the_loop():
+    asyncio.run(run_blocking_getter_check())
+
+
+if __name__ == "__main__":
+    asyncio.run(run_concurrency_check())
+    asyncio.run(run_blocking_getter_check())
@@ -0,0 +1,65 @@
+"""
+Move aged news articles to the archive tier
+Copies `rss_news` articles published more than NEWS_HOT_TIER_DAYS ago into the compressed
+`rss_news_archive` collection and removes them from the hot collection. The API runs the
+same job daily; use this for the first (large) move or a different age.
+
+Usage:
+    python tier_news_archive.py [--days 180] [--batch-size 500] [--dry-run]
+"""
+import argparse
+import asyncio
+from app.Database.mongo_client import MongoClient
+from app.Database.repositories.news_archive_repository import ARCHIVE_COLLECTION
+from app.services.news.news_tiering import NewsTieringJob
+
+async def tier_news_archive(days: int, batch_size: int, dry_run: bool):
+    print("\n" + "="*60)
+    print("ARCHIVING AGED NEWS")
+    print("="*60 + "\n")
+    
+    try:
+        mongo_client = MongoClient()
+        await mongo_client.connect()
+        print(" Connected to MongoDB")
+        
+        job = NewsTieringJob(hot_days=days, batch_size=batch_size)
+        if not job.enabled:
+            print(" Tiering disabled (hot tier age is 0 days)")
+        else:
+            pending = await job.pending()
+            print(f"   {pending} articles published before {job.cutoff():%Y-%m-%d} are due for the archive\n")
+            
+            if not dry_run and pending:
+                result = await job.run()
+                print(f" Moved {result['moved']} articles to {ARCHIVE_COLLECTION}")
+            
+            db = mongo_client.get_db
+            stats = {}
+            for name in ("rss_news", ARCHIVE_COLLECTION):
+                try:
+                    stats[name] = await db.command("collStats", name)
+                except Exception:
+                    stats[name] = {}
+            print("\n Tier sizes:")
+            for name, info in stats.items():
+                print(f"   {name}: {info.get('count', 0)} articles, "
+                      f"{info.get('size', 0) / 1e6:.1f} MB data, {info.get('storageSize', 0) / 1e6:.1f} MB on disk")
+        
+        await mongo_client.close()
+        
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    
+    print("\n" + "="*60 + "\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move aged news articles to the archive collection")
+    parser.add_argument("--days", type=int, default=None, help="Hot tier age in days (NEWS_HOT_TIER_DAYS)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Articles moved per batch (NEWS_TIERING_BATCH_SIZE)")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many articles would move")
+    args = parser.parse_args()
+    
+    asyncio.run(tier_news_archive(args.days, args.batch_size, args.dry_run))
@@ -1,18 +1,93 @@
 import json
+import time
+from dataclasses import dataclass, field
 from kafka import KafkaConsumer
-from typing import Dict, Any, Optional, List, Tuple
+from kafka.consumer.subscription_state import ConsumerRebalanceListener
+from kafka.errors import CommitFailedError
+from kafka.structs import TopicPartition, OffsetAndMetadata
+from typing import Dict, Any, Optional, List, Tuple, Generator, Callable
 from config import config
 from Scripts.models import KafkaMessage
+from Scripts.retry_topics import retry_metadata, retry_topics
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class MessageBatch:
+    """CDC messages from one or more polls, with the Kafka offsets needed to commit them."""
+    messages: List[Tuple[str, KafkaMessage]] = field(default_factory=list)
+    # (partition, offset) of each entry in `messages`
+    positions: List[Tuple[TopicPartition, int]] = field(default_factory=list)
+    # Delivery attempts before this one (0 for source topics, n for retry tier n)
+    attempts: List[int] = field(default_factory=list)
+    # Offset after the last record read per partition, including skipped (malformed) records
+    next_offsets: Dict[TopicPartition, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def add(self, partition: TopicPartition, record, cdc_message: Optional[KafkaMessage],
+            topic: str = None, attempt: int = 0):
+        """Add a record; `topic` is the source topic for records read from a retry topic."""
+        if cdc_message is not None:
+            self.messages.append((topic or record.topic, cdc_message))
+            self.positions.append((partition, record.offset))
+            self.attempts.append(attempt)
+        self.next_offsets[partition] = record.offset + 1
+
+    @classmethod
+    def merge(cls, batches: List["MessageBatch"]) -> "MessageBatch":
+        """Concatenate batches in consumption order (later offsets win per partition)."""
+        merged = cls()
+        for batch in batches:
+            merged.messages.extend(batch.messages)
+            merged.positions.extend(batch.positions)
+            merged.attempts.extend(batch.attempts)
+            merged.next_offsets.update(batch.next_offsets)
+        return merged
+
+    def commit_offsets(self, results: List[bool]) -> Dict[TopicPartition, int]:
+        """
+        Offset to commit per partition given a success flag per message.
+
+        A partition is committed past the whole batch, or only up to its
+        first failed message so that message is read again.
+        """
+        offsets = dict(self.next_offsets)
+        for (partition, offset), success in zip(self.positions, results):
+            if not success and offset < offsets[partition]:
+                offsets[partition] = offset
+        return offsets
+
+
+class _FlushOnRevoke(ConsumerRebalanceListener):
+    """Writes and commits the batch being collected before its partitions move to another consumer."""
+
+    def __init__(self, owner: "MultiKafkaConsumer"):
+        self.owner = owner
+
+    def on_partitions_revoked(self, revoked):
+        logger.info(f"Partitions revoked: {sorted(revoked)}")
+        self.owner.flush_pending()
+
+    def on_partitions_assigned(self, assigned):
+        logger.info(f"Partitions assigned: {sorted(assigned)}")
+
+
 class MultiKafkaConsumer:
     """Kafka consumer for MongoDB CDC messages from multiple topics."""
 
     def __init__(self):
         self.config = config
         self.consumer = None
+        # Called with the batch being collected when a rebalance revokes partitions;
+        # must write it (and anything still in flight) and commit via commit_batch
+        self.revoke_handler: Optional[Callable[[MessageBatch], None]] = None
+        self._pending = MessageBatch()
+        # Retry-topic partitions paused until their next record is due (epoch seconds)
+        self._paused: Dict[TopicPartition, float] = {}
 
     @staticmethod
     def safe_json_deserializer(x):
@@ -20,84 +95,224 @@ class MultiKafkaConsumer:
             return None
         return json.loads(x.decode('utf-8'))
 
-    def connect(self):
-        """Initialize Kafka consumer subscribed to multiple topics."""
+    def connect(self, kafka_consumer=None):
+        """
+        Initialize Kafka consumer subscribed to multiple topics.
+
+        Args:
+            kafka_consumer: Pre-built consumer client (e.g. a local stand-in in tests);
+                defaults to a KafkaConsumer for the configured broker
+        """
         try:
             topics: List[str] = [t.strip() for t in self.config.kafka_topics.split(",")]
+            if self.config.retry_topics_enabled:
+                topics += [retry for topic in topics for retry in retry_topics(topic)]
 
-            self.consumer = KafkaConsumer(
-                *topics,
+            # With manual commits, offsets are committed by commit_batch once a batch is written
+            self.consumer = kafka_consumer or KafkaConsumer(
                 bootstrap_servers=[self.config.kafka_broker],
                 group_id=self.config.kafka_group_id,
                 auto_offset_reset='earliest',
-                enable_auto_commit=True,
+                enable_auto_commit=not self.config.kafka_manual_commit,
                 auto_commit_interval_ms=5000,
                 value_deserializer=MultiKafkaConsumer.safe_json_deserializer,
-                consumer_timeout_ms=1000
+                consumer_timeout_ms=1000,
+                max_poll_records=self.config.batch_size
             )
+            self.consumer.subscribe(topics=topics, listener=_FlushOnRevoke(self))
 
             logger.info(f"Connected to Kafka topics: {topics}")
-            logger.info(f"Consumer group: {self.config.kafka_group_id}")
+            logger.info(
+                f"Consumer group: {self.config.kafka_group_id}, "
+                f"{'manual' if self.config.kafka_manual_commit else 'auto'} offset commits"
+            )
 
         except Exception as e:
             logger.error(f"Failed to connect to Kafka: {e}")
             raise
 
-    from typing import Generator
-
-    def consume_messages(self) -> Generator[Tuple[str, KafkaMessage], None, None]:
+    def consume_batches(self, yield_idle: bool = False) -> Generator[MessageBatch, None, None]:
         """
-        Generator that yields (topic, KafkaMessage) tuples.
-        
+        Generator that yields micro-batches of CDC messages.
+
+        A batch is yielded once it holds `batch_size` messages or
+        `batch_max_wait_ms` after its first message arrived, whichever comes
+        first, so a backfill burst is written in full batches while a single
+        live change is still delivered within the wait. Messages keep their
+        partition order.
+
+        With manual commits, pass each batch to `commit_batch` after it has
+        been written; nothing is committed before that.
+
+        Args:
+            yield_idle: Also yield after polls that leave no message pending, with
+                an empty batch (possibly carrying the offsets of skipped records),
+                so a caller writing batches in the background can commit finished
+                work while the topic is quiet
+
         Yields:
-            (topic, KafkaMessage) for each consumed message
+            MessageBatch objects (non-empty unless `yield_idle`)
         """
         if not self.consumer:
             raise RuntimeError("Consumer not initialized. Call connect() first.")
 
-        try:
-            logger.info("Starting to consume CDC messages...")
-
-            for message in self.consumer:
-                topic = message.topic
-                try:
-                    raw_data = message.value
-                    logger.debug(f"Received raw message from topic={topic}: {raw_data}")
-
-                    if raw_data is None:
-                        mongo_id = self._extract_mongo_id_from_key(message.key) if message.key else None
-                        if mongo_id:
-                            logger.info(f"Tombstone received for MongoDB ID: {mongo_id} on topic {topic}")
-                            delete_message = KafkaMessage(
-                                operationType="delete",
-                                documentKey={"_id": mongo_id},
-                                fullDocument=None,
-                                fullDocumentBeforeChange=None
-                            )
-                            yield topic, delete_message
-                        else:
-                            logger.warning("Tombstone message received but no key found")
+        logger.info(
+            f"Starting to consume CDC messages in batches of up to {self.config.batch_size} "
+            f"(max wait {self.config.batch_max_wait_ms} ms)..."
+        )
+        deadline = None
+        while True:
+            timeout_ms = self.config.batch_max_wait_ms
+            if deadline is not None:
+                timeout_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            self._resume_due()
+            if self._paused:
+                # Wake up when the next paused retry partition is due
+                timeout_ms = min(timeout_ms, max(0, int((min(self._paused.values()) - time.time()) * 1000)))
+
+            # A rebalance during poll may flush the pending batch (see flush_pending)
+            records = self.consumer.poll(timeout_ms=timeout_ms, max_records=self.config.batch_size - len(self._pending))
+            for partition, messages in records.items():
+                for message in messages:
+                    retry = retry_metadata(message)
+                    if retry is None:
+                        self._pending.add(partition, message, self._to_cdc_message(message))
                         continue
+                    topic, attempt, retry_at = retry
+                    if retry_at > time.time():
+                        # Not due yet: re-read it later without holding up other partitions.
+                        # Records behind it in the tier were parked later, so are due later too.
+                        self.consumer.seek(partition, message.offset)
+                        self.consumer.pause(partition)
+                        self._paused[partition] = retry_at
+                        break
+                    self._pending.add(partition, message, self._to_cdc_message(message), topic, attempt)
 
-                    cdc_message = self._parse_cdc_message(raw_data)
-                    if cdc_message:
-                        logger.info(f"[{topic}] Processing {cdc_message.operationType} for MongoDB ID: {cdc_message.get_mongo_id()}")
-                        yield topic, cdc_message
-                    else:
-                        logger.debug(f"[{topic}] Message skipped (empty or malformed)")
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON message from {topic}: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error processing message from {topic}: {e}")
-                    continue
-
-        except KeyboardInterrupt:
-            logger.info("Consumer stopped by user")
+            if not self._pending:
+                deadline = None
+                if yield_idle:
+                    batch, self._pending = self._pending, MessageBatch()
+                    yield batch
+                elif self._pending.next_offsets:
+                    # Only skipped records were read; commit past them
+                    self.commit_batch(self._pending, [])
+                    self._pending = MessageBatch()
+                continue
+
+            if deadline is None:
+                deadline = time.monotonic() + self.config.batch_max_wait_ms / 1000
+            if len(self._pending) >= self.config.batch_size or time.monotonic() >= deadline:
+                batch, self._pending = self._pending, MessageBatch()
+                deadline = None
+                yield batch
+
+    def _resume_due(self):
+        """Resume paused retry partitions whose next record is due."""
+        if not self._paused:
+            return
+        now = time.time()
+        due = [partition for partition, retry_at in self._paused.items() if retry_at <= now]
+        if due:
+            self.consumer.resume(*due)
+            for partition in due:
+                del self._paused[partition]
+
+    def commit_batch(self, batch: MessageBatch, results: List[bool]):
+        """
+        Commit a written batch per partition (no-op with auto commits).
+
+        A partition with a failed message is committed only up to that
+        message and rewound to it, so it is read again on the next poll
+        (at-least-once); the messages after it are re-processed too, which
+        is safe because Weaviate writes are idempotent upserts and deletes.
+
+        Args:
+            batch: Batch yielded by consume_batches
+            results: Success flag per message in `batch.messages`
+        """
+        if not self.config.kafka_manual_commit or not batch.next_offsets:
+            return
+        offsets = batch.commit_offsets(results)
+        assigned = self.consumer.assignment()
+        for partition, offset in offsets.items():
+            if offset < batch.next_offsets[partition] and partition in assigned:
+                logger.warning(f"Rewinding {partition.topic}[{partition.partition}] to failed offset {offset}")
+                self.consumer.seek(partition, offset)
+        try:
+            self.consumer.commit(offsets={p: OffsetAndMetadata(o, "") for p, o in offsets.items()})
+            logger.debug(f"Committed offsets: {offsets}")
+        except CommitFailedError as e:
+            # The group rebalanced; the new owner re-reads from the last committed offset
+            logger.warning(f"Offset commit failed, messages will be re-delivered: {e}")
+
+    def rewind_uncommitted(self):
+        """Seek every assigned partition back to its committed offset (after an interrupted batch)."""
+        self._pending = MessageBatch()
+        if not self.config.kafka_manual_commit or not self.consumer:
+            return
+        try:
+            for partition in self.consumer.assignment():
+                committed = self.consumer.committed(partition)
+                if committed is None:
+                    self.consumer.seek_to_beginning(partition)
+                else:
+                    self.consumer.seek(partition, committed)
+            logger.info("Rewound assigned partitions to their committed offsets")
         except Exception as e:
-            logger.error(f"Error in message consumption: {e}")
-            raise
+            logger.error(f"Failed to rewind to committed offsets: {e}")
+
+    def flush_pending(self):
+        """Write and commit the batch being collected (called before partitions are revoked)."""
+        batch, self._pending = self._pending, MessageBatch()
+        # Pauses do not survive the reassignment; not-yet-due records pause their partition again
+        self._paused.clear()
+        if self.revoke_handler is not None:
+            logger.info(f"Flushing {len(batch)} pending messages before rebalance")
+            self.revoke_handler(batch)
+        elif batch:
+            # Nothing can write it; leave it uncommitted so the next owner re-reads it
+            logger.warning(f"Dropping {len(batch)} uncommitted messages on rebalance")
+        elif batch.next_offsets:
+            self.commit_batch(batch, [])
+
+    def _to_cdc_message(self, message) -> Optional[KafkaMessage]:
+        """
+        Convert one Kafka record into a CDC message.
+
+        Returns:
+            KafkaMessage, or None for records that are skipped (malformed, tombstone without key)
+        """
+        topic = message.topic
+        try:
+            raw_data = message.value
+            logger.debug(f"Received raw message from topic={topic}: {raw_data}")
+
+            if raw_data is None:
+                mongo_id = self._extract_mongo_id_from_key(message.key) if message.key else None
+                if mongo_id:
+                    logger.info(f"Tombstone received for MongoDB ID: {mongo_id} on topic {topic}")
+                    return KafkaMessage(
+                        operationType="delete",
+                        documentKey={"_id": mongo_id},
+                        fullDocument=None,
+                        fullDocumentBeforeChange=None
+                    )
+                logger.warning("Tombstone message received but no key found")
+                return None
+
+            cdc_message = self._parse_cdc_message(raw_data)
+            if cdc_message:
+                logger.debug(f"[{topic}] Received {cdc_message.operationType} for MongoDB ID: {cdc_message.get_mongo_id()}")
+            else:
+                logger.debug(f"[{topic}] Message skipped (empty or malformed)")
+            return cdc_message
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode JSON message from {topic}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error processing message from {topic}: {e}")
+            return None
 
     
     def _parse_cdc_message(self, raw_data: Dict[str, Any]) -> Optional[KafkaMessage]:
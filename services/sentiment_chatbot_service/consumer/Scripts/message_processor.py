@@ -2,6 +2,7 @@ from Scripts.weaviate_client import WeaviateClient
 from Scripts.models import RSSNews, KafkaMessage, OperationType
 import logging
 from datetime import datetime
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -18,39 +19,82 @@ class MessageProcessor:
 
     def process_rss_message(self, cdc_message: KafkaMessage) -> bool:
         """Process RSS news CDC message from MongoDB."""
-        mongo_id = cdc_message.get_mongo_id()
-        
-        try:
-            # Handle DELETE operation
-            if cdc_message.operationType == OperationType.DELETE:
-                logger.info(f"Processing DELETE for RSS news ID: {mongo_id}")
-                return self.weaviate_client.delete_object("RSSNews", mongo_id)
+        return self.process_rss_batch([cdc_message])[0] is None
 
-            # Handle INSERT or UPDATE operations
-            raw_doc = cdc_message.get_data()
-            if not raw_doc:
-                logger.warning(f"No document data for MongoDB ID: {mongo_id}")
-                return False
+    def process_rss_batch(self, messages: List[KafkaMessage]) -> List[Optional[str]]:
+        """
+        Process a micro-batch of RSS news CDC messages with Weaviate batch writes.
 
-            # Normalize MongoDB dates and convert to Pydantic model
-            normalized = self._normalize_mongo_dates(raw_doc)
-            rss_news = RSSNews(**normalized)
+        Changes to the same article are coalesced into its final state: only
+        the last message per mongoId is written, and every message of that
+        article shares the outcome. Inserts and updates become one batch
+        upsert (Weaviate vectorizes objects whose text changed) and deletes
+        one filtered delete.
+
+        Args:
+            messages: CDC messages in consumption order
+
+        Returns:
+            Failure reason per message in the same order (None once written)
+        """
+        positions: Dict[str, List[int]] = {}
+        for index, cdc_message in enumerate(messages):
+            positions.setdefault(cdc_message.get_mongo_id(), []).append(index)
+        if len(positions) < len(messages):
+            logger.info(f"Coalesced {len(messages)} changes into {len(positions)} RSS news")
 
-            # Insert or update in Weaviate (automatic vectorization happens here)
-            if cdc_message.operationType == OperationType.INSERT:
-                logger.info(f"Processing INSERT for RSS news ID: {mongo_id}")
-                # Use upsert pattern: check if exists, update if so, otherwise insert
-                if not self.weaviate_client.update_object("RSSNews", mongo_id, rss_news):
-                    return self.weaviate_client.insert_object("RSSNews", mongo_id, rss_news)
-                return True
+        outcomes: Dict[str, Optional[str]] = {}
+        upserts: Dict[str, RSSNews] = {}
+        deletes: List[str] = []
+        for mongo_id, indexes in positions.items():
+            final = messages[indexes[-1]]
+            if final.operationType == OperationType.DELETE:
+                deletes.append(mongo_id)
+                continue
+            try:
+                upserts[mongo_id] = self._to_rss_news(final)
+            except ValueError as e:
+                outcomes[mongo_id] = str(e)
 
-            elif cdc_message.operationType in [OperationType.UPDATE, OperationType.REPLACE]:
-                logger.info(f"Processing UPDATE for RSS news ID: {mongo_id}")
-                return self.weaviate_client.update_object("RSSNews", mongo_id, rss_news)
+        outcomes.update(self._write(upserts, deletes))
+        results: List[Optional[str]] = [None] * len(messages)
+        for mongo_id, indexes in positions.items():
+            for index in indexes:
+                results[index] = outcomes.get(mongo_id)
+        return results
 
+    def _write(self, upserts: Dict[str, RSSNews], deletes: List[str]) -> Dict[str, str]:
+        """Write the final state of each article; returns the error by MongoDB ID of those that failed."""
+        errors: Dict[str, str] = {}
+        if deletes:
+            logger.info(f"Processing DELETE for {len(deletes)} RSS news")
+            self.weaviate_client.delete_passages_many(deletes)
+            errors.update(self.weaviate_client.delete_objects("RSSNews", deletes))
+
+        if upserts:
+            logger.info(f"Processing INSERT/UPDATE for {len(upserts)} RSS news")
+            # Insert or replace in Weaviate (automatic vectorization happens here)
+            upsert_errors = self.weaviate_client.upsert_objects("RSSNews", upserts)
+            errors.update(upsert_errors)
+            # Passage failures are logged; the articles themselves are already searchable
+            self.weaviate_client.replace_passages_many(
+                {mongo_id: rss_news for mongo_id, rss_news in upserts.items() if mongo_id not in upsert_errors}
+            )
+        return errors
+
+    def _to_rss_news(self, cdc_message: KafkaMessage) -> RSSNews:
+        """Validate the document of an insert/update message (ValueError if it is unusable)."""
+        mongo_id = cdc_message.get_mongo_id()
+        raw_doc = cdc_message.get_data()
+        if not raw_doc:
+            logger.warning(f"No document data for MongoDB ID: {mongo_id}")
+            raise ValueError("no document data")
+        try:
+            # Normalize MongoDB dates and convert to Pydantic model
+            return RSSNews(**self._normalize_mongo_dates(raw_doc))
         except Exception as e:
-            logger.error(f"Failed to process RSS CDC message for {mongo_id}: {e}", exc_info=True)
-            return False
+            logger.error(f"Failed to parse RSS CDC message for {mongo_id}: {e}")
+            raise ValueError(f"invalid document: {e}")
 
     @staticmethod
     def _normalize_mongo_dates(doc: dict) -> dict:
@@ -0,0 +1,22 @@
+from typing import List
+
+
+def split_passages(text: str, words_per_passage: int = 80, overlap: int = 20) -> List[str]:
+    """
+    Split article text into overlapping word windows.
+
+    Overlap keeps a fact that straddles a boundary intact in at least one passage.
+    """
+    words = (text or "").split()
+    if not words:
+        return []
+    if len(words) <= words_per_passage:
+        return [" ".join(words)]
+
+    step = max(1, words_per_passage - overlap)
+    passages = []
+    for start in range(0, len(words), step):
+        passages.append(" ".join(words[start:start + words_per_passage]))
+        if start + words_per_passage >= len(words):
+            break
+    return passages
@@ -0,0 +1,227 @@
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+from kafka import KafkaProducer
+from kafka.admin import KafkaAdminClient, NewTopic
+from kafka.errors import KafkaError, TopicAlreadyExistsError
+from config import config
+from Scripts.models import KafkaMessage
+import logging
+
+logger = logging.getLogger(__name__)
+
+RETRY_INFIX = ".retry."
+DLQ_SUFFIX = ".dlq"
+
+# Headers of retry and dead-letter records
+ORIGINAL_TOPIC_HEADER = "x-original-topic"
+ATTEMPT_HEADER = "x-attempt"
+RETRY_AT_HEADER = "x-retry-at"  # epoch seconds
+ERROR_HEADER = "x-error"
+FAILED_AT_HEADER = "x-failed-at"
+
+FOLLOWS_FAILED_CHANGE = "waiting behind an earlier failed change to the same document"
+
+
+def retry_delays() -> List[int]:
+    """Delay in seconds of each retry tier (tier n uses the n-th delay)."""
+    return [int(delay) for delay in config.retry_delays.split(",") if delay.strip()]
+
+
+def retry_topic(topic: str, tier: int) -> str:
+    return f"{topic}{RETRY_INFIX}{tier}"
+
+
+def retry_topics(topic: str) -> List[str]:
+    return [retry_topic(topic, tier) for tier in range(1, len(retry_delays()) + 1)]
+
+
+def dlq_topic(topic: str) -> str:
+    return f"{topic}{DLQ_SUFFIX}"
+
+
+def record_headers(record) -> Dict[str, str]:
+    return {key: value.decode("utf-8") for key, value in (getattr(record, "headers", None) or [])}
+
+
+def retry_metadata(record) -> Optional[Tuple[str, int, float]]:
+    """(original topic, attempt, due time) of a record read from a retry topic, None for source records."""
+    if RETRY_INFIX not in record.topic:
+        return None
+    headers = record_headers(record)
+    return (
+        headers.get(ORIGINAL_TOPIC_HEADER, record.topic.split(RETRY_INFIX)[0]),
+        int(headers.get(ATTEMPT_HEADER, "1")),
+        float(headers.get(RETRY_AT_HEADER, "0")),
+    )
+
+
+def encode_message(cdc_message: KafkaMessage) -> bytes:
+    """Retry/dead-letter value: the parsed CDC message, readable by the consumer's own parser."""
+    return json.dumps(cdc_message.model_dump(mode="json")).encode("utf-8")
+
+
+class RetryRouter:
+    """
+    Parks failed CDC messages on delayed retry topics instead of blocking the consumer.
+
+    A message that fails on attempt n is published to `<topic>.retry.<n+1>`
+    with a due time CONSUMER_RETRY_DELAYS[n] seconds later; after the last
+    tier it goes to `<topic>.dlq` with the failure reason in its headers.
+    Records are keyed by mongoId, so a document's records share a partition.
+
+    While a document has messages parked, its later changes are published to
+    the same tier behind them (`divert`) rather than written straight away,
+    so a retried change never overwrites a newer one. This bookkeeping is in
+    memory and starts empty after a restart.
+    """
+
+    def __init__(self):
+        self.delays = retry_delays()
+        self.producer = None
+        # mongoId -> [highest tier holding its parked messages, number parked]
+        self.parked: Dict[str, List[int]] = {}
+        self.stats = {"retried": 0, "dead_lettered": 0, "diverted": 0}
+
+    def connect(self, source_topics: List[str], producer=None):
+        """
+        Create the producer and any missing retry/dead-letter topics.
+
+        Args:
+            source_topics: CDC topics the consumer reads
+            producer: Pre-built producer (e.g. a stand-in in tests); skips topic creation
+        """
+        if producer is not None:
+            self.producer = producer
+            return
+        self.producer = KafkaProducer(
+            bootstrap_servers=[config.kafka_broker],
+            acks="all",
+            retries=5,
+            linger_ms=5
+        )
+        self.ensure_topics(source_topics)
+
+    def ensure_topics(self, source_topics: List[str]):
+        """Create retry tiers and the dead-letter topic with the source topic's partition count."""
+        admin = None
+        try:
+            admin = KafkaAdminClient(bootstrap_servers=[config.kafka_broker])
+            existing = set(admin.list_topics())
+            new_topics = []
+            for topic in source_topics:
+                partitions = len(self.producer.partitions_for(topic) or []) or 1
+                for name in retry_topics(topic) + [dlq_topic(topic)]:
+                    if name not in existing:
+                        new_topics.append(NewTopic(name, num_partitions=partitions,
+                                                   replication_factor=config.kafka_replication_factor))
+            if new_topics:
+                admin.create_topics(new_topics)
+                logger.info(f"Created retry topics: {[t.name for t in new_topics]}")
+        except TopicAlreadyExistsError:
+            pass
+        except Exception as e:
+            # Brokers with auto-create enabled create them on first use
+            logger.warning(f"Could not create retry topics: {e}")
+        finally:
+            if admin is not None:
+                admin.close()
+
+    # ------------------------------
+    # ROUTING
+    # ------------------------------
+    def route(self, failures: List[Tuple[str, KafkaMessage, int, str]]) -> bool:
+        """
+        Publish failed messages to their next retry tier, or the dead-letter topic, and wait for the acks.
+
+        A message never goes to a lower tier than earlier parked messages of
+        its document, so it stays queued behind them.
+
+        Args:
+            failures: (source topic, message, attempts so far, failure reason), in consumption order
+
+        Returns:
+            True once every message is stored in Kafka (their offsets may then be committed)
+        """
+        if not failures:
+            return True
+        now = time.time()
+        sends = []
+        tiers = {mongo_id: entry[0] for mongo_id, entry in self.parked.items()}
+        for topic, cdc_message, attempt, reason in failures:
+            mongo_id = cdc_message.get_mongo_id()
+            tier = max(attempt + 1, tiers.get(mongo_id, 0))
+            headers = [
+                (ORIGINAL_TOPIC_HEADER, topic.encode("utf-8")),
+                (ATTEMPT_HEADER, str(tier).encode("utf-8")),
+                (ERROR_HEADER, (reason or "unknown error")[:1000].encode("utf-8")),
+                (FAILED_AT_HEADER, str(now).encode("utf-8")),
+            ]
+            if tier <= len(self.delays):
+                target = retry_topic(topic, tier)
+                headers.append((RETRY_AT_HEADER, str(now + self.delays[tier - 1]).encode("utf-8")))
+                tiers[mongo_id] = tier
+            else:
+                target = dlq_topic(topic)
+            future = self.producer.send(target, key=mongo_id.encode("utf-8"), value=encode_message(cdc_message), headers=headers)
+            sends.append((target, mongo_id, tier, reason, future))
+
+        try:
+            self.producer.flush(timeout=30)
+            for _, _, _, _, future in sends:
+                future.get(timeout=30)
+        except KafkaError as e:
+            logger.error(f"Failed to publish {len(sends)} messages to retry topics: {e}")
+            return False
+
+        for target, mongo_id, tier, reason, _ in sends:
+            if target.endswith(DLQ_SUFFIX):
+                self.stats["dead_lettered"] += 1
+                logger.error(f"Dead-lettered change for {mongo_id} to {target} after {tier - 1} attempts: {reason}")
+            else:
+                self.stats["retried"] += 1
+                entry = self.parked.setdefault(mongo_id, [tier, 0])
+                entry[0] = max(entry[0], tier)
+                entry[1] += 1
+                logger.warning(f"Parked change for {mongo_id} on {target}: {reason}")
+        return True
+
+    def divert(self, topic: str, cdc_message: KafkaMessage, attempt: int) -> bool:
+        """
+        Whether a message must queue behind a parked change to the same document.
+
+        A message from the source topic, or from a lower tier than the
+        document's parked messages, would overtake them.
+        """
+        entry = self.parked.get(cdc_message.get_mongo_id())
+        return entry is not None and attempt < entry[0]
+
+    def park_behind(self, diverted: List[Tuple[str, KafkaMessage, int]]) -> bool:
+        """Publish diverted messages to the tier holding their document's parked changes."""
+        if not self.route([(topic, cdc_message, attempt, FOLLOWS_FAILED_CHANGE) for topic, cdc_message, attempt in diverted]):
+            return False
+        self.stats["diverted"] += len(diverted)
+        return True
+
+    def release(self, mongo_id: str) -> bool:
+        """
+        Mark one message read back from a retry topic as settled (written,
+        dead-lettered or moved to another tier).
+
+        Returns:
+            True when the document has no parked messages left
+        """
+        entry = self.parked.get(mongo_id)
+        if entry is None:
+            return True
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.parked[mongo_id]
+            return True
+        return False
+
+    def close(self):
+        """Flush the records still being sent, then close the producer."""
+        if self.producer:
+            self.producer.flush(timeout=30)
+            self.producer.close()
@@ -1,14 +1,20 @@
+import hashlib
 import weaviate
-from weaviate.classes.config import Property, DataType, Configure
+from weaviate.classes.config import Property, DataType, Configure, Tokenization
 from weaviate.classes.query import Filter
+from weaviate.util import generate_uuid5
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from config import config
 from Scripts.models import RSSNews
+from Scripts.passages import split_passages
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Hash of an article's vectorized text, used to skip re-vectorizing property-only updates
+TEXT_HASH_PROPERTY = "text_hash"
+
 class WeaviateClient:
     """Weaviate client wrapper for managing RSS News collection with automatic vectorization."""
 
@@ -16,6 +22,8 @@ class WeaviateClient:
         self.config = config
         self.client = None
         self.collections = {} 
+        # Text properties Weaviate vectorizes, per collection (read from the live schema)
+        self.vectorized_fields: Dict[str, List[str]] = {}
 
     def connect(self):
         """Establish connection to Weaviate."""
@@ -32,13 +40,136 @@ class WeaviateClient:
 
             # Create RSS News collection with automatic vectorization
             self._setup_collection("RSSNews", RSSNews)
+            if self.config.passage_index_enabled:
+                self._setup_passage_collection(self.config.passage_collection)
 
         except Exception as e:
             logger.error(f"Failed to connect to Weaviate: {e}")
             raise
 
+    def _vector_index_config(self):
+        """HNSW config with PQ or BQ (rescored with full vectors), or None for the server default."""
+        compression = self.config.vector_compression
+        if compression == "bq":
+            return Configure.VectorIndex.hnsw(
+                quantizer=Configure.VectorIndex.Quantizer.bq(rescore_limit=self.config.rescore_limit, cache=True)
+            )
+        if compression == "pq":
+            return Configure.VectorIndex.hnsw(
+                quantizer=Configure.VectorIndex.Quantizer.pq(training_limit=self.config.pq_training_limit, centroids=256)
+            )
+        return None
+
+    def _alias_target(self, name: str) -> Optional[str]:
+        """Collection that the alias `name` points at (None if it is not an alias)."""
+        try:
+            alias = self.client.alias.get(alias_name=name)
+        except Exception:
+            return None
+        return alias.collection if alias else None
+
     def _setup_collection(self, name: str, model_cls):
-        """Create Weaviate collection dynamically from RSSNews Pydantic model with automatic vectorization."""
+        """
+        Load the news collection, or create it with automatic vectorization.
+
+        `name` is an alias for a versioned collection (`RSSNews_v2`) so the
+        backend's schema migration tool can swap versions without downtime.
+        A legacy collection that holds the name itself is used as is.
+        """
+        try:
+            if self.client.collections.exists(name) or self._alias_target(name):
+                logger.info(f"Collection {name} already exists")
+                self.collections[name] = self.client.collections.get(name)
+                self._prepare_text_hash(name)
+                return
+
+            # Schema v2 (see backend app/Database/weaviate_schema.py): embed title + clean_text only,
+            # range indexes on published/score
+            schema_properties = [
+                Property(name="mongoId", data_type=DataType.TEXT, skip_vectorization=True,
+                         tokenization=Tokenization.FIELD, index_searchable=False),
+                Property(name="title", data_type=DataType.TEXT),
+                Property(name="link", data_type=DataType.TEXT, skip_vectorization=True, index_searchable=False),
+                Property(name="content", data_type=DataType.TEXT, skip_vectorization=True,
+                         index_searchable=False, index_filterable=False),
+                Property(name="clean_text", data_type=DataType.TEXT),
+                Property(name="published", data_type=DataType.DATE, skip_vectorization=True, index_range_filters=True),
+                Property(name="summary", data_type=DataType.TEXT, skip_vectorization=True),
+                Property(name="sentiment", data_type=DataType.TEXT, skip_vectorization=True, tokenization=Tokenization.FIELD),
+                Property(name="score", data_type=DataType.NUMBER, skip_vectorization=True, index_range_filters=True),
+                Property(name=TEXT_HASH_PROPERTY, data_type=DataType.TEXT, skip_vectorization=True,
+                         tokenization=Tokenization.FIELD, index_searchable=False),
+            ]
+
+            # Enable automatic AI embeddings via Ollama text2vec module
+            vector_config = Configure.Vectorizer.text2vec_ollama(
+                api_endpoint=self.config.ollama_host,
+                model=self.config.ollama_model,
+                vectorize_collection_name=False
+            )
+
+            # Create the versioned collection and point the alias at it
+            versioned = f"{name}_v2"
+            if not self.client.collections.exists(versioned):
+                self.client.collections.create(
+                    name=versioned,
+                    properties=schema_properties,
+                    vectorizer_config=vector_config,
+                    vector_index_config=self._vector_index_config()
+                )
+            self.client.alias.create(alias_name=name, target_collection=versioned)
+            logger.info(f"Created collection '{versioned}' (alias '{name}') with automatic vectorization via Ollama")
+
+            self.collections[name] = self.client.collections.get(name)
+            self._prepare_text_hash(name)
+
+        except Exception as e:
+            logger.error(f"Error setting up collection {name}: {e}")
+            raise
+
+    def _prepare_text_hash(self, name: str):
+        """
+        Read which fields the collection vectorizes and add the text hash property if it is missing.
+
+        Without the explicit property, auto-schema would create a vectorized
+        one on the first write and fold the hash into every embedding.
+        """
+        try:
+            # Schema changes go to the collection behind the alias
+            collection = self.client.collections.get(self._alias_target(name) or name)
+            properties = collection.config.get().properties
+            if TEXT_HASH_PROPERTY not in {p.name for p in properties}:
+                collection.config.add_property(
+                    Property(name=TEXT_HASH_PROPERTY, data_type=DataType.TEXT, skip_vectorization=True,
+                             tokenization=Tokenization.FIELD, index_searchable=False)
+                )
+                logger.info(f"Added {TEXT_HASH_PROPERTY} property to {name}")
+            self.vectorized_fields[name] = [
+                p.name for p in properties
+                if p.data_type == DataType.TEXT and not (p.vectorizer_config and p.vectorizer_config.skip)
+            ]
+        except Exception as e:
+            # Every update is then re-vectorized, as before
+            logger.warning(f"Vector reuse disabled for {name}: {e}")
+
+    def text_hash(self, collection_name: str, model_obj: RSSNews) -> Optional[str]:
+        """Hash of the fields the collection vectorizes (None if they are unknown)."""
+        fields = self.vectorized_fields.get(collection_name)
+        if not fields:
+            return None
+        text = "\x1f".join(f"{field}={getattr(model_obj, field, None) or ''}" for field in fields)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _stored_vector(obj) -> Optional[List[float]]:
+        """The object's vector from a query with include_vector (collections have one unnamed vector)."""
+        vector = obj.vector
+        if isinstance(vector, dict):
+            vector = vector.get("default")
+        return list(vector) if vector else None
+
+    def _setup_passage_collection(self, name: str):
+        """Create the passage collection: one object per overlapping article passage, linked by mongoId."""
         try:
             if self.client.collections.exists(name):
                 logger.info(f"Collection {name} already exists")
@@ -47,30 +178,27 @@ class WeaviateClient:
 
             schema_properties = [
                 Property(name="mongoId", data_type=DataType.TEXT, skip_vectorization=True),
+                Property(name="passage_index", data_type=DataType.INT, skip_vectorization=True),
                 Property(name="title", data_type=DataType.TEXT),
+                Property(name="text", data_type=DataType.TEXT),
                 Property(name="link", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="content", data_type=DataType.TEXT),
-                Property(name="clean_text", data_type=DataType.TEXT),
                 Property(name="published", data_type=DataType.DATE, skip_vectorization=True),
-                Property(name="summary", data_type=DataType.TEXT),
                 Property(name="sentiment", data_type=DataType.TEXT, skip_vectorization=True),
-                Property(name="score", data_type=DataType.NUMBER, skip_vectorization=True),
             ]
 
-            # Enable automatic AI embeddings via Ollama text2vec module
             vector_config = Configure.Vectorizer.text2vec_ollama(
                 api_endpoint=self.config.ollama_host,
                 model=self.config.ollama_model,
                 vectorize_collection_name=False
             )
 
-            # Create the collection with automatic vectorization
             self.client.collections.create(
                 name=name,
                 properties=schema_properties,
-                vectorizer_config=vector_config
+                vectorizer_config=vector_config,
+                vector_index_config=self._vector_index_config()
             )
-            logger.info(f"Created collection '{name}' with automatic vectorization via Ollama")
+            logger.info(f"Created passage collection '{name}' with automatic vectorization via Ollama")
 
             self.collections[name] = self.client.collections.get(name)
 
@@ -78,86 +206,235 @@ class WeaviateClient:
             logger.error(f"Error setting up collection {name}: {e}")
             raise
 
-    def insert_object(self, collection_name: str, mongo_id: str, model_obj: RSSNews) -> bool:
-        """Insert RSS news into Weaviate with automatic vectorization."""
+    def replace_passages_many(self, articles: Dict[str, RSSNews]) -> Dict[str, str]:
+        """
+        Re-split articles and replace their passages with one delete and one batch.
+
+        Args:
+            articles: RSSNews by MongoDB ID
+
+        Returns:
+            Error message by MongoDB ID for articles whose passages were not all written
+        """
+        name = self.config.passage_collection
+        if name not in self.collections or not articles:
+            return {}
+        mongo_ids = list(articles)
         try:
-            collection = self.collections[collection_name]
-            
-            # Prepare properties - Weaviate will automatically generate vectors
-            properties = {
-                "mongoId": mongo_id,
-                "title": model_obj.title,
-                "link": model_obj.link,
-                "content": model_obj.content,
-                "clean_text": model_obj.clean_text,
-                "published": model_obj.published,
-                "summary": model_obj.summary,
-                "sentiment": model_obj.sentiment,
-                "score": model_obj.score
-            }
-            
-            # Insert - Ollama will automatically create embeddings
-            collection.data.insert(properties=properties)
-            logger.info(f"Inserted RSS news into {collection_name} with ID={mongo_id}")
-            return True
+            collection = self.collections[name]
+            passages = {}
+            for mongo_id, model_obj in articles.items():
+                texts = split_passages(
+                    model_obj.clean_text or model_obj.summary or "",
+                    self.config.passage_words,
+                    self.config.passage_overlap
+                )
+                for index, text in enumerate(texts):
+                    passages[str(generate_uuid5(f"{mongo_id}:{index}"))] = {
+                        "mongoId": mongo_id,
+                        "passage_index": index,
+                        "title": model_obj.title,
+                        "text": text,
+                        "link": model_obj.link,
+                        "published": model_obj.published,
+                        "sentiment": model_obj.sentiment,
+                    }
+            vectors = self._reusable_passage_vectors(collection, passages)
+
+            # Drop passages left over from a longer previous version of the articles
+            collection.data.delete_many(where=Filter.by_property("mongoId").contains_any(mongo_ids))
+
+            with collection.batch.fixed_size(
+                batch_size=self.config.batch_size, concurrent_requests=self.config.weaviate_batch_concurrency
+            ) as batch:
+                for uuid, properties in passages.items():
+                    batch.add_object(properties=properties, uuid=uuid, vector=vectors.get(uuid))
+            errors = self._map_failures(
+                collection.batch.failed_objects, {uuid: p["mongoId"] for uuid, p in passages.items()}, mongo_ids
+            )
         except Exception as e:
-            logger.error(f"Insert failed in {collection_name}: {e}")
-            return False
+            logger.error(f"Passage indexing failed in {name}: {e}")
+            return {mongo_id: str(e) for mongo_id in mongo_ids}
+
+        for mongo_id, message in errors.items():
+            logger.error(f"Passage indexing failed in {name} for ID={mongo_id}: {message}")
+        logger.info(
+            f"Indexed {len(passages)} passages into {name} for {len(articles)} articles "
+            f"({len(vectors)} vectors reused)"
+        )
+        return errors
+
+    def _reusable_passage_vectors(self, collection, passages: Dict[str, Dict[str, Any]]) -> Dict[str, List[float]]:
+        """Stored vectors of passages whose title and text are unchanged, by UUID."""
+        if not self.config.reuse_vectors or not passages:
+            return {}
+        result = collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(list(passages)),
+            limit=len(passages),
+            return_properties=["title", "text"],
+            include_vector=True
+        )
+        vectors = {}
+        for obj in result.objects:
+            wanted = passages.get(str(obj.uuid))
+            vector = self._stored_vector(obj)
+            if wanted and vector and all(obj.properties.get(f) == wanted[f] for f in ("title", "text")):
+                vectors[str(obj.uuid)] = vector
+        return vectors
 
-    def update_object(self, collection_name: str, mongo_id: str, model_obj: RSSNews) -> bool:
-        """Update RSS news in Weaviate with automatic re-vectorization."""
+    def delete_passages_many(self, mongo_ids: List[str]) -> bool:
+        """Delete all passages of several articles in one request."""
+        name = self.config.passage_collection
+        if name not in self.collections or not mongo_ids:
+            return True
         try:
-            collection = self.collections[collection_name]
-            result = collection.query.fetch_objects(
-                filters=Filter.by_property("mongoId").equal(mongo_id),
-                limit=1
-            )
-            if not result.objects:
-                logger.warning(f"{collection_name}: no object with mongoId={mongo_id} to update")
-                return False
-
-            weaviate_uuid = str(result.objects[0].uuid)
-            
-            # Prepare updated properties - Weaviate will automatically re-generate vectors
-            properties = {
-                "mongoId": mongo_id,
-                "title": model_obj.title,
-                "link": model_obj.link,
-                "content": model_obj.content,
-                "clean_text": model_obj.clean_text,
-                "published": model_obj.published,
-                "summary": model_obj.summary,
-                "sentiment": model_obj.sentiment,
-                "score": model_obj.score
-            }
-            
-            collection.data.update(uuid=weaviate_uuid, properties=properties)
-            logger.info(f"Updated RSS news in {collection_name} with ID={mongo_id}")
+            self.collections[name].data.delete_many(where=Filter.by_property("mongoId").contains_any(mongo_ids))
+            logger.info(f"Deleted passages in {name} for {len(mongo_ids)} articles")
             return True
         except Exception as e:
-            logger.error(f"Update failed in {collection_name}: {e}")
+            logger.error(f"Passage delete failed in {name}: {e}")
             return False
 
-    def delete_object(self, collection_name: str, mongo_id: str) -> bool:
-        """Delete RSS news from Weaviate."""
+    @staticmethod
+    def _article_properties(mongo_id: str, model_obj: RSSNews) -> Dict[str, Any]:
+        """Weaviate properties of an article; Weaviate generates the vector from them."""
+        return {
+            "mongoId": mongo_id,
+            "title": model_obj.title,
+            "link": model_obj.link,
+            "content": model_obj.content,
+            "clean_text": model_obj.clean_text,
+            "published": model_obj.published,
+            "summary": model_obj.summary,
+            "sentiment": model_obj.sentiment,
+            "score": model_obj.score
+        }
+
+    @staticmethod
+    def _map_failures(failed_objects, owners: Dict[str, str], mongo_ids: List[str]) -> Dict[str, str]:
+        """
+        Map failed batch objects back to the MongoDB IDs they were written for.
+
+        A failure that cannot be attributed fails every ID, so nothing is
+        reported as written when it may not have been.
+        """
+        errors = {}
+        for failure in failed_objects:
+            mongo_id = owners.get(str(failure.object_.uuid))
+            if mongo_id is None:
+                return {m: failure.message for m in mongo_ids}
+            errors[mongo_id] = failure.message
+        return errors
+
+    def _existing_objects(self, collection, mongo_ids: List[str], with_vectors: bool) -> Dict[str, Any]:
+        """
+        Objects already stored for these MongoDB IDs (with their text hash and vector if `with_vectors`).
+
+        Objects written before UUIDs were derived from the mongoId keep
+        their random UUID, so upserts must target it to avoid a duplicate.
+        """
+        result = collection.query.fetch_objects(
+            filters=Filter.by_property("mongoId").contains_any(mongo_ids),
+            limit=len(mongo_ids) * 2,
+            return_properties=["mongoId", TEXT_HASH_PROPERTY] if with_vectors else ["mongoId"],
+            include_vector=with_vectors
+        )
+        objects = {}
+        for obj in result.objects:
+            mongo_id = obj.properties.get("mongoId")
+            if mongo_id not in objects or str(objects[mongo_id].uuid) != str(generate_uuid5(mongo_id)):
+                objects[mongo_id] = obj
+        return objects
+
+    def upsert_objects(self, collection_name: str, articles: Dict[str, RSSNews]) -> Dict[str, str]:
+        """
+        Insert or replace articles in one Weaviate batch (automatic vectorization).
+
+        An article whose vectorized text hashes the same as the stored
+        object's is written with the stored vector, so Weaviate does not
+        re-embed it through Ollama (e.g. a sentiment or score rewrite).
+
+        Args:
+            collection_name: Target collection
+            articles: RSSNews by MongoDB ID
+
+        Returns:
+            Error message by MongoDB ID for the articles that were not written (empty if all were)
+        """
+        if not articles:
+            return {}
+        mongo_ids = list(articles)
         try:
             collection = self.collections[collection_name]
-            result = collection.query.fetch_objects(
-                filters=Filter.by_property("mongoId").equal(mongo_id),
-                limit=1
+            reuse = self.config.reuse_vectors and bool(self.vectorized_fields.get(collection_name))
+            existing = self._existing_objects(collection, mongo_ids, reuse)
+            uuids = {mongo_id: str(generate_uuid5(mongo_id)) for mongo_id in mongo_ids}
+            uuids.update({mongo_id: str(obj.uuid) for mongo_id, obj in existing.items()})
+
+            reused = 0
+            with collection.batch.fixed_size(
+                batch_size=self.config.batch_size, concurrent_requests=self.config.weaviate_batch_concurrency
+            ) as batch:
+                for mongo_id, model_obj in articles.items():
+                    properties = self._article_properties(mongo_id, model_obj)
+                    properties[TEXT_HASH_PROPERTY] = self.text_hash(collection_name, model_obj)
+                    vector = None
+                    stored = existing.get(mongo_id)
+                    if reuse and stored is not None and stored.properties.get(TEXT_HASH_PROPERTY) == properties[TEXT_HASH_PROPERTY]:
+                        vector = self._stored_vector(stored)
+                        reused += vector is not None
+                    batch.add_object(properties=properties, uuid=uuids[mongo_id], vector=vector)
+            errors = self._map_failures(
+                collection.batch.failed_objects, {uuid: mongo_id for mongo_id, uuid in uuids.items()}, mongo_ids
             )
-            if not result.objects:
-                logger.warning(f"{collection_name}: no object with mongoId={mongo_id} to delete")
-                return False
+        except Exception as e:
+            logger.error(f"Batch upsert failed in {collection_name}: {e}")
+            return {mongo_id: str(e) for mongo_id in mongo_ids}
 
-            weaviate_uuid = str(result.objects[0].uuid)
-            collection.data.delete_by_id(weaviate_uuid)
-            logger.info(f"Deleted RSS news in {collection_name} with ID={mongo_id}")
-            return True
+        for mongo_id, message in errors.items():
+            logger.error(f"Upsert failed in {collection_name} for ID={mongo_id}: {message}")
+        logger.info(
+            f"Upserted {len(mongo_ids) - len(errors)}/{len(mongo_ids)} RSS news into {collection_name} "
+            f"({reused} vectors reused)"
+        )
+        return errors
+
+    def delete_objects(self, collection_name: str, mongo_ids: List[str]) -> Dict[str, str]:
+        """
+        Delete articles by MongoDB ID in one request.
+
+        Articles that are not in Weaviate count as deleted.
+
+        Returns:
+            Error message by MongoDB ID for the articles that were not deleted (empty if all were)
+        """
+        if not mongo_ids:
+            return {}
+        try:
+            result = self.collections[collection_name].data.delete_many(
+                where=Filter.by_property("mongoId").contains_any(mongo_ids),
+                verbose=True
+            )
         except Exception as e:
-            logger.error(f"Delete failed in {collection_name}: {e}")
-            return False
-    
+            logger.error(f"Batch delete failed in {collection_name}: {e}")
+            return {mongo_id: str(e) for mongo_id in mongo_ids}
+
+        errors = {}
+        if result.failed:
+            owners = {str(generate_uuid5(mongo_id)): mongo_id for mongo_id in mongo_ids}
+            for obj in result.objects or []:
+                if obj.successful:
+                    continue
+                mongo_id = owners.get(str(obj.uuid))
+                if mongo_id is None:
+                    errors = {m: obj.error or "delete failed" for m in mongo_ids}
+                    break
+                errors[mongo_id] = obj.error or "delete failed"
+            for mongo_id, message in errors.items():
+                logger.error(f"Delete failed in {collection_name} for ID={mongo_id}: {message}")
+        logger.info(f"Deleted {result.successful} RSS news from {collection_name} for {len(mongo_ids)} IDs")
+        return errors
+
     def close(self):
         """Close Weaviate connection."""
         if self.client:
@@ -0,0 +1,180 @@
+import threading
+import queue
+import time
+import zlib
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from Scripts.kafka_consumer import MessageBatch
+from Scripts.models import KafkaMessage
+from Scripts.retry_topics import FOLLOWS_FAILED_CHANGE
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Writes a list of (topic, KafkaMessage) and returns a failure reason per message (None once written)
+BatchHandler = Callable[[List[Tuple[str, KafkaMessage]]], List[Optional[str]]]
+
+
+class BatchTicket:
+    """A submitted batch; workers fill in its per-message results."""
+
+    def __init__(self, batch: MessageBatch, parts: int):
+        self.batch = batch
+        self.results = [False] * len(batch)
+        self.errors: List[Optional[str]] = ["not written"] * len(batch)
+        self.remaining = parts
+        self.submitted_at = time.perf_counter()
+        self.seconds = 0.0 if parts == 0 else None
+
+    @property
+    def done(self) -> bool:
+        return self.remaining == 0
+
+
+class KeyedWorkerPool:
+    """
+    Writes CDC batches on worker threads, routing each message by its mongoId.
+
+    Every message of a document goes to the same worker, whose queue is
+    FIFO, so a document's changes are applied in order while different
+    documents (and partitions) are written concurrently. The polling thread
+    keeps reading while workers write, up to `max_in_flight` unfinished
+    messages. Batches are handed back in submission order, so offsets are
+    committed in order even when a later batch finishes first.
+
+    When a source message fails, its worker holds the mongoId: later source
+    messages for that document fail with FOLLOWS_FAILED_CHANGE instead of
+    being written over it, until the caller `release`s the key.
+    """
+
+    def __init__(self, handlers: List[BatchHandler], max_in_flight: int):
+        """
+        Args:
+            handlers: One handler per worker (each with its own Weaviate connection)
+            max_in_flight: Messages submitted but not yet written before `submit` blocks
+        """
+        self.handlers = handlers
+        self.max_in_flight = max_in_flight
+        self._queues = [queue.Queue() for _ in handlers]
+        self._tickets: deque = deque()
+        self._in_flight = 0
+        self._changed = threading.Condition()
+        self._held: List[Set[str]] = [set() for _ in handlers]
+        self._threads = [
+            threading.Thread(target=self._work, args=(worker,), name=f"cdc-worker-{worker}", daemon=True)
+            for worker in range(len(handlers))
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Started {len(handlers)} CDC workers (max {max_in_flight} messages in flight)")
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def worker_for(self, cdc_message: KafkaMessage) -> int:
+        return zlib.crc32(cdc_message.get_mongo_id().encode("utf-8")) % len(self.handlers)
+
+    def submit(self, batch: MessageBatch, settled: Dict[int, Optional[str]] = None):
+        """
+        Queue a batch for the workers, waiting while the in-flight window is full.
+
+        Args:
+            batch: Messages to write
+            settled: Positions already dealt with by the caller, and their outcome
+        """
+        settled = settled or {}
+        parts: Dict[int, List[int]] = {}
+        for position, (_, cdc_message) in enumerate(batch.messages):
+            if position not in settled:
+                parts.setdefault(self.worker_for(cdc_message), []).append(position)
+
+        with self._changed:
+            # Bounded in-flight window: stop reading ahead until workers catch up
+            while self._in_flight and self._in_flight + len(batch) > self.max_in_flight:
+                self._changed.wait()
+            ticket = BatchTicket(batch, len(parts))
+            for position, error in settled.items():
+                ticket.errors[position] = error
+                ticket.results[position] = error is None
+            self._tickets.append(ticket)
+            self._in_flight += len(batch)
+
+        for worker, positions in parts.items():
+            self._queues[worker].put((ticket, positions))
+
+    def _work(self, worker: int):
+        handler = self.handlers[worker]
+        while True:
+            item = self._queues[worker].get()
+            if item is None:
+                return
+            ticket, positions = item
+            errors = self._write(worker, handler, ticket, positions)
+
+            with self._changed:
+                for position, error in zip(positions, errors):
+                    ticket.errors[position] = error
+                    ticket.results[position] = error is None
+                ticket.remaining -= 1
+                if ticket.done:
+                    ticket.seconds = time.perf_counter() - ticket.submitted_at
+                    self._in_flight -= len(ticket.batch)
+                self._changed.notify_all()
+
+    def _write(self, worker: int, handler: BatchHandler, ticket: BatchTicket, positions: List[int]) -> List[Optional[str]]:
+        held = self._held[worker]
+        errors: List[Optional[str]] = [None] * len(positions)
+        writable = []
+        with self._changed:
+            for index, position in enumerate(positions):
+                if ticket.batch.messages[position][1].get_mongo_id() in held and not ticket.batch.attempts[position]:
+                    errors[index] = FOLLOWS_FAILED_CHANGE
+                else:
+                    writable.append(index)
+
+        if writable:
+            try:
+                results = handler([ticket.batch.messages[positions[index]] for index in writable])
+            except Exception as e:
+                logger.error(f"[WORKER {worker}] Unexpected error writing {len(writable)} messages: {e}", exc_info=True)
+                results = [f"unexpected error: {e}"] * len(writable)
+            for index, error in zip(writable, results):
+                errors[index] = error
+
+        with self._changed:
+            for position, error in zip(positions, errors):
+                if error is not None:
+                    held.add(ticket.batch.messages[position][1].get_mongo_id())
+        return errors
+
+    def release(self, mongo_id: str):
+        """Let source messages for a document be written again."""
+        with self._changed:
+            self._held[zlib.crc32(mongo_id.encode("utf-8")) % len(self.handlers)].discard(mongo_id)
+
+    def release_all(self):
+        with self._changed:
+            for held in self._held:
+                held.clear()
+
+    def completed(self) -> List[BatchTicket]:
+        """Finished batches in submission order, up to the first one still being written."""
+        finished = []
+        with self._changed:
+            while self._tickets and self._tickets[0].done:
+                finished.append(self._tickets.popleft())
+        return finished
+
+    def drain(self) -> List[BatchTicket]:
+        """Wait for every submitted batch and return them in submission order."""
+        with self._changed:
+            while not all(ticket.done for ticket in self._tickets):
+                self._changed.wait()
+        return self.completed()
+
+    def close(self):
+        for worker_queue in self._queues:
+            worker_queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout=5)
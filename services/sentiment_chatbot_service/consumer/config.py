@@ -7,6 +7,8 @@ class Config:
     kafka_broker: str = os.getenv("KAFKA_BROKER", "kafka:9092")
     kafka_topics: str = os.getenv("KAFKA_TOPICS", "research_db.research_db.rss_news")
     kafka_group_id: str = os.getenv("KAFKA_GROUP_ID", "research-consumer-group")
+    # Commit offsets only after the Weaviate batch holding the messages is written (at-least-once)
+    kafka_manual_commit: bool = os.getenv("KAFKA_MANUAL_COMMIT", "true").lower() == "true"
     
     # Weaviate Configuration
     weaviate_host: str = os.getenv("WEAVIATE_HOST", "weaviate")
@@ -17,9 +19,36 @@ class Config:
     ollama_host: str = os.getenv("OLLAMA_HOST", "http://ollama:11434")
     ollama_model: str = os.getenv("OLLAMA_MODEL", "nomic-embed-text")
     
+    # Passage index (overlapping article passages with their own vectors)
+    passage_index_enabled: bool = os.getenv("PASSAGE_INDEX_ENABLED", "true").lower() == "true"
+    passage_collection: str = os.getenv("PASSAGE_COLLECTION", "RSSNewsPassage")
+    passage_words: int = int(os.getenv("PASSAGE_WORDS", "80"))
+    passage_overlap: int = int(os.getenv("PASSAGE_OVERLAP", "20"))
+    
+    # Vector compression for new collections: none (Weaviate default), pq or bq
+    vector_compression: str = os.getenv("WEAVIATE_VECTOR_COMPRESSION", "none").lower()
+    rescore_limit: int = int(os.getenv("WEAVIATE_RESCORE_LIMIT", "200"))
+    pq_training_limit: int = int(os.getenv("WEAVIATE_PQ_TRAINING_LIMIT", "100000"))
+    
+    # Micro-batching: write up to batch_size messages per Weaviate batch, waiting at most batch_max_wait_ms
+    batch_size: int = int(os.getenv("CONSUMER_BATCH_SIZE", "200"))
+    batch_max_wait_ms: int = int(os.getenv("CONSUMER_BATCH_MAX_WAIT_MS", "1000"))
+    weaviate_batch_concurrency: int = int(os.getenv("WEAVIATE_BATCH_CONCURRENCY", "2"))
+    # Re-send the stored vector when an update leaves the vectorized text unchanged (no Ollama call)
+    reuse_vectors: bool = os.getenv("WEAVIATE_REUSE_VECTORS", "true").lower() == "true"
+    
+    # Worker threads (messages routed by mongoId) and the cap on polled-but-unwritten messages
+    consumer_workers: int = int(os.getenv("CONSUMER_WORKERS", "1"))
+    max_in_flight: int = int(os.getenv("CONSUMER_MAX_IN_FLIGHT", "1000"))
+    
+    # Failed messages go to delayed retry topics (<topic>.retry.<n>, one tier per delay in seconds),
+    # then to the dead-letter topic <topic>.dlq
+    retry_topics_enabled: bool = os.getenv("CONSUMER_RETRY_TOPICS_ENABLED", "true").lower() == "true"
+    retry_delays: str = os.getenv("CONSUMER_RETRY_DELAYS", "10,60,600")
+    kafka_replication_factor: int = int(os.getenv("KAFKA_REPLICATION_FACTOR", "1"))
+    
     # Processing Configuration
     retry_delay: int = int(os.getenv("RETRY_DELAY", "1"))
-    max_retries: int = int(os.getenv("MAX_RETRIES", "3"))
 
 # Global config instance
 config = Config()
\ No newline at end of file
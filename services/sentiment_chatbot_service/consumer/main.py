@@ -1,8 +1,13 @@
 import logging
 import sys
 import time
-from Scripts.kafka_consumer import MultiKafkaConsumer 
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from Scripts.kafka_consumer import MultiKafkaConsumer, MessageBatch
 from Scripts.message_processor import MessageProcessor
+from Scripts.retry_topics import RetryRouter
+from Scripts.worker_pool import KeyedWorkerPool, BatchTicket
+from Scripts.models import KafkaMessage
 from config import config
 
 logging.basicConfig(
@@ -25,68 +30,221 @@ def main():
     )
 
     kafka_consumer = MultiKafkaConsumer()
-    message_processor = MessageProcessor()
+    # One processor (and Weaviate connection) per worker
+    message_processors = [MessageProcessor() for _ in range(max(1, config.consumer_workers))]
+    retry_router = RetryRouter() if config.retry_topics_enabled else None
+    pool: Optional[KeyedWorkerPool] = None
 
-    # Retry connection
-    while True:
+    try:
+        # Retry connection
+        while True:
+            try:
+                logger.info("Initializing connections...")
+                kafka_consumer.connect()
+                if retry_router is not None:
+                    retry_router.connect([t.strip() for t in config.kafka_topics.split(",")])
+                # One at a time, so only the first creates missing collections
+                for message_processor in message_processors:
+                    message_processor.initialize()
+                break
+            except Exception as e:
+                logger.error(f"Failed to initialize services: {e}", exc_info=True)
+                logger.info("Retrying initialization in 5 seconds...")
+                time.sleep(5)
+
+        pool = KeyedWorkerPool(
+            [partial(process_batch, processor=processor) for processor in message_processors],
+            max_in_flight=config.max_in_flight
+        )
+        logger.info("Starting message processing loop...")
+        process_messages(kafka_consumer, pool, retry_router)
+    finally:
+        shutdown(kafka_consumer, message_processors, retry_router, pool)
+
+
+def shutdown(consumer: MultiKafkaConsumer, processors: List[MessageProcessor],
+             router: Optional[RetryRouter] = None, pool: Optional[KeyedWorkerPool] = None):
+    """
+    Release resources in dependency order: stop the workers, flush and close
+    the retry producer, close the processors' Weaviate connections, then
+    leave the consumer group. Uncommitted messages are read again on restart.
+    """
+    logger.info("Cleaning up resources...")
+    steps = []
+    if pool is not None:
+        steps.append(("worker pool", pool.close))
+    if router is not None:
+        steps.append(("retry router", router.close))
+    steps += [("message processor", processor.close) for processor in processors]
+    steps.append(("Kafka consumer", consumer.close))
+    for name, close in steps:
         try:
-            logger.info("Initializing connections...")
-            kafka_consumer.connect()
-            message_processor.initialize()
-            break
+            close()
         except Exception as e:
-            logger.error(f"Failed to initialize services: {e}", exc_info=True)
-            logger.info("Retrying initialization in 5 seconds...")
-            time.sleep(5)
+            logger.warning(f"Error closing {name}: {e}")
 
-    logger.info("Starting message processing loop...")
-    process_messages(kafka_consumer, message_processor)
 
+def process_messages(consumer: MultiKafkaConsumer, pool: KeyedWorkerPool,
+                     router: Optional[RetryRouter] = None):
+    """
+    Main message processing loop.
 
-def process_messages(consumer: MultiKafkaConsumer, processor: MessageProcessor):
-    """Main message processing loop for CDC messages."""
+    The polling thread reads CDC messages in micro-batches and hands them to
+    worker threads keyed by mongoId; finished batches are committed in order.
+    With a retry router, failed messages are parked on retry topics and the
+    partition moves on; without one (or if parking fails) the partition is
+    rewound to the failed message.
+    """
     processed_count = 0
     failed_count = 0
     operation_stats = {"insert": 0, "update": 0, "delete": 0}
 
+    def record(ticket: BatchTicket):
+        nonlocal processed_count, failed_count
+        batch_failed = 0
+        for (topic, cdc_message), error in zip(ticket.batch.messages, ticket.errors):
+            # Track success/failure
+            if error is None:
+                processed_count += 1
+                operation_stats[cdc_message.operationType] = operation_stats.get(cdc_message.operationType, 0) + 1
+            else:
+                batch_failed += 1
+                logger.warning(
+                    f"Failed to process {cdc_message.operationType} for "
+                    f"{cdc_message.get_mongo_id()} from {topic}: {error}"
+                )
+        failed_count += batch_failed
+        if ticket.batch:
+            logger.info(
+                f"Batch of {len(ticket.batch)} messages in {ticket.seconds:.2f}s "
+                f"({len(ticket.batch) / ticket.seconds if ticket.seconds else 0:.0f} msg/s), {batch_failed} failed, "
+                f"{pool.in_flight} in flight"
+            )
+            logger.info(f"Progress: {processed_count} processed, {failed_count} failed")
+            logger.info(f"Operations: {operation_stats}")
+            if router is not None:
+                logger.info(f"Retries: {router.stats}, {len(router.parked)} documents parked")
+
+    def submit(batch: MessageBatch):
+        """Hand a batch to the workers, first diverting changes queued behind parked ones."""
+        settled: Dict[int, Optional[str]] = {}
+        if router is not None:
+            diverted = [
+                position for position, ((topic, cdc_message), attempt)
+                in enumerate(zip(batch.messages, batch.attempts))
+                if router.divert(topic, cdc_message, attempt)
+            ]
+            if diverted:
+                parked = router.park_behind(
+                    [batch.messages[position] + (batch.attempts[position],) for position in diverted]
+                )
+                for position in diverted:
+                    settled[position] = None if parked else "could not be parked behind an earlier failed change"
+        pool.submit(batch, settled)
+
+    def settle(tickets: List[BatchTicket]) -> bool:
+        """Record finished batches and park their failures; False if a failure could not be parked."""
+        for ticket in tickets:
+            record(ticket)
+        if router is None:
+            return all(all(ticket.results) for ticket in tickets)
+
+        failed = [
+            (ticket, position) for ticket in tickets
+            for position, success in enumerate(ticket.results) if not success
+        ]
+        failures = [
+            ticket.batch.messages[position] + (ticket.batch.attempts[position], ticket.errors[position])
+            for ticket, position in failed
+        ]
+        parked = router.route(failures)
+        if parked:
+            # Stored on a retry or dead-letter topic: the source offset may be committed
+            for ticket, position in failed:
+                ticket.results[position] = True
+
+        # Documents whose parked changes are all settled may be written straight away again
+        touched = {ticket.batch.messages[position][1].get_mongo_id() for ticket, position in failed}
+        for ticket in tickets:
+            for position, ((_, cdc_message), attempt) in enumerate(zip(ticket.batch.messages, ticket.batch.attempts)):
+                if attempt and ticket.results[position]:
+                    router.release(cdc_message.get_mongo_id())
+                    touched.add(cdc_message.get_mongo_id())
+        for mongo_id in touched:
+            if mongo_id not in router.parked:
+                pool.release(mongo_id)
+        return parked
+
+    def commit(tickets: List[BatchTicket]) -> bool:
+        """Commit settled batches together (a failure caps its partition); True if nothing failed."""
+        if not tickets:
+            return True
+        results = [success for ticket in tickets for success in ticket.results]
+        # Offsets advance only past messages that reached Weaviate or a retry topic
+        consumer.commit_batch(MessageBatch.merge([ticket.batch for ticket in tickets]), results)
+        return all(results)
+
+    def flush_before_revoke(batch: MessageBatch):
+        submit(batch)
+        finished = pool.drain()
+        settle(finished)
+        commit(finished)
+
+    consumer.revoke_handler = flush_before_revoke
+
     while True:
         try:
-            for topic, cdc_message in consumer.consume_messages():
-                try:
-                    # Process RSS News messages
-                    if topic.endswith("rss_news"):
-                        success = processor.process_rss_message(cdc_message)
-                    else:
-                        logger.warning(f"Unhandled topic {topic}, skipping...")
-                        success = False
-
-                    # Track success/failure
-                    if success:
-                        processed_count += 1
-                        operation_stats[cdc_message.operationType] = operation_stats.get(cdc_message.operationType, 0) + 1
-                        logger.debug(f"Messages processed: {processed_count}")
-                    else:
-                        failed_count += 1
-                        logger.warning(
-                            f"Failed to process {cdc_message.operationType} for "
-                            f"{cdc_message.get_mongo_id()} from {topic}, total failures: {failed_count}"
-                        )
-                        time.sleep(config.retry_delay)
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Unexpected error processing message from {topic}: {e}", exc_info=True)
+            for batch in consumer.consume_batches(yield_idle=True):
+                if batch.next_offsets:
+                    submit(batch)
+                finished = pool.completed()
+                if not settle(finished):
+                    # Rewinding to a failed message needs everything read after it finished first
+                    rest = pool.drain()
+                    settle(rest)
+                    finished += rest
+                if not commit(finished):
+                    # The rewound messages are read again, so nothing stays held
+                    pool.release_all()
                     time.sleep(config.retry_delay)
 
-                # Log every 10 messages
-                if (processed_count + failed_count) % 10 == 0:
-                    logger.info(f"Progress: {processed_count} processed, {failed_count} failed")
-                    logger.info(f"Operations: {operation_stats}")
-
         except Exception as e:
             logger.error(f"Error in consumer loop: {e}", exc_info=True)
             logger.info("Restarting message loop after 5s...")
             time.sleep(5)
+            # Re-read whatever was polled but not committed
+            pool.drain()
+            pool.release_all()
+            consumer.rewind_uncommitted()
+
+
+def process_batch(batch: List[Tuple[str, KafkaMessage]], processor: MessageProcessor) -> List[Optional[str]]:
+    """
+    Route a micro-batch to the processor per topic.
+
+    Returns:
+        Failure reason per message in batch order (None once written)
+    """
+    results: List[Optional[str]] = [None] * len(batch)
+    rss_positions = []
+    for position, (topic, _) in enumerate(batch):
+        # Process RSS News messages
+        if topic.endswith("rss_news"):
+            rss_positions.append(position)
+        else:
+            logger.warning(f"Unhandled topic {topic}, skipping...")
+            results[position] = f"unhandled topic {topic}"
+
+    if rss_positions:
+        try:
+            rss_results = processor.process_rss_batch([batch[position][1] for position in rss_positions])
+            for position, error in zip(rss_positions, rss_results):
+                results[position] = error
+        except Exception as e:
+            logger.error(f"Unexpected error processing batch of {len(rss_positions)} RSS messages: {e}", exc_info=True)
+            for position in rss_positions:
+                results[position] = f"unexpected error: {e}"
+    return results
 
 
 if __name__ == "__main__":
@@ -97,15 +255,4 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Fatal error in service: {e}", exc_info=True)
     finally:
-        try:
-            logger.info("Cleaning up resources...")
-            try:
-                MultiKafkaConsumer().close()
-            except Exception:
-                pass
-            try:
-                MessageProcessor().close()
-            except Exception:
-                pass
-        finally:
-            logger.info("Service stopped")
+        logger.info("Service stopped")
@@ -0,0 +1,109 @@
+"""
+Inspect and replay dead-lettered CDC messages
+Reads `<topic>.dlq` with its own consumer group, prints each record's failure
+reason and, unless --list is given, republishes it for the consumer to write
+again: to the first retry tier (default, due immediately, with a fresh retry
+budget) or straight back onto the source topic. The replay group's offsets
+are committed once the republished records are acknowledged, so each dead
+letter is replayed once; --list and --mongo-id runs leave them untouched.
+
+Usage:
+    python replay_dlq.py [--topic research_db.research_db.rss_news] [--list]
+        [--mongo-id ID] [--limit 100] [--from-beginning] [--target retry|source]
+"""
+import argparse
+import time
+from kafka import KafkaConsumer, KafkaProducer
+from config import config
+from Scripts.retry_topics import (
+    ATTEMPT_HEADER, ERROR_HEADER, FAILED_AT_HEADER, ORIGINAL_TOPIC_HEADER, RETRY_AT_HEADER,
+    dlq_topic, record_headers, retry_topic
+)
+
+
+def replay_headers(source_topic: str) -> list:
+    """Headers of a first-tier retry record that is due now."""
+    return [
+        (ORIGINAL_TOPIC_HEADER, source_topic.encode("utf-8")),
+        (ATTEMPT_HEADER, b"1"),
+        (RETRY_AT_HEADER, str(time.time()).encode("utf-8")),
+        (ERROR_HEADER, b"replayed from dead-letter topic"),
+    ]
+
+
+def run_replay(topic: str, list_only: bool, mongo_id: str, limit: int, from_beginning: bool, target: str):
+    dead_letters = dlq_topic(topic)
+    print("\n" + "="*70)
+    print(f"{'LISTING' if list_only else 'REPLAYING'} DEAD-LETTERED MESSAGES ({dead_letters})")
+    print("="*70 + "\n")
+
+    consumer = KafkaConsumer(
+        dead_letters,
+        bootstrap_servers=[config.kafka_broker],
+        group_id=f"{config.kafka_group_id}-dlq-replay",
+        auto_offset_reset="earliest",
+        enable_auto_commit=False,
+        consumer_timeout_ms=5000,
+    )
+    producer = None if list_only else KafkaProducer(bootstrap_servers=[config.kafka_broker], acks="all")
+    destination = retry_topic(topic, 1) if target == "retry" else topic
+
+    seen = replayed = 0
+    try:
+        if from_beginning:
+            consumer.poll(timeout_ms=1000)
+            consumer.seek_to_beginning()
+
+        for record in consumer:
+            seen += 1
+            headers = record_headers(record)
+            record_id = record.key.decode("utf-8") if record.key else "?"
+            failed_at = float(headers.get(FAILED_AT_HEADER, "0"))
+            print(f" [{record.partition}:{record.offset}] {record_id} "
+                  f"after {int(headers.get(ATTEMPT_HEADER, '1')) - 1} retries, "
+                  f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(failed_at))}")
+            print(f"    {headers.get(ERROR_HEADER, 'no reason recorded')}")
+
+            if producer is not None and (mongo_id is None or record_id == mongo_id):
+                producer.send(
+                    destination, key=record.key, value=record.value,
+                    headers=replay_headers(topic) if target == "retry" else None
+                )
+                replayed += 1
+            if limit and seen >= limit:
+                break
+
+        if producer is not None:
+            producer.flush(timeout=30)
+            # Only once the replayed records are stored; a filtered run leaves the others for later
+            if mongo_id is None:
+                consumer.commit()
+            print(f"\n Replayed {replayed} of {seen} messages to {destination}")
+        else:
+            print(f"\n {seen} dead-lettered messages (nothing replayed, offsets not committed)")
+
+    except Exception as e:
+        print(f"\n ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        consumer.close()
+        if producer is not None:
+            producer.close()
+
+    print("\n" + "="*70 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect and replay dead-lettered CDC messages")
+    parser.add_argument("--topic", default=config.kafka_topics.split(",")[0].strip(), help="Source CDC topic")
+    parser.add_argument("--list", action="store_true", help="Only print the dead-lettered messages")
+    parser.add_argument("--mongo-id", help="Only replay messages for this document")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many records (0 = all)")
+    parser.add_argument("--from-beginning", action="store_true",
+                        help="Start from the oldest dead letter, including ones already replayed")
+    parser.add_argument("--target", choices=["retry", "source"], default="retry",
+                        help="Republish to the first retry tier or the source topic")
+    args = parser.parse_args()
+
+    run_replay(args.topic, args.list, args.mongo_id, args.limit, args.from_beginning, args.target)
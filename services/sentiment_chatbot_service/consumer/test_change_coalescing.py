@@ -0,0 +1,155 @@
+"""
+Test change coalescing and vector reuse in the CDC consumer
+Runs MessageProcessor against LocalCollection, an in-memory stand-in for the
+Weaviate collection calls the consumer makes, which counts how often it has
+to vectorize an object. Checks that several changes to one article in a
+batch become one write of its final state, and that updates leaving the
+vectorized text alone keep the stored vectors.
+
+Usage:
+    python test_change_coalescing.py
+"""
+import hashlib
+from contextlib import contextmanager
+from types import SimpleNamespace
+from config import config
+from Scripts.message_processor import MessageProcessor
+from Scripts.models import KafkaMessage
+
+
+class LocalCollection:
+    """In-memory stand-in for a Weaviate collection; objects added without a vector are 'vectorized'."""
+
+    def __init__(self, vectorized_fields):
+        self.vectorized_fields = vectorized_fields
+        self.objects = {}
+        self.vectorized = 0
+        self.batches = []
+        self.query = SimpleNamespace(fetch_objects=self.fetch_objects)
+        self.data = SimpleNamespace(delete_many=self.delete_many)
+        self.batch = SimpleNamespace(fixed_size=self.fixed_size, failed_objects=[])
+
+    def fetch_objects(self, filters=None, limit=None, return_properties=None, include_vector=False):
+        # Filters are ignored: the client matches the results to its request itself
+        return SimpleNamespace(objects=[
+            SimpleNamespace(uuid=uuid, properties=dict(props), vector={"default": vector} if include_vector else {})
+            for uuid, (props, vector) in self.objects.items()
+        ])
+
+    def delete_many(self, where=None, verbose=False):
+        doomed = [uuid for uuid, (props, _) in self.objects.items() if props["mongoId"] in where.value]
+        for uuid in doomed:
+            del self.objects[uuid]
+        return SimpleNamespace(failed=0, successful=len(doomed), objects=[])
+
+    @contextmanager
+    def fixed_size(self, batch_size=None, concurrent_requests=None):
+        added = []
+        yield SimpleNamespace(add_object=lambda properties, uuid, vector=None: added.append((properties, uuid, vector)))
+        self.batches.append(len(added))
+        for properties, uuid, vector in added:
+            if vector is None:
+                self.vectorized += 1
+                text = "|".join(str(properties.get(field)) for field in self.vectorized_fields)
+                vector = [b / 255 for b in hashlib.sha256(text.encode("utf-8")).digest()[:8]]
+            self.objects[str(uuid)] = (properties, vector)
+
+
+def make_processor():
+    processor = MessageProcessor()
+    client = processor.weaviate_client
+    articles = LocalCollection(["title", "clean_text"])
+    passages = LocalCollection(["title", "text"])
+    client.collections = {"RSSNews": articles, config.passage_collection: passages}
+    client.vectorized_fields = {"RSSNews": ["title", "clean_text"]}
+    return processor, articles, passages
+
+
+def change(operation: str, mongo_id: str, **fields) -> KafkaMessage:
+    document = {"_id": mongo_id, "title": f"Title {mongo_id}", "link": "", "content": "", "clean_text": "Text " * 200}
+    document.update(fields)
+    return KafkaMessage(
+        operationType=operation,
+        documentKey={"_id": mongo_id},
+        fullDocument=None if operation == "delete" else document,
+    )
+
+
+def stored(collection: LocalCollection, mongo_id: str) -> dict:
+    [(props, vector)] = [entry for entry in collection.objects.values() if entry[0]["mongoId"] == mongo_id]
+    return {**props, "vector": vector}
+
+
+def test_changes_coalesce_to_final_state():
+    processor, articles, _ = make_processor()
+    results = processor.process_rss_batch([
+        change("insert", "a", sentiment="neutral"),
+        change("update", "a", sentiment="positive"),
+        change("insert", "b"),
+        change("update", "a", sentiment="negative", score=0.2),
+        change("insert", "c"),
+        change("delete", "c"),
+    ])
+
+    assert results == [None] * 6
+    assert articles.batches == [2], f"one batch with a and b expected, got {articles.batches}"
+    assert articles.vectorized == 2, "each article is embedded once, in its final state"
+    assert stored(articles, "a")["sentiment"] == "negative" and stored(articles, "a")["score"] == 0.2
+    assert not any(props["mongoId"] == "c" for props, _ in articles.objects.values())
+    print(f" coalescing: 6 changes -> {articles.batches[0]} upserts + 1 delete, {articles.vectorized} embeddings")
+
+
+def test_property_only_update_reuses_vectors():
+    processor, articles, passages = make_processor()
+    processor.process_rss_batch([change("insert", "a", sentiment="neutral")])
+    before = stored(articles, "a")
+    passage_count = len(passages.objects)
+    articles.vectorized = passages.vectorized = 0
+
+    results = processor.process_rss_batch([change("update", "a", sentiment="positive", score=0.9)])
+
+    after = stored(articles, "a")
+    assert results == [None]
+    assert articles.vectorized == 0 and passages.vectorized == 0, "no re-embedding for a sentiment rewrite"
+    assert after["vector"] == before["vector"] and after["text_hash"] == before["text_hash"]
+    assert after["sentiment"] == "positive" and after["score"] == 0.9
+    assert all(props["sentiment"] == "positive" for props, _ in passages.objects.values())
+    print(f" vector reuse: sentiment update kept the article vector and {passage_count} passage vectors")
+
+
+def test_text_change_is_revectorized():
+    processor, articles, passages = make_processor()
+    processor.process_rss_batch([change("insert", "a")])
+    before = stored(articles, "a")
+    articles.vectorized = passages.vectorized = 0
+
+    processor.process_rss_batch([change("update", "a", title="Corrected title")])
+
+    after = stored(articles, "a")
+    assert articles.vectorized == 1 and after["text_hash"] != before["text_hash"]
+    assert passages.vectorized == len(passages.objects), "passages embed the title too"
+    print(f" text change: article and {passages.vectorized} passages re-embedded")
+
+
+def test_unusable_final_state_fails_every_change():
+    processor, articles, _ = make_processor()
+    no_document = KafkaMessage(operationType="update", documentKey={"_id": "a"}, fullDocument=None)
+    results = processor.process_rss_batch([change("insert", "a"), no_document])
+
+    assert results == ["no document data"] * 2, results
+    assert articles.objects == {}, "an earlier state must not be written in place of the final one"
+    print(f" unusable final state: both changes failed ({results[0]})")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("TESTING CHANGE COALESCING AND VECTOR REUSE")
+    print("="*70 + "\n")
+
+    test_changes_coalesce_to_final_state()
+    test_property_only_update_reuses_vectors()
+    test_text_change_is_revectorized()
+    test_unusable_final_state_fails_every_change()
+
+    print("\n All coalescing tests passed")
+    print("\n" + "="*70 + "\n")
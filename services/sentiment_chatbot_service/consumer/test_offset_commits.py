@@ -0,0 +1,196 @@
+"""
+Test batch-aligned manual offset commits in MultiKafkaConsumer
+Runs the consumer against LocalKafka, an in-memory stand-in for a broker and
+consumer group (partitions, positions, commits, rebalances), and checks that
+offsets are only committed after the batch holding the messages was written.
+
+Usage:
+    python test_offset_commits.py
+"""
+import time
+from collections import namedtuple
+from kafka.errors import CommitFailedError
+from kafka.structs import TopicPartition
+from config import config
+from Scripts.kafka_consumer import MultiKafkaConsumer
+
+TOPIC = "research_db.research_db.rss_news"
+Record = namedtuple("Record", "topic partition offset key value")
+
+
+class Idle(Exception):
+    """Raised by LocalKafka once it has been polled empty for a while."""
+
+
+class LocalKafka:
+    """In-memory stand-in for the KafkaConsumer calls MultiKafkaConsumer makes."""
+
+    def __init__(self, partitions: dict, rebalance_at_poll: int = None, revoke: set = None):
+        self.log = {TopicPartition(TOPIC, p): values for p, values in partitions.items()}
+        self.positions = {tp: 0 for tp in self.log}
+        self.committed_offsets = {}
+        self.assigned = set(self.log)
+        self.listener = None
+        self.polls = 0
+        self.idle_polls = 0
+        self.rebalance_at_poll = rebalance_at_poll
+        self.revoke = revoke or set()
+
+    def subscribe(self, topics, listener=None):
+        self.listener = listener
+
+    def assignment(self):
+        return set(self.assigned)
+
+    def poll(self, timeout_ms=0, max_records=None):
+        self.polls += 1
+        if self.polls == self.rebalance_at_poll:
+            # Eager rebalance: everything is revoked, the kept partitions resume from their commits
+            self.listener.on_partitions_revoked(set(self.assigned))
+            self.assigned -= {TopicPartition(TOPIC, p) for p in self.revoke}
+            for tp in self.assigned:
+                self.positions[tp] = self.committed_offsets.get(tp, 0)
+            self.listener.on_partitions_assigned(set(self.assigned))
+
+        records, budget = {}, max_records or 500
+        for tp in sorted(self.assigned):
+            while budget and self.positions[tp] < len(self.log[tp]):
+                offset = self.positions[tp]
+                records.setdefault(tp, []).append(Record(tp.topic, tp.partition, offset, None, self.log[tp][offset]))
+                self.positions[tp] += 1
+                budget -= 1
+        if not records:
+            self.idle_polls += 1
+            if self.idle_polls > 40:
+                raise Idle()
+            time.sleep(0.005)
+        return records
+
+    def seek(self, tp, offset):
+        self.positions[tp] = offset
+
+    def seek_to_beginning(self, *partitions):
+        for tp in partitions:
+            self.positions[tp] = 0
+
+    def commit(self, offsets):
+        if any(tp not in self.assigned for tp in offsets):
+            raise CommitFailedError("partition no longer assigned")
+        for tp, meta in offsets.items():
+            self.committed_offsets[tp] = meta.offset
+
+    def committed(self, tp):
+        return self.committed_offsets.get(tp)
+
+    def close(self):
+        pass
+
+
+def insert(mongo_id: str) -> dict:
+    return {
+        "operationType": "insert",
+        "documentKey": {"_id": mongo_id},
+        "fullDocument": {"_id": mongo_id, "title": mongo_id, "link": "", "content": "", "clean_text": ""},
+    }
+
+
+def committed(stand_in: LocalKafka) -> dict:
+    return {tp.partition: offset for tp, offset in stand_in.committed_offsets.items()}
+
+
+def run(stand_in: LocalKafka, fail_once: set = frozenset(), batch_size: int = 10, max_wait_ms: int = 50):
+    """Consume like main.process_messages until the stand-in is idle; returns the handled batches' IDs."""
+    config.kafka_topics = TOPIC
+    config.kafka_manual_commit = True
+    config.batch_size = batch_size
+    config.batch_max_wait_ms = max_wait_ms
+
+    consumer = MultiKafkaConsumer()
+    consumer.connect(kafka_consumer=stand_in)
+    handled, failed = [], set()
+
+    def handler(batch):
+        ids = [message.get_mongo_id() for _, message in batch.messages]
+        handled.append((ids, committed(stand_in)))
+        results = []
+        for mongo_id in ids:
+            fail = mongo_id in fail_once and mongo_id not in failed
+            failed.update([mongo_id] if fail else [])
+            results.append(not fail)
+        return results
+
+    def flush_before_revoke(batch):
+        if batch.next_offsets:
+            consumer.commit_batch(batch, handler(batch))
+
+    consumer.revoke_handler = flush_before_revoke
+    try:
+        for batch in consumer.consume_batches():
+            consumer.commit_batch(batch, handler(batch))
+    except Idle:
+        pass
+    return handled
+
+
+def test_commit_after_batch():
+    stand_in = LocalKafka({0: [insert("a0"), insert("a1"), insert("a2")], 1: [insert("b0"), insert("b1")]})
+    handled = run(stand_in)
+
+    ids, committed_before = handled[0]
+    assert committed_before == {}, "offsets were committed before the batch was written"
+    assert sorted(ids) == ["a0", "a1", "a2", "b0", "b1"]
+    assert committed(stand_in) == {0: 3, 1: 2}
+    print(f" commit after batch: {len(handled)} batch, committed {committed(stand_in)}")
+
+
+def test_failed_message_is_redelivered():
+    stand_in = LocalKafka({0: [insert("a0"), insert("a1"), insert("a2")], 1: [insert("b0")]})
+    handled = run(stand_in, fail_once={"a1"})
+
+    assert len(handled) == 2, handled
+    first_ids, _ = handled[0]
+    second_ids, committed_between = handled[1]
+    assert committed_between == {0: 1, 1: 1}, "partition 0 must stop at the failed message"
+    assert second_ids == ["a1", "a2"], "the failed message and the ones after it are read again"
+    assert committed(stand_in) == {0: 3, 1: 1}
+    print(f" failed message: batches {first_ids} then {second_ids}, committed {committed(stand_in)}")
+
+
+def test_skipped_records_are_committed():
+    malformed = {"op": "u", "after": None}
+    stand_in = LocalKafka({0: [malformed, malformed]})
+    handled = run(stand_in)
+
+    assert handled == [], "skipped records never reach the handler"
+    assert committed(stand_in) == {0: 2}
+    print(f" skipped records: committed {committed(stand_in)} without a batch")
+
+
+def test_flush_before_revoke():
+    # The batch never fills and the wait is long, so only the rebalance can write it
+    stand_in = LocalKafka(
+        {0: [insert("a0"), insert("a1")], 1: [insert("b0"), insert("b1")]},
+        rebalance_at_poll=2, revoke={1}
+    )
+    handled = run(stand_in, batch_size=100, max_wait_ms=60_000)
+
+    assert len(handled) == 1, handled
+    ids, committed_before = handled[0]
+    assert committed_before == {} and sorted(ids) == ["a0", "a1", "b0", "b1"]
+    assert committed(stand_in) == {0: 2, 1: 2}, "revoked partition 1 must be committed before it moves"
+    assert stand_in.positions[TopicPartition(TOPIC, 0)] == 2, "kept partition resumes after the flushed batch"
+    print(f" flush before revoke: wrote {len(ids)} messages, committed {committed(stand_in)}")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("TESTING MANUAL OFFSET COMMITS (LOCAL KAFKA STAND-IN)")
+    print("="*70 + "\n")
+
+    test_commit_after_batch()
+    test_failed_message_is_redelivered()
+    test_skipped_records_are_committed()
+    test_flush_before_revoke()
+
+    print("\n All offset commit tests passed")
+    print("\n" + "="*70 + "\n")
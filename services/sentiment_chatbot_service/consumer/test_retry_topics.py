@@ -0,0 +1,171 @@
+"""
+Test non-blocking retry topics and the dead-letter queue
+Routes failed CDC messages through RetryRouter with LocalProducer, an
+in-memory stand-in for a Kafka producer, and checks tier selection, headers,
+dead-lettering, per-document ordering behind parked changes and that retry
+records parse back into the same CDC message.
+
+Usage:
+    python test_retry_topics.py
+"""
+import json
+import threading
+from collections import namedtuple
+from kafka.structs import TopicPartition
+from config import config
+from Scripts.kafka_consumer import MessageBatch, MultiKafkaConsumer
+from Scripts.models import KafkaMessage
+from Scripts.retry_topics import (
+    RetryRouter, FOLLOWS_FAILED_CHANGE, ERROR_HEADER, dlq_topic, record_headers, retry_metadata, retry_topic
+)
+from Scripts.worker_pool import KeyedWorkerPool
+
+TOPIC = "research_db.research_db.rss_news"
+Record = namedtuple("Record", "topic partition offset key value headers")
+
+
+class Sent:
+    def get(self, timeout=None):
+        return self
+
+
+class LocalProducer:
+    """In-memory stand-in for the KafkaProducer calls RetryRouter makes."""
+
+    def __init__(self):
+        self.topics = {}
+
+    def send(self, topic, key=None, value=None, headers=None):
+        log = self.topics.setdefault(topic, [])
+        log.append(Record(topic, 0, len(log), key, json.loads(value), headers))
+        return Sent()
+
+    def flush(self, timeout=None):
+        pass
+
+    def close(self):
+        pass
+
+
+def update(mongo_id: str, version: int) -> KafkaMessage:
+    return KafkaMessage(
+        operationType="update",
+        documentKey={"_id": mongo_id},
+        fullDocument={"_id": mongo_id, "version": version},
+    )
+
+
+def make_router() -> RetryRouter:
+    config.retry_delays = "10,60,600"
+    router = RetryRouter()
+    router.connect([TOPIC], producer=LocalProducer())
+    return router
+
+
+def test_failure_goes_to_next_tier():
+    router = make_router()
+    assert router.route([(TOPIC, update("a", 1), 0, "weaviate timeout")])
+
+    [parked] = router.producer.topics[retry_topic(TOPIC, 1)]
+    topic, attempt, retry_at = retry_metadata(parked)
+    assert (topic, attempt) == (TOPIC, 1)
+    assert record_headers(parked)[ERROR_HEADER] == "weaviate timeout"
+    assert retry_at - float(record_headers(parked)["x-failed-at"]) == 10
+    assert router.parked == {"a": [1, 1]}
+    print(f" next tier: parked on {parked.topic}, due in 10s")
+
+
+def test_dead_letter_after_last_tier():
+    router = make_router()
+    assert router.route([(TOPIC, update("a", 1), 3, "invalid document: title missing")])
+
+    [dead] = router.producer.topics[dlq_topic(TOPIC)]
+    headers = record_headers(dead)
+    assert headers[ERROR_HEADER] == "invalid document: title missing" and headers["x-attempt"] == "4"
+    assert router.parked == {} and router.stats["dead_lettered"] == 1
+    print(f" dead letter: {dead.topic} after 3 retries, reason '{headers[ERROR_HEADER]}'")
+
+
+def test_later_changes_queue_behind_parked_one():
+    router = make_router()
+    router.route([(TOPIC, update("a", 1), 1, "weaviate timeout")])  # a@v1 now on tier 2
+
+    assert not router.divert(TOPIC, update("b", 1), 0), "other documents are not held up"
+    assert router.divert(TOPIC, update("a", 2), 0), "a newer change must not overtake the parked one"
+    assert router.park_behind([(TOPIC, update("a", 2), 0)])
+
+    tier2 = router.producer.topics[retry_topic(TOPIC, 2)]
+    assert [r.value["fullDocument"]["version"] for r in tier2] == [1, 2]
+    assert record_headers(tier2[1])[ERROR_HEADER] == FOLLOWS_FAILED_CHANGE
+    assert retry_topic(TOPIC, 1) not in router.producer.topics, "a follower never lands on a lower tier"
+
+    # Both are read back from tier 2 and written: the document is released
+    assert not router.divert(TOPIC, update("a", 1), 2)
+    assert not router.release("a") and router.release("a")
+    assert not router.divert(TOPIC, update("a", 3), 0)
+    print(f" ordering: versions {[r.value['fullDocument']['version'] for r in tier2]} queued on tier 2, then released")
+
+
+def test_retry_record_parses_back():
+    router = make_router()
+    original = update("a", 7)
+    router.route([(TOPIC, original, 0, "weaviate timeout")])
+    [parked] = router.producer.topics[retry_topic(TOPIC, 1)]
+
+    parsed = MultiKafkaConsumer()._to_cdc_message(parked)
+    assert parsed.get_mongo_id() == "a" and parsed.fullDocument == original.fullDocument
+    assert parsed.operationType == original.operationType
+
+    batch = MessageBatch()
+    topic, attempt, _ = retry_metadata(parked)
+    batch.add(TopicPartition(parked.topic, 0), parked, parsed, topic, attempt)
+    assert batch.messages[0][0] == TOPIC and batch.attempts == [1], "retried messages keep their source topic"
+    print(" round trip: retry record parses into the original CDC message")
+
+
+def test_pool_holds_failed_document():
+    applied, lock = [], threading.Lock()
+
+    def handler(messages):
+        errors = []
+        with lock:
+            for _, message in messages:
+                failing = message.get_mongo_id() == "a" and message.fullDocument["version"] == 1
+                errors.append("weaviate timeout" if failing else None)
+                if not failing:
+                    applied.append((message.get_mongo_id(), message.fullDocument["version"]))
+        return errors
+
+    pool = KeyedWorkerPool([handler], max_in_flight=100)
+    for offset, message in enumerate([update("a", 1), update("b", 1), update("a", 2)]):
+        # One message per batch, so a@v2 reaches the worker after a@v1 failed
+        batch = MessageBatch()
+        batch.add(TopicPartition(TOPIC, 0), Record(TOPIC, 0, offset, None, None, None), message)
+        pool.submit(batch)
+    errors = [ticket.errors[0] for ticket in pool.drain()]
+    assert errors == ["weaviate timeout", None, FOLLOWS_FAILED_CHANGE], errors
+    assert applied == [("b", 1)], "a@v2 must not be written over the failed a@v1"
+
+    pool.release("a")
+    batch = MessageBatch()
+    batch.add(TopicPartition(TOPIC, 0), Record(TOPIC, 0, 3, None, None, None), update("a", 3))
+    pool.submit(batch)
+    pool.drain()
+    pool.close()
+    assert applied[-1] == ("a", 3)
+    print(f" worker hold: {errors[2]!r} until released")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("TESTING RETRY TOPICS AND DEAD-LETTER QUEUE")
+    print("="*70 + "\n")
+
+    test_failure_goes_to_next_tier()
+    test_dead_letter_after_last_tier()
+    test_later_changes_queue_behind_parked_one()
+    test_retry_record_parses_back()
+    test_pool_holds_failed_document()
+
+    print("\n All retry topic tests passed")
+    print("\n" + "="*70 + "\n")